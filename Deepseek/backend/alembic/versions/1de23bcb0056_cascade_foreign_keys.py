@@ -0,0 +1,59 @@
+"""Cascade foreign keys
+
+Revision ID: 1de23bcb0056
+Revises: 2ef5eb47df3f
+Create Date: 2026-10-18 09:12:41.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1de23bcb0056'
+down_revision: Union[str, None] = '2ef5eb47df3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (tabla, columna, tabla referenciada, ON DELETE)
+FOREIGN_KEYS = [
+    ("matches", "home_team_id", "teams", "CASCADE"),
+    ("matches", "away_team_id", "teams", "CASCADE"),
+    ("matches", "league_id", "leagues", "CASCADE"),
+    ("league_teams", "league_id", "leagues", "CASCADE"),
+    ("league_teams", "team_id", "teams", "CASCADE"),
+    ("calendar", "league_id", "leagues", "CASCADE"),
+    ("calendar", "match_id", "matches", "CASCADE"),
+    ("league_statistics", "league_id", "leagues", "CASCADE"),
+    ("league_statistics", "team_with_most_goals_id", "teams", "SET NULL"),
+    ("league_statistics", "team_with_best_defense_id", "teams", "SET NULL"),
+    ("leagues", "highest_value_team_id", "teams", "SET NULL"),
+    ("leagues", "lowest_value_team_id", "teams", "SET NULL"),
+    ("leagues", "winner_id", "teams", "SET NULL"),
+    ("leagues", "runner_up_id", "teams", "SET NULL"),
+    ("leagues", "third_place_id", "teams", "SET NULL"),
+]
+
+
+def _recreate_foreign_keys(with_ondelete: bool) -> None:
+    # Nombres por defecto de PostgreSQL para las tablas creadas con create_all
+    for table, column, referent, ondelete in FOREIGN_KEYS:
+        name = f"{table}_{column}_fkey"
+        op.drop_constraint(name, table, type_="foreignkey")
+        op.create_foreign_key(
+            name, table, referent, [column], ["id"],
+            ondelete=ondelete if with_ondelete else None
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _recreate_foreign_keys(with_ondelete=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_foreign_keys(with_ondelete=False)
@@ -0,0 +1,50 @@
+"""Composite and partial indexes
+
+Revision ID: 1df8040085ca
+Revises: 1de23bcb0056
+Create Date: 2026-10-18 11:36:05.918274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1df8040085ca'
+down_revision: Union[str, None] = '1de23bcb0056'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (nombre, tabla, columnas, opciones)
+INDEXES = [
+    ("ix_matches_league_jornada", "matches", ["league_id", "jornada"], {}),
+    ("ix_matches_home_team_id", "matches", ["home_team_id"], {}),
+    ("ix_matches_away_team_id", "matches", ["away_team_id"], {}),
+    ("ix_matches_league_played", "matches", ["league_id"], {
+        "postgresql_include": ["home_team_id", "away_team_id", "home_goals", "away_goals"],
+        "postgresql_where": sa.text("home_goals IS NOT NULL AND away_goals IS NOT NULL"),
+    }),
+    ("ix_league_teams_league_team", "league_teams", ["league_id", "team_id"], {}),
+    ("ix_calendar_league_jornada", "calendar", ["league_id", "jornada"], {}),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY no bloquea escrituras, pero no puede ir dentro de una transacción
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True, if_not_exists=True, **options
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
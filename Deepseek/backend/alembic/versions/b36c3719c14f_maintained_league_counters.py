@@ -0,0 +1,39 @@
+"""Maintained league counters
+
+Revision ID: b36c3719c14f
+Revises: bfeb2ef5b0b7
+Create Date: 2026-10-18 04:57:52.281330
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b36c3719c14f'
+down_revision: Union[str, None] = 'bfeb2ef5b0b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Contadores iniciales desde las filas reales de cada liga
+RECOUNT_SQL = """
+    UPDATE leagues SET
+        matches_count = (SELECT count(*) FROM matches WHERE matches.league_id = leagues.id),
+        teams_count = (SELECT count(*) FROM league_teams WHERE league_teams.league_id = leagues.id)
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(RECOUNT_SQL)
+    op.alter_column("leagues", "matches_count", server_default="0")
+    op.alter_column("leagues", "teams_count", server_default="0")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column("leagues", "teams_count", server_default=None)
+    op.alter_column("leagues", "matches_count", server_default=None)
@@ -0,0 +1,81 @@
+"""League standings read model
+
+Revision ID: bfeb2ef5b0b7
+Revises: 1df8040085ca
+Create Date: 2026-10-18 14:02:27.551390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bfeb2ef5b0b7'
+down_revision: Union[str, None] = '1df8040085ca'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Clasificación inicial desde los partidos jugados (perspectivas local y visitante)
+BACKFILL_SQL = """
+    INSERT INTO league_standings (
+        league_id, team_id, played, won, drawn, lost,
+        goals_for, goals_against, goal_difference, points
+    )
+    WITH played AS (
+        -- Solo partidos entre equipos inscritos en su liga, como la tabla en vivo
+        SELECT m.league_id, m.home_team_id, m.away_team_id, m.home_goals, m.away_goals
+        FROM matches m
+        WHERE m.league_id IS NOT NULL AND m.home_goals IS NOT NULL AND m.away_goals IS NOT NULL
+          AND EXISTS (SELECT 1 FROM league_teams lt WHERE lt.league_id = m.league_id AND lt.team_id = m.home_team_id)
+          AND EXISTS (SELECT 1 FROM league_teams lt WHERE lt.league_id = m.league_id AND lt.team_id = m.away_team_id)
+    )
+    SELECT
+        league_id, team_id, count(*),
+        sum(CASE WHEN goals_for > goals_against THEN 1 ELSE 0 END),
+        sum(CASE WHEN goals_for = goals_against THEN 1 ELSE 0 END),
+        sum(CASE WHEN goals_for < goals_against THEN 1 ELSE 0 END),
+        sum(goals_for), sum(goals_against), sum(goals_for - goals_against),
+        3 * sum(CASE WHEN goals_for > goals_against THEN 1 ELSE 0 END)
+            + sum(CASE WHEN goals_for = goals_against THEN 1 ELSE 0 END)
+    FROM (
+        SELECT league_id, home_team_id AS team_id, home_goals AS goals_for, away_goals AS goals_against
+        FROM played
+        UNION ALL
+        SELECT league_id, away_team_id, away_goals, home_goals
+        FROM played
+    ) sides
+    GROUP BY league_id, team_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    counter = lambda name: sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+    op.create_table(
+        "league_standings",
+        sa.Column("league_id", sa.Integer(), sa.ForeignKey("leagues.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("team_id", sa.Integer(), sa.ForeignKey("teams.id", ondelete="CASCADE"), primary_key=True),
+        counter("played"),
+        counter("won"),
+        counter("drawn"),
+        counter("lost"),
+        counter("goals_for"),
+        counter("goals_against"),
+        counter("goal_difference"),
+        counter("points"),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=True),
+    )
+    op.create_index(
+        "ix_league_standings_ranking", "league_standings",
+        ["league_id", "points", "goal_difference", "goals_for"]
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_league_standings_ranking", table_name="league_standings")
+    op.drop_table("league_standings")
@@ -1,2 +1,2 @@
 # Archivo: crud/__init__.py
-__all__ = ['teams', 'leagues', 'matches', 'calendar', 'statistics']
\ No newline at end of file
+__all__ = ['teams', 'leagues', 'matches', 'calendar', 'statistics', 'standings', 'counters', 'tactics']
\ No newline at end of file
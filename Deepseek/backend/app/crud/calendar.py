@@ -1,7 +1,7 @@
 # backend/app/crud/calendar.py
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, func, insert, select, update
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
 import calendar
@@ -9,6 +9,7 @@ import calendar
 from ..schemas.calendar import Calendar
 from ..schemas.matches import Match
 from ..schemas.leagues import League
+from ..schemas.teams import Team
 from ..models.calendar import CalendarEntryCreate, CalendarEntryUpdate
 from ..utils.calendar_scraper import CalendarScraper
 from . import leagues, matches, teams
@@ -88,76 +89,77 @@ def generate_league_calendar(
         match_days: Lista de días de la semana para jugar partidos (0=lunes, 6=domingo)
     
     Returns:
-        Lista de entradas de calendario creadas
+        Lista de entradas de calendario creadas (id, match_id, jornada), o
+        None si la liga no existe o no tiene partidos
     """
     # Verificar que la liga existe
     league = db.query(League).filter(League.id == league_id).first()
     if not league:
         return None
     
-    # Obtener partidos de la liga
-    league_matches = db.query(Match).filter(Match.league_id == league_id).all()
-    if not league_matches:
-        return None
+    # Numerar los partidos de la liga: posición de su jornada y turno dentro de ella.
+    # La numeración se calcula sobre todos los partidos antes del anti-join,
+    # de modo que regenerar un calendario incompleto asigna las mismas fechas y horas.
+    ranked = db.query(
+        Match.id.label("match_id"),
+        Match.jornada.label("jornada"),
+        (func.dense_rank().over(order_by=Match.jornada) - 1).label("jornada_index"),
+        (func.row_number().over(partition_by=Match.jornada, order_by=Match.id) - 1).label("slot")
+    ).filter(Match.league_id == league_id).subquery()
     
-    # Crear calendario para cada partido, agrupados por jornada
-    matches_by_jornada = {}
-    for match in league_matches:
-        if match.jornada not in matches_by_jornada:
-            matches_by_jornada[match.jornada] = []
-        matches_by_jornada[match.jornada].append(match)
+    # Anti-join: partidos que aún no tienen entrada en el calendario
+    pending = db.query(ranked).outerjoin(
+        Calendar, Calendar.match_id == ranked.c.match_id
+    ).filter(Calendar.id == None).order_by(ranked.c.jornada, ranked.c.slot).all()
     
-    # Ordenar jornadas
-    sorted_jornadas = sorted(matches_by_jornada.keys())
+    if not pending:
+        if not db.query(Match.id).filter(Match.league_id == league_id).first():
+            return None
+        
+        # Todos los partidos ya tienen entrada
+        league.calendar_generated = True
+        db.commit()
+        return []
     
-    # Configuración para programación automática
-    current_date = start_date if start_date else datetime.now().date()
+    # Configuración para programación automática: la primera jornada se juega
+    # el primer día de partido a partir de la fecha de inicio y cada jornada
+    # siguiente una semana después
+    first_date = start_date if start_date else datetime.now().date()
     if match_days is None:
         match_days = [5, 6]  # Por defecto, sábado y domingo
+    if auto_schedule:
+        while first_date.weekday() not in match_days:
+            first_date += timedelta(days=1)
     
-    # Crear entradas de calendario
-    calendar_entries = []
+    entries = []
+    match_dates = []
     
-    for jornada in sorted_jornadas:
-        jornada_matches = matches_by_jornada[jornada]
-        
-        # Si es programación automática, calcular la fecha para esta jornada
+    for row in pending:
         jornada_date = None
+        scheduled_time = None
         if auto_schedule:
-            # Buscar el próximo día de partido después de la fecha actual
-            while current_date.weekday() not in match_days:
-                current_date += timedelta(days=1)
-            
-            # Esta jornada será en esta fecha
-            jornada_date = current_date
-            
-            # Avanzar a la siguiente semana para la siguiente jornada
-            current_date += timedelta(days=7)
+            jornada_date = datetime.combine(first_date + timedelta(days=7 * row.jornada_index), datetime.min.time())
+            # Distribuir entre 12:00, 14:00, 16:00, 18:00
+            scheduled_time = f"{12 + (row.slot % 4) * 2}:00"
+            match_dates.append({"id": row.match_id, "date": jornada_date, "time": scheduled_time})
         
-        # Distribuir los partidos de la jornada
-        for i, match in enumerate(jornada_matches):
-            # Verificar si ya existe una entrada para este partido
-            existing_entry = get_calendar_entry_by_match(db, match.id)
-            if existing_entry:
-                continue
-            
-            # Crear nueva entrada
-            entry = CalendarEntryCreate(
-                league_id=league_id,
-                jornada=jornada,
-                match_id=match.id,
-                scheduled_date=jornada_date if jornada_date else None,
-                scheduled_time=f"{12 + (i % 4) * 2}:00" if auto_schedule else None  # Distribuir entre 12:00, 14:00, 16:00, 18:00
-            )
-            
-            db_entry = create_calendar_entry(db, entry)
-            calendar_entries.append(db_entry)
-            
-            # Actualizar también la fecha en el partido
-            if jornada_date and auto_schedule:
-                match.date = datetime.combine(jornada_date, datetime.min.time())
-                match.time = entry.scheduled_time
-                db.commit()
+        entries.append({
+            "league_id": league_id,
+            "jornada": row.jornada,
+            "match_id": row.match_id,
+            "scheduled_date": jornada_date,
+            "scheduled_time": scheduled_time,
+            "is_played": False
+        })
+    
+    # Insertar todas las entradas y actualizar las fechas de los partidos en una transacción
+    calendar_entries = db.execute(
+        insert(Calendar).returning(Calendar.id, Calendar.match_id, Calendar.jornada),
+        entries
+    ).all()
+    
+    if match_dates:
+        db.execute(update(Match), match_dates)
     
     # Marcar la liga como con calendario generado
     league.calendar_generated = True
@@ -296,34 +298,101 @@ def import_calendar_from_external_source(db: Session, league_id: int, external_u
         "errors": errors
     }
 
-def synchronize_calendar_with_matches(db: Session, league_id: int):
+def synchronize_calendar_with_matches(db: Session, league_id: Optional[int] = None) -> int:
     """
     Sincroniza el estado 'is_played' del calendario con los partidos jugados
+    
+    Se ejecuta como un único UPDATE ... FROM que marca como jugadas todas las
+    entradas cuyo partido ya tiene resultado.
+    
+    Args:
+        db: Sesión de base de datos
+        league_id: ID de la liga; si es None se procesan todas las ligas activas
+    
+    Returns:
+        Número de entradas actualizadas
     """
-    # Obtener todos los partidos jugados (con resultados)
-    played_matches = db.query(Match).filter(
-        Match.league_id == league_id,
+    stmt = update(Calendar).where(
+        Calendar.match_id == Match.id,
         Match.home_goals.isnot(None),
-        Match.away_goals.isnot(None)
-    ).all()
+        Match.away_goals.isnot(None),
+        Calendar.is_played.isnot(True)
+    )
     
-    # Actualizar el estado de las entradas del calendario
-    for match in played_matches:
-        calendar_entry = get_calendar_entry_by_match(db, match.id)
-        if calendar_entry and not calendar_entry.is_played:
-            calendar_entry.is_played = True
-            db.commit()
+    if league_id is not None:
+        stmt = stmt.where(Match.league_id == league_id)
+    else:
+        stmt = stmt.where(Match.league_id == League.id, League.active == True)
     
-    return True
+    result = db.execute(
+        stmt.values(is_played=True, updated_at=datetime.now()),
+        execution_options={"synchronize_session": False}
+    )
+    db.commit()
+    
+    return result.rowcount
 
-def get_calendar_with_match_details(db: Session, league_id: int, jornada: Optional[int] = None):
+def get_calendar_with_match_details(
+    db: Session,
+    league_id: int,
+    jornada: Optional[int] = None,
+    jornada_from: Optional[int] = None,
+    jornada_to: Optional[int] = None
+):
     """
     Obtiene el calendario de una liga con detalles de los partidos
+    
+    Una sola consulta: la liga unida (LEFT JOIN) a sus entradas de calendario,
+    a sus partidos y a los equipos local y visitante, ya ordenada por jornada,
+    fecha y hora. Las filas se agrupan por jornada a medida que llegan.
+    
+    Args:
+        jornada: Solo esta jornada (equivale a jornada_from = jornada_to)
+        jornada_from: Primera jornada a incluir (ventana para carga perezosa)
+        jornada_to: Última jornada a incluir
+    
+    Returns:
+        Diccionario con la liga y las entradas agrupadas por jornada, o None
+        si la liga no existe
     """
-    calendar_entries = get_league_calendar(db, league_id, jornada)
+    if jornada:
+        jornada_from = jornada_to = jornada
+    
+    # La ventana de jornadas va en la condición del JOIN para conservar la
+    # fila de la liga aunque no haya entradas
+    in_window = [Calendar.league_id == League.id]
+    if jornada_from is not None:
+        in_window.append(Calendar.jornada >= jornada_from)
+    if jornada_to is not None:
+        in_window.append(Calendar.jornada <= jornada_to)
     
-    result = []
-    for entry in calendar_entries:
+    home_team = aliased(Team)
+    away_team = aliased(Team)
+    query = (
+        select(League.name, League.jornadas, Calendar, Match, home_team, away_team)
+        .outerjoin(Calendar, and_(*in_window))
+        .outerjoin(Match, Match.id == Calendar.match_id)
+        .outerjoin(home_team, home_team.id == Match.home_team_id)
+        .outerjoin(away_team, away_team.id == Match.away_team_id)
+        .where(League.id == league_id)
+        .order_by(
+            Calendar.jornada,
+            Calendar.scheduled_date.asc().nulls_last(),
+            Calendar.scheduled_time.asc().nulls_last(),
+            Calendar.id
+        )
+        .execution_options(yield_per=500)
+    )
+    
+    league_name = None
+    total_jornadas = None
+    grouped_result = {}
+    found = False
+    for league_name, total_jornadas, entry, match, home, away in db.execute(query):
+        found = True
+        if entry is None:
+            continue
+        
         entry_dict = {
             "id": entry.id,
             "league_id": entry.league_id,
@@ -338,59 +407,43 @@ def get_calendar_with_match_details(db: Session, league_id: int, jornada: Option
             "match": None
         }
         
-        # Obtener detalles del partido si existe
-        if entry.match_id:
-            match = db.query(Match).options(
-                joinedload(Match.home_team),
-                joinedload(Match.away_team)
-            ).filter(Match.id == entry.match_id).first()
-            
-            if match:
-                entry_dict["match"] = {
-                    "id": match.id,
-                    "jornada": match.jornada,
-                    "home_team": {
-                        "id": match.home_team.id,
-                        "name": match.home_team.name,
-                        "manager": match.home_team.manager
-                    },
-                    "away_team": {
-                        "id": match.away_team.id,
-                        "name": match.away_team.name,
-                        "manager": match.away_team.manager
-                    },
-                    "home_formation": match.home_formation,
-                    "away_formation": match.away_formation,
-                    "home_style": match.home_style,
-                    "away_style": match.away_style,
-                    "home_goals": match.home_goals,
-                    "away_goals": match.away_goals,
-                    "date": match.date,
-                    "time": match.time
-                }
+        # Detalles del partido si existe
+        if match is not None:
+            entry_dict["match"] = {
+                "id": match.id,
+                "jornada": match.jornada,
+                "home_team": {
+                    "id": home.id,
+                    "name": home.name,
+                    "manager": home.manager
+                } if home else None,
+                "away_team": {
+                    "id": away.id,
+                    "name": away.name,
+                    "manager": away.manager
+                } if away else None,
+                "home_formation": match.home_formation,
+                "away_formation": match.away_formation,
+                "home_style": match.home_style,
+                "away_style": match.away_style,
+                "home_goals": match.home_goals,
+                "away_goals": match.away_goals,
+                "date": match.date,
+                "time": match.time
+            }
         
-        result.append(entry_dict)
+        # Las filas llegan ordenadas: basta con ir agrupando por jornada
+        grouped_result.setdefault(entry.jornada, []).append(entry_dict)
     
-    # Agrupar por jornadas
-    grouped_result = {}
-    for entry in result:
-        jornada = entry["jornada"]
-        if jornada not in grouped_result:
-            grouped_result[jornada] = []
-        grouped_result[jornada].append(entry)
-    
-    # Ordenar por fecha dentro de cada jornada
-    for jornada in grouped_result:
-        grouped_result[jornada].sort(
-            key=lambda x: (
-                x["scheduled_date"] or date.max,
-                x["scheduled_time"] or "99:99"
-            )
-        )
+    if not found:
+        return None
     
     return {
         "league_id": league_id,
-        "league_name": db.query(League).filter(League.id == league_id).first().name,
+        "league_name": league_name,
+        "total_jornadas": total_jornadas,
+        "jornada_from": jornada_from,
+        "jornada_to": jornada_to,
         "jornadas": len(grouped_result),
         "entries_by_jornada": grouped_result
     }
\ No newline at end of file
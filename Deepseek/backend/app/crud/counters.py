@@ -0,0 +1,132 @@
+# app/crud/counters.py
+
+from collections import Counter
+from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, or_, select, update
+from typing import List, Dict, Any, Optional, Iterable
+
+from ..schemas.leagues import League, LeagueTeam
+from ..schemas.matches import Match
+
+def count_by_league(league_ids: Iterable[Optional[int]], sign: int = 1) -> Counter:
+    """Cuenta cuántas filas aporta cada liga (se omiten las filas sin liga)"""
+    counts = Counter()
+    for league_id in league_ids:
+        if league_id is not None:
+            counts[league_id] += sign
+    return counts
+
+def adjust_league_counters(
+    db: Session,
+    matches: Optional[Dict[int, int]] = None,
+    teams: Optional[Dict[int, int]] = None
+) -> int:
+    """
+    Suma incrementos a matches_count y teams_count de las ligas indicadas
+
+    Un único UPDATE ... SET col = col + :delta ejecutado por lotes. No hace
+    commit: se llama dentro de la transacción que inserta o borra las filas.
+
+    Args:
+        db: Sesión de base de datos
+        matches: Incremento de partidos por ID de liga
+        teams: Incremento de equipos inscritos por ID de liga
+
+    Returns:
+        Número de ligas modificadas
+    """
+    matches = matches or {}
+    teams = teams or {}
+    rows = [
+        {"b_id": league_id, "b_matches": matches.get(league_id, 0), "b_teams": teams.get(league_id, 0)}
+        for league_id in set(matches) | set(teams)
+        if matches.get(league_id, 0) or teams.get(league_id, 0)
+    ]
+    if rows:
+        table = League.__table__
+        db.execute(
+            update(table).where(table.c.id == bindparam("b_id")).values(
+                matches_count=func.coalesce(table.c.matches_count, 0) + bindparam("b_matches"),
+                teams_count=func.coalesce(table.c.teams_count, 0) + bindparam("b_teams")
+            ),
+            rows
+        )
+    return len(rows)
+
+def actual_league_counts(league_ids: Optional[List[int]] = None):
+    """
+    SELECT de los conteos reales de cada liga con subconsultas agrupadas
+
+    Args:
+        league_ids: Limitar el conteo a estas ligas (por defecto todas)
+
+    Returns:
+        Subconsulta con id, matches y teams (ceros si no hay filas)
+    """
+    matches = select(Match.league_id, func.count().label("n"))
+    teams = select(LeagueTeam.league_id, func.count().label("n"))
+    leagues = select(League.id)
+    if league_ids is not None:
+        matches = matches.where(Match.league_id.in_(league_ids))
+        teams = teams.where(LeagueTeam.league_id.in_(league_ids))
+        leagues = leagues.where(League.id.in_(league_ids))
+
+    matches = matches.group_by(Match.league_id).subquery("match_counts")
+    teams = teams.group_by(LeagueTeam.league_id).subquery("team_counts")
+
+    return leagues.add_columns(
+        func.coalesce(matches.c.n, 0).label("matches"),
+        func.coalesce(teams.c.n, 0).label("teams")
+    ).outerjoin(matches, matches.c.league_id == League.id).outerjoin(teams, teams.c.league_id == League.id).subquery("actual")
+
+def verify_league_counters(db: Session, league_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+    """
+    Compara los contadores guardados con los conteos reales
+
+    Returns:
+        Ligas cuyos contadores no coinciden, con los valores guardados y reales
+    """
+    actual = actual_league_counts(league_ids)
+    query = select(
+        League.id, League.matches_count, League.teams_count, actual.c.matches, actual.c.teams
+    ).join(actual, actual.c.id == League.id).where(
+        or_(
+            func.coalesce(League.matches_count, -1) != actual.c.matches,
+            func.coalesce(League.teams_count, -1) != actual.c.teams
+        )
+    )
+
+    return [
+        {
+            "league_id": row.id,
+            "matches_count": row.matches_count,
+            "actual_matches": row.matches,
+            "teams_count": row.teams_count,
+            "actual_teams": row.teams
+        }
+        for row in db.execute(query)
+    ]
+
+def recount_league_counters(db: Session, league_id: Optional[int] = None) -> int:
+    """
+    Corrige los contadores que no coinciden con los conteos reales (reparación)
+
+    Args:
+        db: Sesión de base de datos
+        league_id: ID de la liga; si es None se revisan todas
+
+    Returns:
+        Número de ligas corregidas
+    """
+    actual = actual_league_counts([league_id] if league_id is not None else None)
+    stmt = update(League).where(
+        League.id == actual.c.id,
+        or_(
+            func.coalesce(League.matches_count, -1) != actual.c.matches,
+            func.coalesce(League.teams_count, -1) != actual.c.teams
+        )
+    ).values(matches_count=actual.c.matches, teams_count=actual.c.teams)
+
+    corrected = db.execute(stmt, execution_options={"synchronize_session": False}).rowcount
+    db.commit()
+    return corrected
@@ -1,35 +1,35 @@
 # app/crud/leagues.py
 
-from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+import numpy as np
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import delete, desc, or_, insert
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 # Importaciones correctas
 from ..schemas.leagues import League, LeagueTeam
 from ..schemas.statistics import LeagueStatistics
+from ..schemas.standings import LeagueStanding
 from ..schemas.teams import Team
 from ..schemas.matches import Match
-from ..schemas.calendar import Calendar
 from ..models.leagues import LeagueCreate, LeagueUpdate, LeagueTeamCreate, TipoLiga
-from ..services.simulation import TournamentSimulator
+from ..services.simulation import TournamentSimulator, MatchSimulator, value_strengths
+from ..services.strength import PoissonStrengthModel, strength_model_cache
+from . import standings as standings_crud
+from . import counters as counters_crud
 
 def get_league(db: Session, league_id: int):
-    """Obtiene una liga por su ID"""
-    db_league = db.query(League).filter(League.id == league_id).first()
-    
-    if db_league:
-        # Calcular conteo de partidos
-        db_league.matches_count = db.query(func.count(Match.id)).filter(
-            Match.league_id == league_id
-        ).scalar() or 0
-        
-        # Calcular conteo de equipos
-        db_league.teams_count = db.query(func.count(LeagueTeam.id)).filter(
-            LeagueTeam.league_id == league_id
-        ).scalar() or 0
+    """
+    Obtiene una liga por su ID
     
-    return db_league
+    matches_count y teams_count se mantienen al insertar o borrar partidos y
+    equipos (ver crud.counters), por lo que no se recalculan al leer.
+    """
+    return db.query(League).filter(League.id == league_id).first()
+
+def league_exists(db: Session, league_id: int) -> bool:
+    """Comprueba si existe una liga sin cargarla ni recalcular sus conteos"""
+    return db.query(League.id).filter(League.id == league_id).first() is not None
 
 def get_leagues(
     db: Session, 
@@ -47,21 +47,8 @@ def get_leagues(
     if manager_id is not None:
         query = query.filter(League.manager_id == manager_id)
     
-    leagues = query.offset(skip).limit(limit).all()
-    
-    # Calcular conteos para cada liga
-    for league in leagues:
-        # Conteo de partidos
-        league.matches_count = db.query(func.count(Match.id)).filter(
-            Match.league_id == league.id
-        ).scalar() or 0
-        
-        # Conteo de equipos
-        league.teams_count = db.query(func.count(LeagueTeam.id)).filter(
-            LeagueTeam.league_id == league.id
-        ).scalar() or 0
-    
-    return leagues
+    # Los contadores son columnas mantenidas: el listado es una sola consulta
+    return query.offset(skip).limit(limit).all()
 
 def get_manager_leagues(db: Session, manager_id: str, active_only: bool = False):
     """Obtiene todas las ligas creadas por un manager específico"""
@@ -108,20 +95,13 @@ def update_league(db: Session, league_id: int, league_data: LeagueUpdate):
     return db_league
 
 def delete_league(db: Session, league_id: int):
-    """Elimina una liga y todos sus registros relacionados"""
-    # Primero eliminar las entradas del calendario asociadas a la liga
-    db.query(Calendar).filter(Calendar.league_id == league_id).delete()
-    
-    # Eliminar los equipos asociados a la liga
-    db.query(LeagueTeam).filter(LeagueTeam.league_id == league_id).delete()
-    
-    # Eliminar los partidos de la liga
-    db.query(Match).filter(Match.league_id == league_id).delete()
-    
-    # Eliminar las estadísticas de la liga
-    db.query(LeagueStatistics).filter(LeagueStatistics.league_id == league_id).delete()
+    """
+    Elimina una liga y todos sus registros relacionados
     
-    # Por último, eliminar la liga
+    Partidos, calendario, equipos inscritos y estadísticas se borran con las
+    claves foráneas ON DELETE CASCADE. Para ligas muy grandes usar el borrado
+    por lotes de services.purge.
+    """
     result = db.query(League).filter(League.id == league_id).delete()
     
     db.commit()
@@ -138,13 +118,13 @@ def add_team_to_league(db: Session, league_team: LeagueTeamCreate):
     if existing:
         return existing
     
-    # Verificar si hay espacio para más equipos
-    league = get_league(db, league_team.league_id)
-    teams_count = db.query(func.count(LeagueTeam.id)).filter(
-        LeagueTeam.league_id == league_team.league_id
-    ).scalar()
+    # Verificar si hay espacio para más equipos (fila bloqueada hasta el commit
+    # para que dos altas simultáneas no superen el máximo)
+    league = db.query(League).filter(League.id == league_team.league_id).with_for_update().first()
+    if not league:
+        return None
     
-    if teams_count >= league.max_teams:
+    if (league.teams_count or 0) >= league.max_teams:
         return None  # La liga está llena
     
     db_league_team = LeagueTeam(
@@ -154,6 +134,12 @@ def add_team_to_league(db: Session, league_team: LeagueTeamCreate):
     )
     
     db.add(db_league_team)
+    db.flush()
+    # Sus partidos ya jugados contra equipos inscritos pasan a contar en la tabla
+    standings_crud.apply_result_changes(
+        db, added=standings_crud.member_team_results(db, league_team.league_id, league_team.team_id)
+    )
+    counters_crud.adjust_league_counters(db, teams={league_team.league_id: 1})
     db.commit()
     db.refresh(db_league_team)
     return db_league_team
@@ -174,7 +160,16 @@ def remove_team_from_league(db: Session, league_id: int, team_id: int):
     if not db_league_team:
         return False
     
+    # Sus partidos dejan de contar en la clasificación persistida (también
+    # para los rivales), como en la tabla calculada desde los inscritos
+    standings_crud.apply_result_changes(
+        db, removed=standings_crud.member_team_results(db, league_id, team_id)
+    )
+    db.execute(
+        delete(LeagueStanding).where(LeagueStanding.league_id == league_id, LeagueStanding.team_id == team_id)
+    )
     db.delete(db_league_team)
+    counters_crud.adjust_league_counters(db, teams={league_id: -1})
     db.commit()
     return True
 
@@ -191,7 +186,12 @@ def simulate_league(db: Session, league_id: int, simulator: TournamentSimulator)
     """
     Simula una liga completa, generando partidos automáticamente
     
-    Solo permitido para ligas de tipo 'Liga Tactica'
+    Solo permitido para ligas de tipo 'Liga Tactica'. Todos los partidos se
+    insertan en una sola transacción con INSERT ... RETURNING multi-fila.
+    
+    Returns:
+        Filas ligeras (id, jornada, home_team_id, away_team_id, home_goals,
+        away_goals) de los partidos creados, o None si no se puede simular
     """
     if not can_simulate(db, league_id):
         return None
@@ -203,29 +203,25 @@ def simulate_league(db: Session, league_id: int, simulator: TournamentSimulator)
     if not team_ids or len(team_ids) < 2:
         return None
     
-    # Obtener detalles de los equipos
-    teams = []
-    for team_id in team_ids:
-        team = db.query(Team).filter(Team.id == team_id).first()
-        if team:
-            teams.append(team)
+    # Obtener los equipos con una sola consulta, manteniendo el orden de la liga
+    names_by_id = dict(db.query(Team.id, Team.name).filter(Team.id.in_(team_ids)).all())
+    team_ids = [team_id for team_id in team_ids if team_id in names_by_id]
+    team_names = [names_by_id[team_id] for team_id in team_ids]
     
-    # Obtener detalles de la liga
-    league = get_league(db, league_id)
+    jornadas = db.query(League.jornadas).filter(League.id == league_id).scalar()
     
     # Generar fixtures usando el simulador
-    team_names = [team.name for team in teams]
-    matches_per_jornada = len(teams) // 2  # Cada equipo juega un partido por jornada
+    matches_per_jornada = len(team_names) // 2  # Cada equipo juega un partido por jornada
     
     simulated_matches = simulator.generate_fixture(
         teams=team_names,
-        jornadas=league.jornadas,
+        jornadas=jornadas,
         matches_per_jornada=matches_per_jornada
     )
     
     # Guardar partidos con el ID de la liga
-    saved_matches = []
-    team_name_to_id = {team.name: team.id for team in teams}
+    team_name_to_id = {name: team_id for team_id, name in zip(team_ids, team_names)}
+    rows = []
     
     for match in simulated_matches:
         home_team_id = team_name_to_id.get(match["home_team"])
@@ -234,116 +230,265 @@ def simulate_league(db: Session, league_id: int, simulator: TournamentSimulator)
         if not home_team_id or not away_team_id:
             continue
         
-        # Crear partido
-        db_match = Match(
-            jornada=match["jornada"],
-            home_team_id=home_team_id,
-            away_team_id=away_team_id,
-            league_id=league_id,
-            home_formation=match["home_formation"],
-            home_style=match["home_style"],
-            home_attack=match["home_attack"],
-            home_kicks=match["home_kicks"],
-            home_goals=match.get("home_goals"),
-            home_possession=match.get("home_possession"),
-            home_shots=match.get("home_shots"),
-            away_formation=match["away_formation"],
-            away_style=match["away_style"],
-            away_attack=match["away_attack"],
-            away_kicks=match["away_kicks"],
-            away_goals=match.get("away_goals"),
-            away_possession=match.get("away_possession"),
-            away_shots=match.get("away_shots")
-        )
-        
-        db.add(db_match)
-        db.commit()
-        db.refresh(db_match)
-        saved_matches.append(db_match)
+        rows.append({
+            "jornada": match["jornada"],
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "league_id": league_id,
+            "home_formation": match["home_formation"],
+            "home_style": match["home_style"],
+            "home_attack": match["home_attack"],
+            "home_kicks": match["home_kicks"],
+            "home_goals": match.get("home_goals"),
+            "home_possession": match.get("home_possession"),
+            "home_shots": match.get("home_shots"),
+            "away_formation": match["away_formation"],
+            "away_style": match["away_style"],
+            "away_attack": match["away_attack"],
+            "away_kicks": match["away_kicks"],
+            "away_goals": match.get("away_goals"),
+            "away_possession": match.get("away_possession"),
+            "away_shots": match.get("away_shots")
+        })
+    
+    if not rows:
+        return []
+    
+    saved_matches = db.execute(
+        insert(Match).returning(
+            Match.id, Match.jornada, Match.home_team_id, Match.away_team_id,
+            Match.home_goals, Match.away_goals
+        ),
+        rows
+    ).all()
+    standings_crud.apply_result_changes(
+        db,
+        added=[
+            (league_id, match.home_team_id, match.away_team_id, match.home_goals, match.away_goals)
+            for match in saved_matches
+        ]
+    )
+    counters_crud.adjust_league_counters(db, matches={league_id: len(saved_matches)})
+    db.commit()
     
     return saved_matches
 
-def calculate_league_standings(db: Session, league_id: int):
-    """Calcula la tabla de posiciones de una liga"""
-    # Obtener todos los equipos en la liga
-    league_teams = get_league_teams(db, league_id)
-    team_ids = [lt.team_id for lt in league_teams]
+def calculate_league_standings(db: Session, league_id: int, top: Optional[int] = None):
+    """
+    Calcula la tabla de posiciones de una liga
     
-    # Inicializar tabla de posiciones
-    standings = {team_id: {
-        "team_id": team_id,
-        "played": 0,
-        "won": 0,
-        "drawn": 0,
-        "lost": 0,
-        "goals_for": 0,
-        "goals_against": 0,
-        "goal_difference": 0,
-        "points": 0
-    } for team_id in team_ids}
-    
-    # Obtener todos los partidos jugados en la liga
-    matches = db.query(Match).filter(
+    La agregación, el orden y los datos de los equipos se resuelven en una
+    sola consulta (ver standings_crud.calculate_league_standings); solo
+    cuentan los partidos entre equipos que siguen en la liga.
+    
+    Args:
+        top: Devolver solo las N primeras posiciones
+    """
+    return standings_crud.calculate_league_standings(db, league_id, top)
+
+def get_value_strengths(db: Session, team_ids: List[int]) -> np.ndarray:
+    """
+    Fortalezas del simulador de los equipos según su valor de mercado
+
+    Args:
+        team_ids: IDs de los equipos; el índice de cada uno en la lista es su índice en el array
+    """
+    values = dict(db.query(Team.id, Team.value).filter(Team.id.in_(team_ids)).all())
+    return value_strengths([values.get(team_id) for team_id in team_ids])
+
+def get_league_strength_model(db: Session, league_id: int, team_ids: List[int]) -> PoissonStrengthModel:
+    """
+    Obtiene el modelo Poisson/Dixon-Coles ajustado con los partidos jugados de una liga
+    
+    El modelo se guarda en caché por liga y solo se reajusta (partiendo de los
+    parámetros anteriores) cuando hay resultados nuevos.
+    
+    Args:
+        team_ids: IDs de los equipos; el índice de cada uno en la lista es su índice en el modelo
+    """
+    # La caché se indexa por IDs ordenados para que no dependa del orden de la tabla
+    fitted_ids = sorted(team_ids)
+    team_index = {team_id: i for i, team_id in enumerate(fitted_ids)}
+    
+    played = db.query(
+        Match.home_team_id, Match.away_team_id, Match.home_goals, Match.away_goals
+    ).filter(
         Match.league_id == league_id,
         Match.home_goals != None,
         Match.away_goals != None
-    ).all()
+    ).order_by(Match.id).all()
+    played = [
+        row for row in played
+        if row.home_team_id in team_index and row.away_team_id in team_index
+    ]
+    
+    model = strength_model_cache.get(
+        league_id,
+        fitted_ids,
+        [team_index[row.home_team_id] for row in played],
+        [team_index[row.away_team_id] for row in played],
+        [row.home_goals for row in played],
+        [row.away_goals for row in played]
+    )
     
-    # Calcular estadísticas
-    for match in matches:
-        home_id = match.home_team_id
-        away_id = match.away_team_id
-        
-        # Omitir si los equipos no están en la liga (podrían haber sido eliminados)
-        if home_id not in standings or away_id not in standings:
-            continue
-        
-        home_goals = match.home_goals or 0
-        away_goals = match.away_goals or 0
-        
-        # Actualizar partidos jugados
-        standings[home_id]["played"] += 1
-        standings[away_id]["played"] += 1
-        
-        # Actualizar goles
-        standings[home_id]["goals_for"] += home_goals
-        standings[home_id]["goals_against"] += away_goals
-        standings[away_id]["goals_for"] += away_goals
-        standings[away_id]["goals_against"] += home_goals
-        
-        # Actualizar victorias/empates/derrotas y puntos
-        if home_goals > away_goals:
-            standings[home_id]["won"] += 1
-            standings[away_id]["lost"] += 1
-            standings[home_id]["points"] += 3
-        elif away_goals > home_goals:
-            standings[away_id]["won"] += 1
-            standings[home_id]["lost"] += 1
-            standings[away_id]["points"] += 3
-        else:
-            standings[home_id]["drawn"] += 1
-            standings[away_id]["drawn"] += 1
-            standings[home_id]["points"] += 1
-            standings[away_id]["points"] += 1
-    
-    # Calcular diferencia de goles
-    for team_id in standings:
-        standings[team_id]["goal_difference"] = standings[team_id]["goals_for"] - standings[team_id]["goals_against"]
-    
-    # Ordenar por puntos, diferencia de goles, goles a favor
-    sorted_standings = sorted(
-        standings.values(),
-        key=lambda x: (x["points"], x["goal_difference"], x["goals_for"]),
-        reverse=True
+    if fitted_ids == list(team_ids):
+        return model
+    return model.reindex([team_index[team_id] for team_id in team_ids])
+
+def calculate_league_projections(
+    db: Session,
+    league_id: int,
+    simulator: TournamentSimulator,
+    runs: int = 1000,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    model: str = "simulator"
+):
+    """
+    Proyecta la clasificación final de una liga mediante Monte Carlo
+    
+    Parte de la tabla actual y simula `runs` veces todos los partidos que
+    aún no tienen resultado, sin persistir nada en la base de datos.
+    Con `workers > 1` las simulaciones se reparten entre varios procesos y
+    `seed` permite reproducir exactamente una proyección. Con `model="poisson"`
+    los goles se muestrean del modelo Poisson/Dixon-Coles ajustado a la liga.
+    
+    Returns:
+        Diccionario con probabilidades por equipo de ser campeón, de terminar
+        en el podio, en los puestos de abajo o en cada posición, y los puntos esperados
+    """
+    standings = calculate_league_standings(db, league_id)
+    if not standings:
+        return None
+    
+    team_ids = [row["team_id"] for row in standings]
+    team_index = {team_id: i for i, team_id in enumerate(team_ids)}
+    n_teams = len(team_ids)
+    
+    # Partidos pendientes (sin resultado) de equipos que siguen en la liga
+    pending = db.query(Match.home_team_id, Match.away_team_id).filter(
+        Match.league_id == league_id,
+        or_(Match.home_goals == None, Match.away_goals == None)
+    ).all()
+    pending = [
+        (team_index[home_id], team_index[away_id])
+        for home_id, away_id in pending
+        if home_id in team_index and away_id in team_index
+    ]
+    
+    # El simulador usa fortalezas según el valor de mercado; el modelo Poisson, las ajustadas
+    strength_model = get_league_strength_model(db, league_id, team_ids) if model == "poisson" else None
+    team_strengths = get_value_strengths(db, team_ids) if strength_model is None else None
+    
+    projection = simulator.project_season(
+        n_teams=n_teams,
+        home_idx=[home for home, _ in pending],
+        away_idx=[away for _, away in pending],
+        base_points=[row["points"] for row in standings],
+        base_goal_difference=[row["goal_difference"] for row in standings],
+        base_goals_for=[row["goals_for"] for row in standings],
+        runs=runs,
+        workers=workers,
+        seed=seed,
+        team_strengths=team_strengths,
+        strength_model=strength_model
     )
     
-    # Añadir detalles del equipo
-    for i, team_standing in enumerate(sorted_standings):
-        team = db.query(Team).filter(Team.id == team_standing["team_id"]).first()
-        sorted_standings[i]["team"] = team
-        sorted_standings[i]["position"] = i + 1
+    probabilities = projection["position_counts"] / runs
+    expected_points = projection["points_sum"] / runs
+    podium_size = min(3, n_teams)
     
-    return sorted_standings
+    teams = []
+    for i, row in enumerate(standings):
+        team = row["team"]
+        teams.append({
+            "team_id": row["team_id"],
+            "team_name": team.name if team else None,
+            "current_position": row["position"],
+            "current_points": row["points"],
+            "expected_points": round(float(expected_points[i]), 2),
+            "p_first": round(float(probabilities[i, 0]), 4),
+            "p_top3": round(float(probabilities[i, :podium_size].sum()), 4),
+            "p_bottom3": round(float(probabilities[i, n_teams - podium_size:].sum()), 4),
+            "position_probabilities": [round(float(p), 4) for p in probabilities[i]]
+        })
+    
+    teams.sort(key=lambda x: x["expected_points"], reverse=True)
+    
+    return {
+        "league_id": league_id,
+        "runs": runs,
+        "model": model,
+        "remaining_matches": len(pending),
+        "workers": projection["workers"],
+        "seed": seed,
+        "elapsed_seconds": round(projection["elapsed_seconds"], 4),
+        "runs_per_second": round(projection["runs_per_second"], 1),
+        "teams": teams
+    }
+
+def calculate_fixture_probabilities(
+    db: Session,
+    league_id: int,
+    simulator: MatchSimulator,
+    include_matrix: bool = False,
+    model: str = "simulator"
+):
+    """
+    Calcula las probabilidades exactas de cada partido pendiente de una liga
+    
+    Usa la distribución analítica de marcadores del simulador (sin muestreo),
+    vectorizada sobre todos los partidos pendientes y con las fortalezas de
+    los equipos según su valor de mercado, o la del modelo Poisson/Dixon-Coles
+    ajustado a la liga con `model="poisson"`. Solo se incluyen los partidos
+    entre equipos inscritos en la liga.
+    
+    Returns:
+        Lista con P(victoria local), P(empate), P(victoria visitante) y goles
+        esperados de cada partido, opcionalmente con la matriz de marcadores
+    """
+    pending = db.query(Match).filter(
+        Match.league_id == league_id,
+        or_(Match.home_goals == None, Match.away_goals == None)
+    ).order_by(Match.jornada, Match.id).all()
+    
+    if not pending:
+        return []
+    
+    team_ids = [lt.team_id for lt in get_league_teams(db, league_id)]
+    team_index = {team_id: i for i, team_id in enumerate(team_ids)}
+    pending = [
+        match for match in pending
+        if match.home_team_id in team_index and match.away_team_id in team_index
+    ]
+    if not pending:
+        return []
+    
+    home_idx = [team_index[match.home_team_id] for match in pending]
+    away_idx = [team_index[match.away_team_id] for match in pending]
+    if model == "poisson":
+        distribution = get_league_strength_model(db, league_id, team_ids).score_distribution(home_idx, away_idx)
+    else:
+        distribution = simulator.score_distribution(home_idx, away_idx, get_value_strengths(db, team_ids))
+    
+    fixtures = []
+    for i, match in enumerate(pending):
+        fixture = {
+            "match_id": match.id,
+            "jornada": match.jornada,
+            "home_team_id": match.home_team_id,
+            "away_team_id": match.away_team_id,
+            "p_home_win": round(float(distribution["p_home_win"][i]), 4),
+            "p_draw": round(float(distribution["p_draw"][i]), 4),
+            "p_away_win": round(float(distribution["p_away_win"][i]), 4),
+            "expected_home_goals": round(float(distribution["expected_home_goals"][i]), 3),
+            "expected_away_goals": round(float(distribution["expected_away_goals"][i]), 3)
+        }
+        if include_matrix:
+            fixture["score_matrix"] = distribution["score_matrix"][i].round(6).tolist()
+        fixtures.append(fixture)
+    
+    return fixtures
 
 def update_league_podium(db: Session, league_id: int):
     """Actualiza el podio de una liga (ganador, subcampeón y tercer lugar)"""
@@ -365,31 +510,40 @@ def update_league_podium(db: Session, league_id: int):
     return league
 
 def get_league_with_details(db: Session, league_id: int):
-    """Obtiene una liga con todos sus detalles (equipos, estadísticas, etc.)"""
-    league = get_league(db, league_id)
+    """
+    Obtiene una liga con todos sus detalles (equipos, estadísticas, etc.)
+    
+    Dos consultas como máximo, sea cual sea el número de equipos: la liga con
+    el podio y los extremos de valor (joinedload) y sus equipos inscritos
+    (selectinload), usando las relaciones declaradas en League.
+    """
+    league = db.query(League).options(
+        selectinload(League.league_teams).joinedload(LeagueTeam.team),
+        joinedload(League.winner),
+        joinedload(League.runner_up),
+        joinedload(League.third_place),
+        joinedload(League.highest_value_team),
+        joinedload(League.lowest_value_team)
+    ).filter(League.id == league_id).first()
     if not league:
         return None
     
-    # Obtener equipos en la liga
-    league_teams = get_league_teams(db, league_id)
-    teams = []
-    for lt in league_teams:
-        team = db.query(Team).filter(Team.id == lt.team_id).first()
-        if team:
-            # Convertir equipo a diccionario
-            teams.append({
-                "id": team.id,
-                "name": team.name,
-                "manager": team.manager,
-                "manager_id": team.manager_id,
-                "clan": team.clan,
-                "value": team.value
-            })
-    
-    # Obtener ganadores (podio)
-    winner = db.query(Team).filter(Team.id == league.winner_id).first() if league.winner_id else None
-    runner_up = db.query(Team).filter(Team.id == league.runner_up_id).first() if league.runner_up_id else None
-    third_place = db.query(Team).filter(Team.id == league.third_place_id).first() if league.third_place_id else None
+    # Equipos en la liga
+    teams = [
+        {
+            "id": lt.team.id,
+            "name": lt.team.name,
+            "manager": lt.team.manager,
+            "manager_id": lt.team.manager_id,
+            "clan": lt.team.clan,
+            "value": lt.team.value
+        }
+        for lt in sorted(league.league_teams, key=lambda lt: lt.id)
+        if lt.team
+    ]
+    
+    # Podio
+    winner, runner_up, third_place = league.winner, league.runner_up, league.third_place
     
     # Convertir a diccionarios
     winner_dict = {
@@ -413,9 +567,8 @@ def get_league_with_details(db: Session, league_id: int):
         "manager_id": third_place.manager_id
     } if third_place else None
     
-    # Obtener equipos de mayor/menor valor
-    highest_value_team = db.query(Team).filter(Team.id == league.highest_value_team_id).first() if league.highest_value_team_id else None
-    lowest_value_team = db.query(Team).filter(Team.id == league.lowest_value_team_id).first() if league.lowest_value_team_id else None
+    # Equipos de mayor/menor valor
+    highest_value_team, lowest_value_team = league.highest_value_team, league.lowest_value_team
     
     # Convertir a diccionarios
     highest_value_team_dict = {
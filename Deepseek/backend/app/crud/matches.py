@@ -1,15 +1,26 @@
 # app/crud/matches.py
 
 from sqlalchemy.orm import Session, joinedload
-from typing import List, Dict, Any, Optional
+from sqlalchemy import update, select, delete, or_, tuple_
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-import random
 
 from ..schemas.matches import Match
 from ..schemas.leagues import League, LeagueTeam
 from ..schemas.teams import Team
+from ..schemas.calendar import Calendar
 from ..models.matches import MatchCreate, MatchUpdate
 from ..services.simulation import MatchSimulator
+from ..utils.ingest import RESULT_KEY_FIELDS
+from . import standings as standings_crud
+from . import counters as counters_crud
+
+# Campos de un partido que afectan a la clasificación
+RESULT_COLUMNS = (Match.league_id, Match.home_team_id, Match.away_team_id, Match.home_goals, Match.away_goals)
+
+def _match_result(match) -> tuple:
+    """(league_id, home_team_id, away_team_id, home_goals, away_goals) de un partido"""
+    return (match.league_id, match.home_team_id, match.away_team_id, match.home_goals, match.away_goals)
 
 def get_match(db: Session, match_id: int):
     """Obtiene un partido por su ID con los detalles de los equipos"""
@@ -77,6 +88,8 @@ def create_match(db: Session, match: MatchCreate):
     )
     
     db.add(db_match)
+    standings_crud.apply_result_changes(db, added=[_match_result(db_match)])
+    counters_crud.adjust_league_counters(db, matches=counters_crud.count_by_league([db_match.league_id]))
     db.commit()
     db.refresh(db_match)
     return db_match
@@ -109,12 +122,16 @@ def update_match(db: Session, match_id: int, match_data: MatchUpdate):
     """
     Actualiza un partido existente
     
-    Solo se actualizarán los campos incluidos en match_data
+    Solo se actualizarán los campos incluidos en match_data. La fila queda
+    bloqueada hasta el commit para que dos actualizaciones simultáneas no
+    descuenten el mismo resultado anterior de la clasificación.
     """
-    match = get_match(db, match_id)
+    match = db.query(Match).filter(Match.id == match_id).populate_existing().with_for_update().first()
     if not match:
         return None
     
+    previous = _match_result(match)
+    
     # Actualizar solo los campos no nulos
     update_data = match_data.dict(exclude_unset=True)
     for key, value in update_data.items():
@@ -124,15 +141,201 @@ def update_match(db: Session, match_id: int, match_data: MatchUpdate):
     # Actualizar timestamp
     match.updated_at = datetime.now()
     
+    # Aplicar la diferencia de resultado a la clasificación en la misma transacción
+    standings_crud.apply_result_changes(db, removed=[previous], added=[_match_result(match)])
+    
+    if previous[0] != match.league_id:
+        moved = counters_crud.count_by_league([previous[0]], -1)
+        moved.update(counters_crud.count_by_league([match.league_id]))
+        counters_crud.adjust_league_counters(db, matches=moved)
+    
     db.commit()
     db.refresh(match)
     return match
 
+def update_matches_batch(db: Session, match_ids: List[int], match_data: MatchUpdate) -> Dict[str, Any]:
+    """
+    Aplica los mismos cambios a varios partidos en una sola transacción
+    
+    Ejecuta un único UPDATE ... WHERE id IN (...) RETURNING y, si se
+    actualizaron goles, marca como jugadas las entradas del calendario de los
+    partidos que quedan con los dos goles con otro UPDATE y aplica la
+    diferencia a la clasificación antes del commit.
+    
+    Returns:
+        Diccionario con los IDs actualizados (`updated`), las entradas del
+        calendario marcadas como jugadas y los errores por ID (`errors`)
+    """
+    match_ids = list(dict.fromkeys(match_ids))
+    
+    # Igual que en update_match, solo se actualizan los valores no nulos
+    update_data = {
+        key: value for key, value in match_data.dict(exclude_unset=True).items()
+        if value is not None
+    }
+    update_data["updated_at"] = datetime.now()
+    
+    # Los valores anteriores solo hacen falta si cambia algo que cuenta en la clasificación
+    previous = []
+    if any(column.key in update_data for column in RESULT_COLUMNS):
+        previous = db.execute(
+            select(*RESULT_COLUMNS).where(Match.id.in_(match_ids)).with_for_update()
+        ).all()
+    
+    returned = db.execute(
+        update(Match).where(Match.id.in_(match_ids)).values(**update_data).returning(Match.id, *RESULT_COLUMNS),
+        execution_options={"synchronize_session": False}
+    ).all()
+    updated = [row.id for row in returned]
+    
+    if previous:
+        standings_crud.apply_result_changes(db, removed=previous, added=[tuple(row)[1:] for row in returned])
+    
+    if previous and "league_id" in update_data:
+        moved = counters_crud.count_by_league([row.league_id for row in previous], -1)
+        moved.update(counters_crud.count_by_league([row.league_id for row in returned]))
+        counters_crud.adjust_league_counters(db, matches=moved)
+    
+    # Solo se marcan como jugados los partidos que quedan con los dos goles
+    calendar_entries_played = 0
+    played_ids = [
+        row.id for row in returned
+        if row.home_goals is not None and row.away_goals is not None
+    ] if "home_goals" in update_data or "away_goals" in update_data else []
+    if played_ids:
+        calendar_entries_played = db.execute(
+            update(Calendar).where(
+                Calendar.match_id.in_(played_ids),
+                Calendar.is_played.isnot(True)
+            ).values(is_played=True, updated_at=datetime.now()),
+            execution_options={"synchronize_session": False}
+        ).rowcount
+    
+    db.commit()
+    
+    found = set(updated)
+    return {
+        "updated": updated,
+        "calendar_entries_played": calendar_entries_played,
+        "errors": [
+            {"id": match_id, "detail": "Partido no encontrado"}
+            for match_id in match_ids if match_id not in found
+        ]
+    }
+
+def apply_league_results(
+    db: Session,
+    league_id: int,
+    results: List[Tuple[int, Dict[str, int]]]
+) -> Dict[str, Any]:
+    """
+    Aplica un lote de resultados reales a los partidos de una liga en una transacción
+    
+    Los partidos se resuelven con una sola consulta (por ID o por jornada,
+    local y visitante, siempre dentro de la liga), se actualizan con un
+    UPDATE por clave primaria, las entradas del calendario de los que quedan
+    con los dos goles se marcan como jugadas y la clasificación recibe la
+    diferencia antes del commit.
+    
+    Args:
+        db: Sesión de base de datos
+        league_id: ID de la liga
+        results: Lista de (número de línea, resultado) ya validados
+    
+    Returns:
+        Diccionario con los IDs actualizados (`updated`), las entradas del
+        calendario marcadas como jugadas y los errores por línea (`errors`)
+    """
+    match_ids = {record["match_id"] for _, record in results if "match_id" in record}
+    keys = {
+        (record["jornada"], record["home_team_id"], record["away_team_id"])
+        for _, record in results if "match_id" not in record
+    }
+    
+    conditions = []
+    if match_ids:
+        conditions.append(Match.id.in_(match_ids))
+    if keys:
+        conditions.append(tuple_(Match.jornada, Match.home_team_id, Match.away_team_id).in_(keys))
+    
+    previous = {}
+    ids_by_key = {}
+    for match_id, jornada, *result in db.execute(
+        select(Match.id, Match.jornada, *RESULT_COLUMNS)
+        .where(Match.league_id == league_id, or_(*conditions))
+        .with_for_update()
+    ):
+        previous[match_id] = tuple(result)
+        ids_by_key.setdefault((jornada, result[1], result[2]), match_id)
+    
+    # Un partido repetido en el lote se queda con su último resultado
+    now = datetime.now()
+    rows = {}
+    errors = []
+    for line, record in results:
+        if "match_id" in record:
+            match_id = record["match_id"] if record["match_id"] in previous else None
+        else:
+            match_id = ids_by_key.get((record["jornada"], record["home_team_id"], record["away_team_id"]))
+        
+        if match_id is None:
+            errors.append({"line": line, "detail": "Partido no encontrado en la liga"})
+            continue
+        
+        row = rows.setdefault(match_id, {"id": match_id})
+        row.update({key: value for key, value in record.items() if key not in RESULT_KEY_FIELDS})
+        row["updated_at"] = now
+    
+    calendar_entries_played = 0
+    if rows:
+        db.execute(update(Match), list(rows.values()))
+        
+        # Resultado final de cada partido: los goles del lote o los que ya tenía
+        final = {
+            match_id: previous[match_id][:3] + (
+                row.get("home_goals", previous[match_id][3]),
+                row.get("away_goals", previous[match_id][4])
+            )
+            for match_id, row in rows.items()
+        }
+        standings_crud.apply_result_changes(
+            db,
+            removed=[previous[match_id] for match_id in rows],
+            added=final.values()
+        )
+        
+        # Solo se marcan como jugados los partidos que quedan con resultado
+        played_ids = [
+            match_id for match_id, result in final.items()
+            if result[3] is not None and result[4] is not None
+        ]
+        if played_ids:
+            calendar_entries_played = db.execute(
+                update(Calendar).where(
+                    Calendar.match_id.in_(played_ids),
+                    Calendar.is_played.isnot(True)
+                ).values(is_played=True, updated_at=now),
+                execution_options={"synchronize_session": False}
+            ).rowcount
+    
+    db.commit()
+    
+    return {
+        "updated": list(rows.keys()),
+        "calendar_entries_played": calendar_entries_played,
+        "errors": errors
+    }
+
 def delete_match(db: Session, match_id: int):
-    """Elimina un partido"""
-    result = db.query(Match).filter(Match.id == match_id).delete()
+    """Elimina un partido (y descuenta su resultado de la clasificación)"""
+    removed = db.execute(
+        delete(Match).where(Match.id == match_id).returning(*RESULT_COLUMNS),
+        execution_options={"synchronize_session": False}
+    ).all()
+    standings_crud.apply_result_changes(db, removed=removed)
+    counters_crud.adjust_league_counters(db, matches=counters_crud.count_by_league([row.league_id for row in removed], -1))
     db.commit()
-    return result > 0
+    return len(removed) > 0
 
 def get_league_matches(db: Session, league_id: int, jornada: Optional[int] = None):
     """
@@ -166,8 +369,12 @@ def simulate_match(db: Session, match_id: int):
     
     Returns:
         Partido actualizado o None si no se pudo simular
+    
+    La fila queda bloqueada hasta el commit, de modo que dos simulaciones
+    simultáneas del mismo partido no sumen dos veces su resultado a la
+    clasificación: la segunda ve ya los goles de la primera.
     """
-    match = get_match(db, match_id)
+    match = db.query(Match).filter(Match.id == match_id).populate_existing().with_for_update().first()
     if not match:
         return None
     
@@ -175,33 +382,24 @@ def simulate_match(db: Session, match_id: int):
     if match.home_goals is not None and match.away_goals is not None:
         return match  # Ya tiene resultados
     
-    # Crear simulador
+    # Simular resultados (un partido suelto va por la ruta escalar, más
+    # rápida que un lote de un solo partido)
     simulator = MatchSimulator()
+    result = simulator.simulate_match(match.home_team_id, match.away_team_id)
     
-    # Simular posesión
-    home_possession = random.randint(40, 60)
-    away_possession = 100 - home_possession
-    
-    # Simular tiros
-    home_shots = max(1, int((home_possession / 100) * random.randint(8, 16)))
-    away_shots = max(1, int((away_possession / 100) * random.randint(8, 16)))
-    
-    # Simular goles (tasa de conversión entre 10% y 30%)
-    home_conversion_rate = random.uniform(0.1, 0.3)
-    away_conversion_rate = random.uniform(0.1, 0.3)
-    
-    home_goals = round(home_shots * home_conversion_rate)
-    away_goals = round(away_shots * away_conversion_rate)
+    previous = _match_result(match)
     
     # Actualizar datos del partido
-    match.home_possession = home_possession
-    match.away_possession = away_possession
-    match.home_shots = home_shots
-    match.away_shots = away_shots
-    match.home_goals = home_goals
-    match.away_goals = away_goals
+    match.home_possession = result["home_possession"]
+    match.away_possession = result["away_possession"]
+    match.home_shots = result["home_shots"]
+    match.away_shots = result["away_shots"]
+    match.home_goals = result["home_goals"]
+    match.away_goals = result["away_goals"]
     match.updated_at = datetime.now()
     
+    standings_crud.apply_result_changes(db, removed=[previous], added=[_match_result(match)])
+    
     db.commit()
     db.refresh(match)
     return match
@@ -0,0 +1,299 @@
+# app/crud/standings.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, delete, exists, func, or_, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from datetime import datetime
+
+from ..schemas.standings import LeagueStanding
+from ..schemas.leagues import LeagueTeam
+from ..schemas.matches import Match
+from ..schemas.teams import Team
+from ..services.standings import STANDINGS_COLUMNS
+
+# (league_id, home_team_id, away_team_id, home_goals, away_goals)
+MatchResult = Tuple[Optional[int], int, int, Optional[int], Optional[int]]
+
+def _team_contribution(league_id, team_id, goals_for, goals_against, sign: int = 1) -> Dict[str, Any]:
+    """Aportación de un partido jugado a la fila de un equipo"""
+    won = int(goals_for > goals_against)
+    drawn = int(goals_for == goals_against)
+    return {
+        "league_id": league_id,
+        "team_id": team_id,
+        "played": sign,
+        "won": sign * won,
+        "drawn": sign * drawn,
+        "lost": sign * (1 - won - drawn),
+        "goals_for": sign * goals_for,
+        "goals_against": sign * goals_against,
+        "goal_difference": sign * (goals_for - goals_against),
+        "points": sign * (3 * won + drawn)
+    }
+
+def standings_delta(
+    removed: Iterable[MatchResult] = (),
+    added: Iterable[MatchResult] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Diferencia que producen en la clasificación unos resultados quitados y otros añadidos
+
+    Los partidos sin jugar o sin liga no aportan nada. Las filas cuya
+    diferencia es nula se descartan. No comprueba la inscripción de los
+    equipos (ver apply_result_changes).
+
+    Returns:
+        Filas {league_id, team_id, columnas...} con los incrementos a aplicar
+    """
+    totals = {}
+    for sign, results in ((-1, removed), (1, added)):
+        for league_id, home_team_id, away_team_id, home_goals, away_goals in results:
+            if league_id is None or home_goals is None or away_goals is None:
+                continue
+            for row in (
+                _team_contribution(league_id, home_team_id, home_goals, away_goals, sign),
+                _team_contribution(league_id, away_team_id, away_goals, home_goals, sign)
+            ):
+                total = totals.setdefault((league_id, row["team_id"]), dict.fromkeys(STANDINGS_COLUMNS, 0))
+                for column in STANDINGS_COLUMNS:
+                    total[column] += row[column]
+
+    return [
+        {"league_id": league_id, "team_id": team_id, **total}
+        for (league_id, team_id), total in totals.items()
+        if any(total.values())
+    ]
+
+def _upsert_increments(rows_or_select):
+    """INSERT ... ON CONFLICT (league_id, team_id) DO UPDATE que suma los incrementos"""
+    if isinstance(rows_or_select, list):
+        stmt = pg_insert(LeagueStanding).values(rows_or_select)
+    else:
+        stmt = pg_insert(LeagueStanding).from_select(
+            ["league_id", "team_id", *STANDINGS_COLUMNS], rows_or_select, include_defaults=False
+        )
+
+    table = LeagueStanding.__table__
+    return stmt.on_conflict_do_update(
+        index_elements=[LeagueStanding.league_id, LeagueStanding.team_id],
+        set_={
+            **{column: table.c[column] + stmt.excluded[column] for column in STANDINGS_COLUMNS},
+            "updated_at": datetime.now()
+        }
+    )
+
+def _member_results(db: Session, results: Iterable[MatchResult]) -> List[MatchResult]:
+    """Resultados jugados de liga cuyos dos equipos están inscritos en ella (una consulta)"""
+    results = [
+        tuple(result) for result in results
+        if result[0] is not None and result[3] is not None and result[4] is not None
+    ]
+    if not results:
+        return []
+
+    members = set(db.execute(
+        select(LeagueTeam.league_id, LeagueTeam.team_id).where(
+            LeagueTeam.league_id.in_({result[0] for result in results}),
+            LeagueTeam.team_id.in_({team_id for result in results for team_id in result[1:3]})
+        )
+    ).tuples())
+    return [
+        result for result in results
+        if (result[0], result[1]) in members and (result[0], result[2]) in members
+    ]
+
+def member_team_results(db: Session, league_id: int, team_id: int) -> List[MatchResult]:
+    """
+    Resultados de los partidos jugados de un equipo en una liga contra rivales inscritos
+
+    Es lo que el equipo aporta a la clasificación: se suma al inscribirlo y se
+    resta al darlo de baja (el propio equipo debe estar inscrito al llamarla).
+    """
+    members = select(LeagueTeam.team_id).where(LeagueTeam.league_id == league_id)
+    return db.execute(
+        select(Match.league_id, Match.home_team_id, Match.away_team_id, Match.home_goals, Match.away_goals).where(
+            Match.league_id == league_id,
+            Match.home_goals.isnot(None),
+            Match.away_goals.isnot(None),
+            or_(
+                and_(Match.home_team_id == team_id, Match.away_team_id.in_(members)),
+                and_(Match.away_team_id == team_id, Match.home_team_id.in_(members))
+            )
+        )
+    ).tuples().all()
+
+def apply_result_changes(
+    db: Session,
+    removed: Iterable[MatchResult] = (),
+    added: Iterable[MatchResult] = ()
+) -> int:
+    """
+    Aplica a la clasificación persistida el cambio entre resultados antiguos y nuevos
+
+    No hace commit: se llama dentro de la transacción que escribe los
+    partidos, de modo que la clasificación nunca se desincroniza. Como la
+    tabla en vivo, solo cuentan los partidos entre equipos inscritos en la
+    liga; el resto se ignora.
+
+    Args:
+        db: Sesión de base de datos
+        removed: Resultados que dejan de contar (valores antiguos, partidos borrados)
+        added: Resultados que pasan a contar (valores nuevos, partidos creados)
+
+    Returns:
+        Número de filas de clasificación modificadas
+    """
+    rows = standings_delta(_member_results(db, removed), _member_results(db, added))
+    if rows:
+        db.execute(_upsert_increments(rows))
+    return len(rows)
+
+def played_matches_aggregate(*conditions):
+    """
+    SELECT agregado de la clasificación desde los partidos jugados
+
+    Une las perspectivas local y visitante con UNION ALL y agrupa por liga y
+    equipo con sumas condicionales. Solo cuentan los partidos entre equipos
+    inscritos en su liga, igual que en apply_result_changes.
+
+    Args:
+        conditions: Filtros adicionales sobre Match (p. ej. la liga)
+
+    Returns:
+        Select con league_id, team_id y las columnas de STANDINGS_COLUMNS
+    """
+    def is_member(team_id):
+        return exists().where(LeagueTeam.league_id == Match.league_id, LeagueTeam.team_id == team_id)
+
+    played = [
+        Match.home_goals.isnot(None),
+        Match.away_goals.isnot(None),
+        Match.league_id.isnot(None),
+        is_member(Match.home_team_id),
+        is_member(Match.away_team_id),
+        *conditions
+    ]
+
+    sides = union_all(
+        select(
+            Match.league_id.label("league_id"),
+            Match.home_team_id.label("team_id"),
+            Match.home_goals.label("goals_for"),
+            Match.away_goals.label("goals_against")
+        ).where(*played),
+        select(
+            Match.league_id,
+            Match.away_team_id,
+            Match.away_goals,
+            Match.home_goals
+        ).where(*played)
+    ).subquery("sides")
+
+    won = func.sum(case((sides.c.goals_for > sides.c.goals_against, 1), else_=0))
+    drawn = func.sum(case((sides.c.goals_for == sides.c.goals_against, 1), else_=0))
+
+    return select(
+        sides.c.league_id,
+        sides.c.team_id,
+        func.count().label("played"),
+        won.label("won"),
+        drawn.label("drawn"),
+        func.sum(case((sides.c.goals_for < sides.c.goals_against, 1), else_=0)).label("lost"),
+        func.sum(sides.c.goals_for).label("goals_for"),
+        func.sum(sides.c.goals_against).label("goals_against"),
+        func.sum(sides.c.goals_for - sides.c.goals_against).label("goal_difference"),
+        (3 * won + drawn).label("points")
+    ).group_by(sides.c.league_id, sides.c.team_id)
+
+def rebuild_statements(league_id: Optional[int] = None) -> List[Any]:
+    """Sentencias que reconstruyen la clasificación de una liga (o de todas) desde los partidos"""
+    stmt_delete = delete(LeagueStanding)
+    aggregate = played_matches_aggregate()
+    if league_id is not None:
+        stmt_delete = stmt_delete.where(LeagueStanding.league_id == league_id)
+        aggregate = played_matches_aggregate(Match.league_id == league_id)
+
+    return [stmt_delete, _upsert_increments(aggregate)]
+
+def rebuild_league_standings(db: Session, league_id: Optional[int] = None) -> int:
+    """
+    Reconstruye la clasificación persistida desde los partidos (reparación)
+
+    Args:
+        db: Sesión de base de datos
+        league_id: ID de la liga; si es None se reconstruyen todas
+
+    Returns:
+        Número de filas de clasificación escritas
+    """
+    stmt_delete, stmt_insert = rebuild_statements(league_id)
+    db.execute(stmt_delete)
+    written = db.execute(stmt_insert).rowcount
+    db.commit()
+    return written
+
+def _ranked_standings(db: Session, league_id: int, source, top: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Tabla de una liga ordenada en SQL desde una fuente de filas de clasificación
+
+    Una sola consulta: los equipos inscritos en la liga unidos a sus datos y a
+    su fila en `source` (a cero si aún no han jugado), ordenados por puntos,
+    diferencia de goles, goles a favor y orden de inscripción.
+
+    Args:
+        source: Tabla o subconsulta con league_id, team_id y STANDINGS_COLUMNS
+        top: Devolver solo las N primeras filas
+    """
+    columns = [func.coalesce(source.c[column], 0).label(column) for column in STANDINGS_COLUMNS]
+    by_name = {column.name: column for column in columns}
+
+    query = (
+        select(Team, *columns)
+        .select_from(LeagueTeam)
+        .join(Team, Team.id == LeagueTeam.team_id)
+        .outerjoin(source, (source.c.league_id == LeagueTeam.league_id) & (source.c.team_id == LeagueTeam.team_id))
+        .where(LeagueTeam.league_id == league_id)
+        .order_by(
+            by_name["points"].desc(),
+            by_name["goal_difference"].desc(),
+            by_name["goals_for"].desc(),
+            LeagueTeam.id
+        )
+    )
+    if top is not None:
+        query = query.limit(top)
+
+    return [
+        {
+            "team_id": row.Team.id,
+            **{column: getattr(row, column) for column in STANDINGS_COLUMNS},
+            "team": row.Team,
+            "position": position
+        }
+        for position, row in enumerate(db.execute(query), start=1)
+    ]
+
+def get_league_standings(db: Session, league_id: int, top: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Lee la tabla de una liga de la clasificación persistida
+
+    Returns:
+        Lista de filas con team_id, estadísticas, team y position
+    """
+    return _ranked_standings(db, league_id, LeagueStanding.__table__, top)
+
+def calculate_league_standings(db: Session, league_id: int, top: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Calcula la tabla de una liga en la base de datos desde sus partidos jugados
+
+    Agrega con played_matches_aggregate (UNION ALL de local y visitante) solo
+    los partidos entre equipos inscritos en la liga, y ordena y une los datos
+    de los equipos en la misma consulta.
+
+    Returns:
+        Lista de filas con team_id, estadísticas, team y position
+    """
+    aggregate = played_matches_aggregate(Match.league_id == league_id).subquery("live_standings")
+
+    return _ranked_standings(db, league_id, aggregate, top)
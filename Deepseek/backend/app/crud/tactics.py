@@ -0,0 +1,120 @@
+# app/crud/tactics.py
+
+import threading
+import time
+from datetime import datetime
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_, select
+from typing import Optional
+
+from ..schemas.matches import Match
+from ..schemas.leagues import League, TipoLiga
+from ..services.tactics import TacticSampler, DB_SOURCE, DEFAULT_CACHE_PATH, DEFAULT_DATA_FILES
+
+# Segundos entre dos refrescos del muestreador compartido con la base de datos
+SAMPLER_REFRESH_INTERVAL = 60.0
+
+def _match_tactic(formation, style, kicks, attack):
+    """Táctica de un lado del partido (None si no hay formación)"""
+    if not formation:
+        return None
+    return (formation, style or "", kicks or "", attack or "")
+
+def refresh_tactic_sampler(db: Session, sampler: TacticSampler) -> int:
+    """
+    Incorpora al muestreador los partidos que han cambiado desde el último refresco
+
+    Los cambios se siguen por `updated_at` (no por ID): un partido creado sin
+    resultado que se juega después, o cuyo resultado o tácticas se corrigen,
+    vuelve a leerse y sustituye su aportación anterior. Los partidos de ligas
+    tácticas los genera el propio simulador y no cuentan. Si el número de
+    partidos que cuentan no coincide con la base de datos (p. ej. tras borrar
+    partidos) la fuente se reconstruye desde cero.
+
+    Args:
+        db: Sesión de base de datos
+        sampler: Muestreador a refrescar
+
+    Returns:
+        Número de partidos cuya aportación cambió
+    """
+    changed_at = func.coalesce(Match.updated_at, Match.created_at)
+    counts = and_(
+        Match.home_goals.isnot(None),
+        Match.away_goals.isnot(None),
+        or_(League.id.is_(None), League.tipo_liga != TipoLiga.LIGA_TACTICA)
+    )
+
+    query = select(
+        Match.id, changed_at.label("changed_at"), counts.label("counts"),
+        Match.home_formation, Match.home_style, Match.home_kicks, Match.home_attack,
+        Match.away_formation, Match.away_style, Match.away_kicks, Match.away_attack
+    ).outerjoin(League, League.id == Match.league_id)
+
+    # Marca de agua inclusiva: las filas con la misma marca se releen, lo que
+    # es inocuo porque aplicar el mismo estado no cambia los conteos
+    updated_since = sampler.sources.get(DB_SOURCE, {}).get("updated_since")
+    if updated_since:
+        query = query.where(changed_at >= datetime.fromisoformat(updated_since))
+
+    rows = db.execute(query).all()
+    latest = max((row.changed_at for row in rows if row.changed_at), default=None)
+    changed = sampler.apply_match_tactics(
+        (
+            (
+                row.id,
+                [
+                    _match_tactic(row.home_formation, row.home_style, row.home_kicks, row.home_attack),
+                    _match_tactic(row.away_formation, row.away_style, row.away_kicks, row.away_attack)
+                ] if row.counts else None
+            )
+            for row in rows
+        ),
+        updated_since=latest.isoformat() if latest else updated_since
+    )
+
+    # Los partidos borrados no aparecen por updated_at: se detectan por el conteo
+    expected = db.scalar(
+        select(func.count()).select_from(Match).outerjoin(League, League.id == Match.league_id).where(counts)
+    )
+    if updated_since and expected != sampler.tracked_matches(DB_SOURCE):
+        sampler.drop_source(DB_SOURCE)
+        return refresh_tactic_sampler(db, sampler)
+
+    return changed
+
+# Muestreador compartido por la API (uno por proceso), refrescado bajo un cerrojo
+_sampler_lock = threading.Lock()
+_shared_sampler: Optional[TacticSampler] = None
+_shared_snapshot: Optional[TacticSampler] = None
+_refreshed_at = 0.0
+
+def get_tactic_sampler(db: Session, cache_path: str = DEFAULT_CACHE_PATH) -> Optional[TacticSampler]:
+    """
+    Devuelve el muestreador de tácticas compartido, refrescado si toca
+
+    Se carga una sola vez por proceso (caché en disco y archivos JSON) y se
+    refresca con los archivos y la base de datos como mucho cada
+    SAMPLER_REFRESH_INTERVAL segundos. Solo un hilo refresca y reescribe la
+    caché a la vez; las peticiones reciben una copia compilada (`snapshot`)
+    que no cambia mientras la usan.
+
+    Returns:
+        El muestreador, o None si no hay datos de calibración (se usan
+        entonces las probabilidades fijas del simulador)
+    """
+    global _shared_sampler, _shared_snapshot, _refreshed_at
+
+    with _sampler_lock:
+        now = time.monotonic()
+        if _shared_sampler is None or now - _refreshed_at >= SAMPLER_REFRESH_INTERVAL:
+            sampler = _shared_sampler or TacticSampler.load_or_build(cache_path)
+            changed = sampler.add_json_files(DEFAULT_DATA_FILES)
+            changed = refresh_tactic_sampler(db, sampler) > 0 or changed
+            if changed and sampler.sources:
+                sampler.save(cache_path)
+            if changed or _shared_snapshot is None:
+                _shared_snapshot = sampler.snapshot()
+            _shared_sampler, _refreshed_at = sampler, now
+
+        return _shared_snapshot if _shared_snapshot.has_data else None
@@ -1,11 +1,14 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
+from sqlalchemy import and_, case, delete, func, literal, or_, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List, Dict, Any, Optional
 
 from ..schemas.teams import Team
 from ..schemas.leagues import LeagueTeam, League
 from ..schemas.matches import Match
 from ..models.teams import TeamCreate, TeamUpdate
+from . import standings as standings_crud
+from . import counters as counters_crud
 
 def get_team(db: Session, team_id: int):
     """Obtiene un equipo por su ID"""
@@ -75,25 +78,131 @@ def update_team(db: Session, team_id: int, team_data: TeamUpdate):
     db.refresh(db_team)
     return db_team
 
+def create_teams_batch(db: Session, teams: List[TeamCreate]) -> Dict[str, Any]:
+    """
+    Crea varios equipos con un único INSERT multi-fila en una transacción
+    
+    Los nombres que ya existen (o que se repiten en la petición) no se
+    insertan y se devuelven como errores por elemento.
+    
+    Returns:
+        Diccionario con los equipos creados (`teams`) y los errores (`errors`)
+    """
+    # Primera aparición de cada nombre en la petición
+    first_index = {}
+    for index, team in enumerate(teams):
+        first_index.setdefault(team.name, index)
+    
+    rows = [team.dict() for index, team in enumerate(teams) if first_index[team.name] == index]
+    
+    created = []
+    if rows:
+        created = db.scalars(
+            pg_insert(Team).values(rows).on_conflict_do_nothing(index_elements=[Team.name]).returning(Team)
+        ).all()
+        db.commit()
+    
+    created_names = {team.name for team in created}
+    errors = []
+    for index, team in enumerate(teams):
+        if first_index[team.name] != index:
+            errors.append({"index": index, "name": team.name, "detail": "Nombre repetido en la petición"})
+        elif team.name not in created_names:
+            errors.append({"index": index, "name": team.name, "detail": "El equipo ya existe"})
+    
+    return {"teams": created, "errors": errors}
+
+def upsert_teams_values(db: Session, teams: List[Dict[str, Any]]) -> List[Team]:
+    """
+    Crea o actualiza el valor de varios equipos con un único
+    INSERT ... ON CONFLICT (name) DO UPDATE SET value
+    
+    No hace commit: el llamador decide cuándo cerrar la transacción.
+    
+    Args:
+        db: Sesión de base de datos
+        teams: Diccionarios con `name` y `value` (nombres sin repetir)
+    
+    Returns:
+        Equipos creados o actualizados, en el mismo orden que `teams`
+    """
+    if not teams:
+        return []
+    
+    stmt = pg_insert(Team).values([{"name": team["name"], "value": team.get("value")} for team in teams])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Team.name],
+        set_={"value": stmt.excluded.value}
+    ).returning(Team)
+    
+    by_name = {team.name: team for team in db.scalars(stmt).all()}
+    return [by_name[team["name"]] for team in teams]
+
+def update_teams_batch(db: Session, team_ids: List[int], team_data: TeamUpdate) -> Dict[str, Any]:
+    """
+    Aplica los mismos cambios a varios equipos con un único UPDATE ... WHERE id IN (...)
+    
+    Returns:
+        Diccionario con los equipos actualizados (`teams`) y los errores por ID (`errors`)
+    """
+    update_data = team_data.dict(exclude_unset=True)
+    team_ids = list(dict.fromkeys(team_ids))
+    
+    # El nombre es único: solo puede asignarse a un equipo y si no lo usa otro
+    if "name" in update_data:
+        if len(team_ids) > 1:
+            return {
+                "teams": [],
+                "errors": [{"id": team_id, "detail": "No se puede asignar el mismo nombre a varios equipos"} for team_id in team_ids]
+            }
+        
+        existing = get_team_by_name(db, update_data["name"])
+        if existing and existing.id not in team_ids:
+            return {
+                "teams": [],
+                "errors": [{"id": team_id, "detail": "Ya existe un equipo con ese nombre"} for team_id in team_ids]
+            }
+    
+    updated = db.scalars(
+        update(Team).where(Team.id.in_(team_ids)).values(**update_data).returning(Team),
+        execution_options={"synchronize_session": False}
+    ).all() if update_data else db.query(Team).filter(Team.id.in_(team_ids)).all()
+    db.commit()
+    
+    found = {team.id for team in updated}
+    errors = [{"id": team_id, "detail": "Equipo no encontrado"} for team_id in team_ids if team_id not in found]
+    
+    return {"teams": updated, "errors": errors}
+
 def delete_team(db: Session, team_id: int):
     """
     Elimina un equipo
     
-    Nota: Esto eliminará también todas las relaciones del equipo con ligas y partidos
+    Nota: Esto eliminará también todas las relaciones del equipo con ligas y
+    partidos (ON DELETE CASCADE); las referencias de podio y valor de las
+    ligas quedan a NULL. Para equipos con muchos partidos usar el borrado por
+    lotes de services.purge.
     """
-    # Primero eliminar las relaciones con ligas
-    db.query(LeagueTeam).filter(LeagueTeam.team_id == team_id).delete()
+    # Borrar antes los partidos para descontar sus resultados de los rivales
+    removed = db.execute(
+        delete(Match).where(
+            or_(Match.home_team_id == team_id, Match.away_team_id == team_id)
+        ).returning(Match.league_id, Match.home_team_id, Match.away_team_id, Match.home_goals, Match.away_goals),
+        execution_options={"synchronize_session": False}
+    ).all()
+    standings_crud.apply_result_changes(db, removed=removed)
     
-    # Intentar eliminar los partidos donde participa este equipo
-    # Nota: Esto podría ser peligroso si hay muchas referencias
-    db.query(Match).filter(
-        or_(
-            Match.home_team_id == team_id,
-            Match.away_team_id == team_id
-        )
-    ).delete()
+    # Inscripciones explícitas (en lugar de la cascada) para ajustar los contadores
+    left_leagues = db.scalars(
+        delete(LeagueTeam).where(LeagueTeam.team_id == team_id).returning(LeagueTeam.league_id),
+        execution_options={"synchronize_session": False}
+    ).all()
+    counters_crud.adjust_league_counters(
+        db,
+        matches=counters_crud.count_by_league([row.league_id for row in removed], -1),
+        teams=counters_crud.count_by_league(left_leagues, -1)
+    )
     
-    # Finalmente eliminar el equipo
     result = db.query(Team).filter(Team.id == team_id).delete()
     
     db.commit()
@@ -122,88 +231,76 @@ def get_team_matches(db: Session, team_id: int):
         )
     ).all()
 
-def get_team_stats(db: Session, team_id: int):
+# Contadores de get_teams_stats que salen directamente de la agregación
+TEAM_STATS_COUNTERS = (
+    "won", "drawn", "lost", "goals_for", "goals_against",
+    "home_matches", "away_matches",
+    "home_wins", "home_draws", "home_losses",
+    "away_wins", "away_draws", "away_losses",
+    "clean_sheets", "failed_to_score"
+)
+
+def team_stats_aggregate(team_ids: List[int], league_id: Optional[int] = None):
     """
-    Calcula estadísticas globales para un equipo
-    
-    Incluye partidos jugados, victorias, empates, derrotas, goles a favor/en contra, etc.
+    SELECT con las estadísticas de varios equipos en una sola pasada
+
+    Une las perspectivas local y visitante de los partidos jugados con
+    UNION ALL (cada rama usa el índice de su columna de equipo) y agrupa por
+    equipo con sumas condicionales.
+
+    Args:
+        team_ids: IDs de los equipos
+        league_id: Limitar los partidos a esta liga (opcional)
+
+    Returns:
+        Select con team_id y las columnas de TEAM_STATS_COUNTERS
     """
-    # Obtener todos los partidos donde participó el equipo
-    matches = get_team_matches(db, team_id)
-    
-    # Inicializar estadísticas
-    stats = {
-        "played": 0,
-        "won": 0,
-        "drawn": 0,
-        "lost": 0,
-        "goals_for": 0,
-        "goals_against": 0,
-        "home_matches": 0,
-        "away_matches": 0,
-        "home_wins": 0,
-        "home_draws": 0,
-        "home_losses": 0,
-        "away_wins": 0,
-        "away_draws": 0,
-        "away_losses": 0,
-        "clean_sheets": 0,
-        "failed_to_score": 0,
-        "leagues_participated": len(get_team_leagues(db, team_id))
-    }
-    
-    # Procesar cada partido
-    for match in matches:
-        # Omitir partidos sin resultados
-        if match.home_goals is None or match.away_goals is None:
-            continue
-        
-        # Determinar si el equipo jugaba como local o visitante
-        if match.home_team_id == team_id:
-            # Equipo jugaba como local
-            stats["home_matches"] += 1
-            stats["goals_for"] += match.home_goals
-            stats["goals_against"] += match.away_goals
-            
-            # Resultado
-            if match.home_goals > match.away_goals:
-                stats["won"] += 1
-                stats["home_wins"] += 1
-            elif match.home_goals < match.away_goals:
-                stats["lost"] += 1
-                stats["home_losses"] += 1
-            else:
-                stats["drawn"] += 1
-                stats["home_draws"] += 1
-            
-            # Portería a cero / No marcar
-            if match.away_goals == 0:
-                stats["clean_sheets"] += 1
-            if match.home_goals == 0:
-                stats["failed_to_score"] += 1
-        else:
-            # Equipo jugaba como visitante
-            stats["away_matches"] += 1
-            stats["goals_for"] += match.away_goals
-            stats["goals_against"] += match.home_goals
-            
-            # Resultado
-            if match.away_goals > match.home_goals:
-                stats["won"] += 1
-                stats["away_wins"] += 1
-            elif match.away_goals < match.home_goals:
-                stats["lost"] += 1
-                stats["away_losses"] += 1
-            else:
-                stats["drawn"] += 1
-                stats["away_draws"] += 1
-            
-            # Portería a cero / No marcar
-            if match.home_goals == 0:
-                stats["clean_sheets"] += 1
-            if match.away_goals == 0:
-                stats["failed_to_score"] += 1
-    
+    played = [Match.home_goals.isnot(None), Match.away_goals.isnot(None)]
+    if league_id is not None:
+        played.append(Match.league_id == league_id)
+
+    sides = union_all(
+        select(
+            Match.home_team_id.label("team_id"),
+            literal(True).label("is_home"),
+            Match.home_goals.label("goals_for"),
+            Match.away_goals.label("goals_against")
+        ).where(Match.home_team_id.in_(team_ids), *played),
+        select(
+            Match.away_team_id,
+            literal(False),
+            Match.away_goals,
+            Match.home_goals
+        ).where(Match.away_team_id.in_(team_ids), *played)
+    ).subquery("sides")
+
+    is_home = sides.c.is_home
+    won = sides.c.goals_for > sides.c.goals_against
+    drawn = sides.c.goals_for == sides.c.goals_against
+    lost = sides.c.goals_for < sides.c.goals_against
+    count_if = lambda *conditions: func.sum(case((and_(*conditions), 1), else_=0))
+
+    return select(
+        sides.c.team_id,
+        count_if(won).label("won"),
+        count_if(drawn).label("drawn"),
+        count_if(lost).label("lost"),
+        func.sum(sides.c.goals_for).label("goals_for"),
+        func.sum(sides.c.goals_against).label("goals_against"),
+        count_if(is_home).label("home_matches"),
+        count_if(~is_home).label("away_matches"),
+        count_if(is_home, won).label("home_wins"),
+        count_if(is_home, drawn).label("home_draws"),
+        count_if(is_home, lost).label("home_losses"),
+        count_if(~is_home, won).label("away_wins"),
+        count_if(~is_home, drawn).label("away_draws"),
+        count_if(~is_home, lost).label("away_losses"),
+        count_if(sides.c.goals_against == 0).label("clean_sheets"),
+        count_if(sides.c.goals_for == 0).label("failed_to_score")
+    ).group_by(sides.c.team_id)
+
+def _finish_team_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Añade totales y porcentajes a los contadores de un equipo"""
     # Calcular totales
     stats["played"] = stats["home_matches"] + stats["away_matches"]
     stats["points"] = stats["won"] * 3 + stats["drawn"]
@@ -225,4 +322,57 @@ def get_team_stats(db: Session, team_id: int):
         stats["goals_for_per_game"] = 0
         stats["goals_against_per_game"] = 0
     
-    return stats
\ No newline at end of file
+    return stats
+
+def get_teams_stats(db: Session, team_ids: List[int], league_id: Optional[int] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    Calcula las estadísticas de varios equipos en una sola consulta
+    
+    Incluye partidos jugados, victorias, empates, derrotas, goles a favor/en
+    contra, etc. Los equipos sin partidos jugados aparecen a cero; los IDs
+    que no existen se omiten.
+    
+    Args:
+        db: Sesión de base de datos
+        team_ids: IDs de los equipos
+        league_id: Limitar las estadísticas a una liga (opcional)
+    
+    Returns:
+        Diccionario {team_id: estadísticas}, en el orden de `team_ids`
+    """
+    team_ids = list(dict.fromkeys(team_ids))
+    if not team_ids:
+        return {}
+    
+    aggregate = team_stats_aggregate(team_ids, league_id).subquery("team_stats")
+    leagues = select(func.count(LeagueTeam.id)).where(LeagueTeam.team_id == Team.id)
+    if league_id is not None:
+        leagues = leagues.where(LeagueTeam.league_id == league_id)
+    
+    rows = db.execute(
+        select(
+            Team.id,
+            *[func.coalesce(aggregate.c[column], 0).label(column) for column in TEAM_STATS_COUNTERS],
+            leagues.scalar_subquery().label("leagues_participated")
+        )
+        .outerjoin(aggregate, aggregate.c.team_id == Team.id)
+        .where(Team.id.in_(team_ids))
+    ).all()
+    
+    by_id = {
+        row.id: _finish_team_stats({
+            **{column: int(getattr(row, column)) for column in TEAM_STATS_COUNTERS},
+            "leagues_participated": row.leagues_participated
+        })
+        for row in rows
+    }
+    return {team_id: by_id[team_id] for team_id in team_ids if team_id in by_id}
+
+def get_team_stats(db: Session, team_id: int, league_id: Optional[int] = None):
+    """
+    Calcula estadísticas globales para un equipo
+    
+    Incluye partidos jugados, victorias, empates, derrotas, goles a favor/en contra, etc.
+    Ver get_teams_stats.
+    """
+    return get_teams_stats(db, [team_id], league_id).get(team_id)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import os
@@ -11,11 +12,20 @@ from .routers import teams, leagues, matches, calendar, templates, analytics
 # Crear las tablas en la base de datos si no existen
 Base.metadata.create_all(bind=engine)
 
+from .services.simulation import shutdown_process_pool
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Cerrar el pool de procesos de las proyecciones al apagar
+    shutdown_process_pool()
+
 # Crear la aplicación
 app = FastAPI(
     title="Simulador de Torneo de Fútbol",
     description="API para simular y gestionar un torneo de fútbol con estadísticas avanzadas",
-    version="0.2.0"
+    version="0.2.0",
+    lifespan=lifespan
 )
 
 # Configuración CORS
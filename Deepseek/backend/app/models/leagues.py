@@ -125,12 +125,14 @@ class SimulationRequest(BaseModel):
     teams: List[int]
     jornadas: Optional[int] = None
     auto_schedule: Optional[bool] = False
+    empirical_tactics: Optional[bool] = False  # Usar tácticas calibradas con partidos reales
     
     class Config:
         schema_extra = {
             "example": {
                 "teams": [1, 2, 3, 4, 5, 6],
                 "jornadas": 10,
-                "auto_schedule": True
+                "auto_schedule": True,
+                "empirical_tactics": False
             }
         }
\ No newline at end of file
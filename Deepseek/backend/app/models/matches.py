@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime, date
 from ..models.teams import Team as TeamModel  # Modelo Pydantic para equipos
+from ..models.teams import BatchItemError
 
 class MatchBase(BaseModel):
     jornada: int
@@ -119,4 +120,22 @@ class BatchMatchUpdate(BaseModel):
                     "away_possession": 45
                 }
             }
-        }
\ No newline at end of file
+        }
+
+class BatchMatchUpdateResult(BaseModel):
+    updated: List[int]
+    calendar_entries_played: int
+    errors: List[BatchItemError]
+
+class ResultRowError(BaseModel):
+    line: int
+    detail: str
+
+class ResultsIngestSummary(BaseModel):
+    records: int
+    updated: int
+    calendar_entries_played: int
+    batches: int
+    errors_count: int
+    errors: List[ResultRowError]
+    elapsed_seconds: float
@@ -57,4 +57,14 @@ class TeamBatchUpdate(BaseModel):
                     "clan": "ClubA"
                 }
             }
-        }
\ No newline at end of file
+        }
+
+class BatchItemError(BaseModel):
+    index: Optional[int] = None  # Posición del elemento en la petición
+    id: Optional[int] = None
+    name: Optional[str] = None
+    detail: str
+
+class TeamBatchResult(BaseModel):
+    teams: List[Team]
+    errors: List[BatchItemError]
@@ -28,19 +28,23 @@ router = APIRouter(
 def get_league_calendar(
     league_id: int, 
     jornada: Optional[int] = None,
+    jornada_from: Optional[int] = Query(None, ge=1, description="Primera jornada a incluir"),
+    jornada_to: Optional[int] = Query(None, ge=1, description="Última jornada a incluir"),
     db: Session = Depends(get_db)
 ):
     """
     Obtiene el calendario completo de una liga con detalles de los partidos
     
-    Opcionalmente, se puede filtrar por jornada
+    Opcionalmente, se puede filtrar por jornada o pedir una ventana de
+    jornadas (`jornada_from`..`jornada_to`) para cargar el calendario por partes
     """
-    # Verificar que la liga existe
-    league = leagues_crud.get_league(db, league_id)
-    if not league:
-        raise HTTPException(status_code=404, detail="Liga no encontrada")
+    if jornada_from is not None and jornada_to is not None and jornada_from > jornada_to:
+        raise HTTPException(status_code=400, detail="jornada_from no puede ser mayor que jornada_to")
     
-    calendar_data = calendar_crud.get_calendar_with_match_details(db, league_id, jornada)
+    # Una sola consulta; devuelve None si la liga no existe
+    calendar_data = calendar_crud.get_calendar_with_match_details(db, league_id, jornada, jornada_from, jornada_to)
+    if calendar_data is None:
+        raise HTTPException(status_code=404, detail="Liga no encontrada")
     return calendar_data
 
 @router.post("/entries", response_model=CalendarEntry)
@@ -211,8 +215,23 @@ def sync_league_calendar(league_id: int, db: Session = Depends(get_db)):
     if not league:
         raise HTTPException(status_code=404, detail="Liga no encontrada")
     
-    success = calendar_crud.synchronize_calendar_with_matches(db, league_id)
-    if not success:
-        raise HTTPException(status_code=400, detail="Error al sincronizar el calendario")
+    updated = calendar_crud.synchronize_calendar_with_matches(db, league_id)
     
-    return {"detail": "Calendario sincronizado correctamente"}
\ No newline at end of file
+    return {
+        "detail": "Calendario sincronizado correctamente",
+        "updated_entries": updated
+    }
+
+@router.post("/sync")
+def sync_all_calendars(db: Session = Depends(get_db)):
+    """
+    Sincroniza el estado 'is_played' del calendario de todas las ligas activas
+    
+    Pensado para el mantenimiento nocturno: se ejecuta como una sola sentencia
+    """
+    updated = calendar_crud.synchronize_calendar_with_matches(db)
+    
+    return {
+        "detail": "Calendarios sincronizados correctamente",
+        "updated_entries": updated
+    }
\ No newline at end of file
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 from datetime import datetime
@@ -7,10 +8,16 @@ from ..database import get_db
 from ..models.leagues import LeagueCreate, LeagueUpdate, LeagueWithDetails, League, SimulationRequest, LeagueTeamCreate
 from ..schemas.teams import Team
 from ..models.teams import Team as TeamModel  # Renombra para evitar conflictos
+from ..models.matches import ResultsIngestSummary
 from ..schemas.leagues import TipoLiga
 from ..crud import leagues as leagues_crud
 from ..crud import matches as matches_crud
-from ..services.simulation import TournamentSimulator
+from ..crud import standings as standings_crud
+from ..crud import counters as counters_crud
+from ..crud import tactics as tactics_crud
+from ..services.simulation import TournamentSimulator, MatchSimulator, available_workers
+from ..services.purge import purge_jobs, DEFAULT_CHUNK_SIZE
+from ..utils.ingest import ingest_result_stream
 
 router = APIRouter(
     prefix="/leagues",
@@ -48,6 +55,39 @@ def get_manager_leagues(manager_id: str, active_only: bool = False, db: Session
     """
     return leagues_crud.get_manager_leagues(db, manager_id, active_only=active_only)
 
+@router.get("/purge-jobs/{job_id}")
+def get_league_purge_job(job_id: str):
+    """
+    Progreso de un borrado de liga en segundo plano
+    
+    El estado de los trabajos se guarda en memoria en cada proceso: solo lo
+    conoce el proceso que recibió el borrado (con varios workers la consulta
+    puede devolver 404) y se pierde al reiniciar. Los trabajos terminados se
+    olvidan pasada una hora.
+    """
+    job = purge_jobs.get(job_id)
+    if not job or job["kind"] != "league":
+        raise HTTPException(status_code=404, detail="Purge job not found")
+    return job
+
+@router.get("/counters/check")
+def check_league_counters(league_id: Optional[int] = None, db: Session = Depends(get_db)):
+    """
+    Compara matches_count y teams_count con los conteos reales
+    
+    Devuelve las ligas cuyos contadores mantenidos no coinciden
+    """
+    mismatches = counters_crud.verify_league_counters(db, [league_id] if league_id is not None else None)
+    return {"consistent": not mismatches, "mismatches": mismatches}
+
+@router.post("/counters/recount")
+def recount_league_counters(league_id: Optional[int] = None, db: Session = Depends(get_db)):
+    """
+    Recalcula los contadores de las ligas que no coinciden con los conteos reales
+    """
+    corrected = counters_crud.recount_league_counters(db, league_id)
+    return {"detail": "League counters recounted successfully", "corrected": corrected}
+
 @router.get("/{league_id}", response_model=LeagueWithDetails)
 def read_league(league_id: int, db: Session = Depends(get_db)):
     """
@@ -70,10 +110,28 @@ def update_league(league_id: int, league_data: LeagueUpdate, db: Session = Depen
     return updated_league
 
 @router.delete("/{league_id}")
-def delete_league(league_id: int, db: Session = Depends(get_db)):
+def delete_league(
+    league_id: int,
+    background_tasks: BackgroundTasks,
+    mode: str = Query("sync", pattern="^(sync|background)$"),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=100000),
+    db: Session = Depends(get_db)
+):
     """
     Elimina una liga y todos sus registros relacionados
+    
+    - **mode**: `sync` borra en esta petición (ON DELETE CASCADE); `background`
+      borra los partidos por lotes de `chunk_size` en segundo plano y devuelve
+      un `job_id` para consultar el progreso en `/leagues/purge-jobs/{job_id}`
+      (el estado del trabajo solo lo conoce este proceso)
     """
+    if mode == "background":
+        if not leagues_crud.get_league(db, league_id):
+            raise HTTPException(status_code=404, detail="League not found")
+        job = purge_jobs.create("league", league_id, chunk_size)
+        background_tasks.add_task(purge_jobs.run, job["job_id"])
+        return {"detail": "League deletion scheduled", **job}
+    
     success = leagues_crud.delete_league(db, league_id)
     if not success:
         raise HTTPException(status_code=404, detail="League not found")
@@ -152,8 +210,10 @@ def simulate_league(league_id: int, request: SimulationRequest, db: Session = De
     if len(request.teams) < 2:
         raise HTTPException(status_code=400, detail="Se necesitan al menos 2 equipos para simular una liga")
     
-    # Crear simulador
-    simulator = TournamentSimulator()
+    # Crear simulador (opcionalmente con tácticas calibradas con partidos reales)
+    # Sin datos de calibración se usan las probabilidades fijas del simulador
+    tactic_sampler = tactics_crud.get_tactic_sampler(db) if request.empirical_tactics else None
+    simulator = TournamentSimulator(tactic_sampler=tactic_sampler)
     
     # Simular liga
     simulated_matches = leagues_crud.simulate_league(db, league_id, simulator)
@@ -163,20 +223,106 @@ def simulate_league(league_id: int, request: SimulationRequest, db: Session = De
     
     return {
         "detail": f"Liga simulada con {len(simulated_matches)} partidos",
-        "simulated_matches": len(simulated_matches)
+        "simulated_matches": len(simulated_matches),
+        "empirical_tactics": tactic_sampler is not None
     }
 
 @router.get("/{league_id}/standings")
-def get_league_standings(league_id: int, db: Session = Depends(get_db)):
+def get_league_standings(
+    league_id: int,
+    top: Optional[int] = Query(None, ge=1, description="Devolver solo las N primeras posiciones"),
+    db: Session = Depends(get_db)
+):
     """
     Obtiene la tabla de posiciones de una liga
+    
+    Se lee de la clasificación persistida (`league_standings`), que se
+    mantiene con cada resultado escrito. El orden y el límite `top` se
+    aplican en SQL
+    """
+    if not leagues_crud.league_exists(db, league_id):
+        raise HTTPException(status_code=404, detail="League not found")
+    
+    return standings_crud.get_league_standings(db, league_id, top=top)
+
+@router.post("/{league_id}/standings/rebuild")
+def rebuild_league_standings(league_id: int, db: Session = Depends(get_db)):
+    """
+    Reconstruye la clasificación persistida de una liga desde sus partidos
+    """
+    if not leagues_crud.league_exists(db, league_id):
+        raise HTTPException(status_code=404, detail="League not found")
+    
+    rows = standings_crud.rebuild_league_standings(db, league_id)
+    return {"detail": "Standings rebuilt successfully", "rows": rows}
+
+@router.get("/{league_id}/projections")
+def get_league_projections(
+    league_id: int,
+    runs: int = Query(1000, ge=1, le=1000000),
+    workers: int = Query(1, ge=1),
+    seed: Optional[int] = None,
+    model: str = Query("simulator", pattern="^(simulator|poisson)$"),
+    db: Session = Depends(get_db)
+):
+    """
+    Proyecta la clasificación final de una liga simulando los partidos pendientes
+    
+    - **runs**: Número de temporadas simuladas (Monte Carlo)
+    - **workers**: Número de procesos para repartir las simulaciones
+    - **seed**: Semilla para reproducir la proyección con el mismo número de procesos
+    - **model**: `simulator` (modelo de tiros y conversión, con fortalezas según
+      el valor de mercado de los equipos) o `poisson` (modelo
+      Poisson/Dixon-Coles ajustado con los resultados de la liga)
     """
     league = leagues_crud.get_league(db, league_id)
     if not league:
         raise HTTPException(status_code=404, detail="League not found")
     
-    standings = leagues_crud.calculate_league_standings(db, league_id)
-    return standings
+    projections = leagues_crud.calculate_league_projections(
+        db,
+        league_id,
+        TournamentSimulator(),
+        runs=runs,
+        workers=min(workers, available_workers()),
+        seed=seed,
+        model=model
+    )
+    if not projections:
+        raise HTTPException(status_code=400, detail="La liga no tiene equipos para proyectar")
+    
+    return projections
+
+@router.get("/{league_id}/predictions")
+def get_league_predictions(
+    league_id: int,
+    include_matrix: bool = False,
+    model: str = Query("simulator", pattern="^(simulator|poisson)$"),
+    db: Session = Depends(get_db)
+):
+    """
+    Obtiene las probabilidades exactas de resultado de los partidos pendientes
+    
+    - **include_matrix**: Incluir la matriz completa de probabilidades de marcador
+    - **model**: `simulator` o `poisson` (igual que en las proyecciones)
+    """
+    league = leagues_crud.get_league(db, league_id)
+    if not league:
+        raise HTTPException(status_code=404, detail="League not found")
+    
+    fixtures = leagues_crud.calculate_fixture_probabilities(
+        db,
+        league_id,
+        MatchSimulator(),
+        include_matrix=include_matrix,
+        model=model
+    )
+    
+    return {
+        "league_id": league_id,
+        "model": model,
+        "fixtures": fixtures
+    }
 
 @router.get("/{league_id}/matches")
 def get_league_matches(
@@ -193,6 +339,40 @@ def get_league_matches(
     
     return matches_crud.get_league_matches(db, league_id, jornada)
 
+@router.post("/{league_id}/results", response_model=ResultsIngestSummary)
+async def ingest_league_results(
+    league_id: int,
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(ndjson|csv)$"),
+    batch_size: int = Query(500, ge=1, le=10000),
+    db: Session = Depends(get_db)
+):
+    """
+    Aplica en bloque resultados reales enviados como NDJSON o CSV
+    
+    Cada registro identifica el partido por `match_id` o por `jornada`,
+    `home_team_id` y `away_team_id`, e incluye cualquier campo de resultado
+    (`home_goals` y `away_goals`, que van siempre juntos, posesión, disparos,
+    faltas...). El cuerpo se lee de forma incremental y se aplica en
+    transacciones de `batch_size` resultados que también marcan como jugado
+    el calendario de los partidos que quedan con resultado.
+    
+    - **format**: `ndjson` o `csv`; por defecto se deduce del Content-Type
+    """
+    league_exists = await run_in_threadpool(leagues_crud.league_exists, db, league_id)
+    if not league_exists:
+        raise HTTPException(status_code=404, detail="League not found")
+    
+    if format is None:
+        format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    
+    return await ingest_result_stream(
+        request.stream(),
+        format,
+        lambda batch: matches_crud.apply_league_results(db, league_id, batch),
+        batch_size=batch_size
+    )
+
 @router.post("/{league_id}/update-podium")
 def update_league_podium(league_id: int, db: Session = Depends(get_db)):
     """
@@ -5,7 +5,7 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from ..database import get_db
-from ..models.matches import MatchCreate, MatchUpdate, Match
+from ..models.matches import MatchCreate, MatchUpdate, Match, BatchMatchUpdate, BatchMatchUpdateResult
 from ..crud import matches as matches_crud
 from ..crud import leagues as leagues_crud
 
@@ -51,6 +51,24 @@ def read_matches(
     """
     return matches_crud.get_matches(db, jornada=jornada, league_id=league_id, skip=skip, limit=limit)
 
+@router.patch("/batch", response_model=BatchMatchUpdateResult)
+def update_matches_batch(batch: BatchMatchUpdate, db: Session = Depends(get_db)):
+    """
+    Aplica los mismos cambios a varios partidos en una sola transacción
+    
+    Si se actualizan goles (`home_goals` y `away_goals` van siempre juntos),
+    las entradas del calendario de esos partidos se marcan como jugadas en la
+    misma transacción. Los IDs que no existen se devuelven en `errors`
+    """
+    if not batch.match_ids:
+        raise HTTPException(status_code=400, detail="No se han enviado partidos")
+    
+    # Un solo gol dejaría los partidos a medio puntuar
+    if (batch.data.home_goals is None) != (batch.data.away_goals is None):
+        raise HTTPException(status_code=400, detail="Se necesitan home_goals y away_goals juntos")
+    
+    return matches_crud.update_matches_batch(db, batch.match_ids, batch.data)
+
 @router.get("/{match_id}", response_model=Match)
 def read_match(match_id: int, db: Session = Depends(get_db)):
     """
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from typing import List, Optional
 from sqlalchemy.orm import Session
 
 from ..database import get_db
-from ..models.teams import TeamCreate, TeamUpdate, Team
+from ..models.teams import TeamCreate, TeamUpdate, Team, TeamBatchCreate, TeamBatchUpdate, TeamBatchResult
 from ..crud import teams as teams_crud
+from ..services.purge import purge_jobs, DEFAULT_CHUNK_SIZE
 
 router = APIRouter(
     prefix="/teams",
@@ -12,6 +13,9 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Equipos por petición en /teams/stats
+MAX_STATS_TEAMS = 100
+
 @router.post("/", response_model=Team)
 def create_team(team: TeamCreate, db: Session = Depends(get_db)):
     """
@@ -38,6 +42,73 @@ def read_teams(
     """
     return teams_crud.get_teams(db, skip=skip, limit=limit, manager_id=manager_id, clan=clan)
 
+@router.post("/batch", response_model=TeamBatchResult)
+def create_teams_batch(batch: TeamBatchCreate, db: Session = Depends(get_db)):
+    """
+    Crea varios equipos en una sola transacción
+    
+    Los equipos cuyo nombre ya existe se devuelven en `errors` sin afectar al resto
+    """
+    if not batch.teams:
+        raise HTTPException(status_code=400, detail="No se han enviado equipos")
+    
+    return teams_crud.create_teams_batch(db, batch.teams)
+
+@router.patch("/batch", response_model=TeamBatchResult)
+def update_teams_batch(batch: TeamBatchUpdate, db: Session = Depends(get_db)):
+    """
+    Aplica los mismos cambios a varios equipos en una sola transacción
+    
+    Los IDs que no existen se devuelven en `errors`
+    """
+    if not batch.team_ids:
+        raise HTTPException(status_code=400, detail="No se han enviado equipos")
+    
+    return teams_crud.update_teams_batch(db, batch.team_ids, batch.data)
+
+@router.get("/purge-jobs/{job_id}")
+def get_team_purge_job(job_id: str):
+    """
+    Progreso de un borrado de equipo en segundo plano
+    
+    El estado de los trabajos se guarda en memoria en cada proceso: solo lo
+    conoce el proceso que recibió el borrado (con varios workers la consulta
+    puede devolver 404) y se pierde al reiniciar. Los trabajos terminados se
+    olvidan pasada una hora.
+    """
+    job = purge_jobs.get(job_id)
+    if not job or job["kind"] != "team":
+        raise HTTPException(status_code=404, detail="Trabajo de borrado no encontrado")
+    return job
+
+@router.get("/stats")
+def get_teams_stats(
+    ids: str = Query(..., description="IDs de los equipos separados por comas, p. ej. 1,2,3"),
+    league_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Obtiene las estadísticas de varios equipos en una sola consulta
+    
+    - **ids**: IDs separados por comas (como máximo `MAX_STATS_TEAMS`)
+    - **league_id**: limita las estadísticas a los partidos de esa liga
+    """
+    try:
+        team_ids = list(dict.fromkeys(int(team_id) for team_id in ids.split(",") if team_id.strip()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Los IDs deben ser enteros separados por comas")
+    
+    if not team_ids:
+        raise HTTPException(status_code=400, detail="No se han enviado equipos")
+    if len(team_ids) > MAX_STATS_TEAMS:
+        raise HTTPException(status_code=400, detail=f"Como máximo {MAX_STATS_TEAMS} equipos por petición")
+    
+    stats = teams_crud.get_teams_stats(db, team_ids, league_id)
+    return {
+        "teams": [{"team_id": team_id, **team_stats} for team_id, team_stats in stats.items()],
+        "not_found": [team_id for team_id in team_ids if team_id not in stats]
+    }
+
 @router.get("/{team_id}", response_model=Team)
 def read_team(team_id: int, db: Session = Depends(get_db)):
     """
@@ -67,14 +138,30 @@ def update_team(team_id: int, team_data: TeamUpdate, db: Session = Depends(get_d
     return updated_team
 
 @router.delete("/{team_id}")
-def delete_team(team_id: int, db: Session = Depends(get_db)):
+def delete_team(
+    team_id: int,
+    background_tasks: BackgroundTasks,
+    mode: str = Query("sync", pattern="^(sync|background)$"),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=1, le=100000),
+    db: Session = Depends(get_db)
+):
     """
     Elimina un equipo
+    
+    - **mode**: `sync` borra en esta petición (ON DELETE CASCADE); `background`
+      borra sus partidos por lotes de `chunk_size` en segundo plano y devuelve
+      un `job_id` para consultar el progreso en `/teams/purge-jobs/{job_id}`
+      (el estado del trabajo solo lo conoce este proceso)
     """
     db_team = teams_crud.get_team(db, team_id)
     if not db_team:
         raise HTTPException(status_code=404, detail="Equipo no encontrado")
     
+    if mode == "background":
+        job = purge_jobs.create("team", team_id, chunk_size)
+        background_tasks.add_task(purge_jobs.run, job["job_id"])
+        return {"detail": "Borrado del equipo programado", **job}
+    
     success = teams_crud.delete_team(db, team_id)
     return {"detail": "Equipo eliminado correctamente"}
 
@@ -103,13 +190,15 @@ def get_team_matches(team_id: int, db: Session = Depends(get_db)):
     return matches
 
 @router.get("/{team_id}/stats")
-def get_team_stats(team_id: int, db: Session = Depends(get_db)):
+def get_team_stats(team_id: int, league_id: Optional[int] = None, db: Session = Depends(get_db)):
     """
     Obtiene estadísticas globales de un equipo
+    
+    Con `league_id` solo se cuentan los partidos de esa liga
     """
     db_team = teams_crud.get_team(db, team_id)
     if not db_team:
         raise HTTPException(status_code=404, detail="Equipo no encontrado")
     
-    stats = teams_crud.get_team_stats(db, team_id)
+    stats = teams_crud.get_team_stats(db, team_id, league_id)
     return stats
\ No newline at end of file
@@ -4,4 +4,5 @@ from .teams import Team
 from .leagues import League, LeagueTeam, TipoLiga
 from .matches import Match
 from .statistics import LeagueStatistics
-from .calendar import Calendar
\ No newline at end of file
+from .calendar import Calendar
+from .standings import LeagueStanding
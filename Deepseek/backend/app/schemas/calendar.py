@@ -1,6 +1,6 @@
 # backend/app/schemas/calendar.py
 
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -8,11 +8,15 @@ from ..database import Base
 
 class Calendar(Base):
     __tablename__ = "calendar"
+    __table_args__ = (
+        # Calendario de una liga ordenado por jornada
+        Index("ix_calendar_league_jornada", "league_id", "jornada"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    league_id = Column(Integer, ForeignKey("leagues.id"), index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), index=True)
     jornada = Column(Integer, index=True)
-    match_id = Column(Integer, ForeignKey("matches.id"), nullable=True, unique=True)
+    match_id = Column(Integer, ForeignKey("matches.id", ondelete="CASCADE"), nullable=True, unique=True)
     scheduled_date = Column(DateTime, nullable=True)
     scheduled_time = Column(String, nullable=True)
     venue = Column(String, nullable=True)
@@ -1,6 +1,6 @@
 # app/schemas/leagues.py
 
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, DateTime, Float, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, DateTime, Float, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -32,27 +32,29 @@ class League(Base):
     created_at = Column(DateTime, server_default=func.now())
     
     # Estadísticas de valor de equipos
-    highest_value_team_id = Column(Integer, ForeignKey("teams.id"), nullable=True)
-    lowest_value_team_id = Column(Integer, ForeignKey("teams.id"), nullable=True)
+    highest_value_team_id = Column(Integer, ForeignKey("teams.id", ondelete="SET NULL"), nullable=True)
+    lowest_value_team_id = Column(Integer, ForeignKey("teams.id", ondelete="SET NULL"), nullable=True)
     avg_team_value = Column(Float, nullable=True)
     value_difference = Column(Float, nullable=True)
     
     # Campos para contar (calculados dinámicamente)
-    matches_count = Column(Integer, default=0)
-    teams_count = Column(Integer, default=0)
+    # Contadores mantenidos en la misma transacción que las altas y bajas
+    # (ver crud/counters.py)
+    matches_count = Column(Integer, default=0, server_default="0")
+    teams_count = Column(Integer, default=0, server_default="0")
     
     # Podium (winners)
-    winner_id = Column(Integer, ForeignKey("teams.id"), nullable=True)
-    runner_up_id = Column(Integer, ForeignKey("teams.id"), nullable=True)
-    third_place_id = Column(Integer, ForeignKey("teams.id"), nullable=True)
+    winner_id = Column(Integer, ForeignKey("teams.id", ondelete="SET NULL"), nullable=True)
+    runner_up_id = Column(Integer, ForeignKey("teams.id", ondelete="SET NULL"), nullable=True)
+    third_place_id = Column(Integer, ForeignKey("teams.id", ondelete="SET NULL"), nullable=True)
     
     # Calendario generado
     calendar_generated = Column(Boolean, default=False)
     
     # Relationships
-    matches = relationship("Match", back_populates="league")
-    league_teams = relationship("LeagueTeam", back_populates="league")
-    calendar_entries = relationship("Calendar", back_populates="league")
+    matches = relationship("Match", back_populates="league", passive_deletes=True)
+    league_teams = relationship("LeagueTeam", back_populates="league", passive_deletes=True)
+    calendar_entries = relationship("Calendar", back_populates="league", passive_deletes=True)
     
     # Podium relationships
     winner = relationship("Team", back_populates="winner_of_leagues", foreign_keys=[winner_id])
@@ -64,16 +66,20 @@ class League(Base):
     lowest_value_team = relationship("Team", foreign_keys=[lowest_value_team_id], back_populates="lowest_value_in_leagues")
     
     # Statistics
-    statistics = relationship("LeagueStatistics", back_populates="league", uselist=False)
+    statistics = relationship("LeagueStatistics", back_populates="league", uselist=False, passive_deletes=True)
 
 
 # League-Team relationship
 class LeagueTeam(Base):
     __tablename__ = "league_teams"
+    __table_args__ = (
+        # Comprobaciones de pertenencia de un equipo a una liga
+        Index("ix_league_teams_league_team", "league_id", "team_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    league_id = Column(Integer, ForeignKey("leagues.id"), index=True)
-    team_id = Column(Integer, ForeignKey("teams.id"), index=True)
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), index=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), index=True)
     registration_date = Column(DateTime, server_default=func.now())
     
     # Relationships
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -6,12 +6,25 @@ from ..database import Base
 
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        # Partidos de una liga por jornada
+        Index("ix_matches_league_jornada", "league_id", "jornada"),
+        # Partidos de un equipo (OR local/visitante) y borrados en cascada
+        Index("ix_matches_home_team_id", "home_team_id"),
+        Index("ix_matches_away_team_id", "away_team_id"),
+        # Clasificación: solo partidos jugados, con los resultados incluidos
+        Index(
+            "ix_matches_league_played", "league_id",
+            postgresql_include=["home_team_id", "away_team_id", "home_goals", "away_goals"],
+            postgresql_where=text("home_goals IS NOT NULL AND away_goals IS NOT NULL")
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     jornada = Column(Integer)
-    home_team_id = Column(Integer, ForeignKey("teams.id"))
-    away_team_id = Column(Integer, ForeignKey("teams.id"))
-    league_id = Column(Integer, ForeignKey("leagues.id"), index=True)
+    home_team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"))
+    away_team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"))
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), index=True)
     date = Column(DateTime, nullable=True)
     time = Column(String, nullable=True)
     
@@ -45,4 +58,4 @@ class Match(Base):
     home_team = relationship("Team", back_populates="home_matches", foreign_keys=[home_team_id])
     away_team = relationship("Team", back_populates="away_matches", foreign_keys=[away_team_id])
     league = relationship("League", back_populates="matches")
-    calendar_entry = relationship("Calendar", back_populates="match", uselist=False)
\ No newline at end of file
+    calendar_entry = relationship("Calendar", back_populates="match", uselist=False, passive_deletes=True)
\ No newline at end of file
@@ -0,0 +1,32 @@
+# app/schemas/standings.py
+
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
+from sqlalchemy.sql import func
+from datetime import datetime
+
+from ..database import Base
+
+class LeagueStanding(Base):
+    """
+    Tabla de clasificación persistida (modelo de lectura)
+
+    Se mantiene de forma incremental con cada resultado escrito y se puede
+    reconstruir desde los partidos con crud.standings.rebuild_league_standings.
+    """
+    __tablename__ = "league_standings"
+    __table_args__ = (
+        # Lectura de la tabla ya ordenada por puntos, diferencia y goles a favor
+        Index("ix_league_standings_ranking", "league_id", "points", "goal_difference", "goals_for"),
+    )
+
+    league_id = Column(Integer, ForeignKey("leagues.id", ondelete="CASCADE"), primary_key=True)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), primary_key=True)
+    played = Column(Integer, nullable=False, default=0, server_default="0")
+    won = Column(Integer, nullable=False, default=0, server_default="0")
+    drawn = Column(Integer, nullable=False, default=0, server_default="0")
+    lost = Column(Integer, nullable=False, default=0, server_default="0")
+    goals_for = Column(Integer, nullable=False, default=0, server_default="0")
+    goals_against = Column(Integer, nullable=False, default=0, server_default="0")
+    goal_difference = Column(Integer, nullable=False, default=0, server_default="0")
+    points = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, default=datetime.now, server_default=func.now(), onupdate=datetime.now)
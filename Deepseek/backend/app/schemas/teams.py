@@ -16,9 +16,9 @@ class Team(Base):
     value = Column(String, nullable=True)  
     
     # Relationships
-    home_matches = relationship("Match", back_populates="home_team", foreign_keys="[Match.home_team_id]")
-    away_matches = relationship("Match", back_populates="away_team", foreign_keys="[Match.away_team_id]")
-    league_teams = relationship("LeagueTeam", back_populates="team")
+    home_matches = relationship("Match", back_populates="home_team", foreign_keys="[Match.home_team_id]", passive_deletes=True)
+    away_matches = relationship("Match", back_populates="away_team", foreign_keys="[Match.away_team_id]", passive_deletes=True)
+    league_teams = relationship("LeagueTeam", back_populates="team", passive_deletes=True)
     
     # League podium relationships
     winner_of_leagues = relationship("League", back_populates="winner", foreign_keys="[League.winner_id]")
@@ -1,3 +1,24 @@
 # Archivo: services/__init__.py
-from .simulation import MatchSimulator, TournamentSimulator
-from .template_loader import LeagueTemplateLoader
\ No newline at end of file
+# Las exportaciones se importan al usarse: los módulos de cálculo (simulación,
+# tácticas, fuerza, clasificación) no dependen de la base de datos y así se
+# pueden importar sin DATABASE_URL
+from importlib import import_module
+
+_EXPORTS = {
+    "MatchSimulator": ".simulation",
+    "TournamentSimulator": ".simulation",
+    "LeagueTemplateLoader": ".template_loader",
+    "TacticSampler": ".tactics",
+    "PoissonStrengthModel": ".strength",
+    "strength_model_cache": ".strength",
+    "PurgeJobRegistry": ".purge",
+    "purge_jobs": ".purge",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_EXPORTS[name], __name__), name)
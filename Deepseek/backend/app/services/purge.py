@@ -0,0 +1,190 @@
+# app/services/purge.py
+
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Callable
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from ..crud import standings as standings_crud
+from ..crud import counters as counters_crud
+from ..schemas.leagues import League, LeagueTeam
+from ..schemas.matches import Match
+from ..schemas.teams import Team
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Los trabajos terminados se olvidan pasado este tiempo o si se acumulan más de MAX_FINISHED_JOBS
+FINISHED_JOB_TTL = timedelta(hours=1)
+MAX_FINISHED_JOBS = 1000
+
+
+def _delete_matches_chunk(db: Session, condition, chunk_size: int, update_league: bool = True) -> int:
+    """
+    Borra como máximo `chunk_size` partidos que cumplan la condición
+
+    El calendario cae en cascada y, si se indica, sus resultados se descuentan
+    de la clasificación persistida y de los contadores de la liga en la misma
+    transacción.
+    """
+    ids = select(Match.id).where(condition).limit(chunk_size).scalar_subquery()
+    removed = db.execute(
+        delete(Match).where(Match.id.in_(ids)).returning(
+            Match.league_id, Match.home_team_id, Match.away_team_id, Match.home_goals, Match.away_goals
+        ),
+        execution_options={"synchronize_session": False}
+    ).all()
+    if update_league:
+        standings_crud.apply_result_changes(db, removed=removed)
+        counters_crud.adjust_league_counters(
+            db, matches=counters_crud.count_by_league([row.league_id for row in removed], -1)
+        )
+    return len(removed)
+
+
+class PurgeJobRegistry:
+    """
+    Registro en memoria de borrados en segundo plano
+
+    Cada trabajo borra por lotes acotados, con un commit por lote, de modo
+    que ningún bloqueo dura más que un lote y el progreso queda visible en
+    `get(job_id)` mientras el trabajo avanza.
+
+    El registro es propio de cada proceso: con varios workers el estado de un
+    trabajo solo lo conoce el proceso que lo ejecuta. Los trabajos terminados
+    se conservan `finished_ttl` y como mucho `max_finished` a la vez (se
+    descartan primero los más antiguos); los pendientes no se descartan.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        finished_ttl: timedelta = FINISHED_JOB_TTL,
+        max_finished: int = MAX_FINISHED_JOBS
+    ):
+        self.session_factory = session_factory
+        self.finished_ttl = finished_ttl
+        self.max_finished = max_finished
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _evict_finished(self):
+        """Olvida los trabajos terminados caducados o que exceden el máximo (con el cerrojo tomado)"""
+        finished = sorted(
+            (job["finished_at"], job_id) for job_id, job in self._jobs.items() if job["finished_at"] is not None
+        )
+        expired_before = datetime.now() - self.finished_ttl
+        excess = len(finished) - self.max_finished
+        for position, (finished_at, job_id) in enumerate(finished):
+            if finished_at < expired_before or position < excess:
+                del self._jobs[job_id]
+
+    def create(self, kind: str, target_id: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, Any]:
+        """Registra un trabajo pendiente de tipo `league` o `team`"""
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "kind": kind,
+            "target_id": target_id,
+            "chunk_size": chunk_size,
+            "status": "pending",
+            "total_matches": None,
+            "deleted_matches": 0,
+            "chunks": 0,
+            "progress": 0.0,
+            "error": None,
+            "created_at": datetime.now(),
+            "finished_at": None
+        }
+        with self._lock:
+            self._evict_finished()
+            self._jobs[job["job_id"]] = job
+        return dict(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._evict_finished()
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            self._jobs[job_id].update(fields)
+
+    def run(self, job_id: str):
+        """Ejecuta un trabajo registrado (pensado para BackgroundTasks)"""
+        job = self.get(job_id)
+        db = self.session_factory()
+        try:
+            self._update(job_id, status="running")
+            if job["kind"] == "league":
+                self._purge_league(db, job)
+            else:
+                self._purge_team(db, job)
+            self._update(job_id, status="completed", progress=1.0, finished_at=datetime.now())
+        except Exception as e:
+            db.rollback()
+            self._update(job_id, status="failed", error=str(e), finished_at=datetime.now())
+        finally:
+            db.close()
+
+    def _purge_matches(self, db: Session, job: Dict[str, Any], *conditions):
+        """
+        Borra los partidos por lotes y publica el progreso tras cada commit
+
+        Cada condición se agota por separado para que cada lote use un
+        predicado simple en lugar de un OR.
+        """
+        total = db.scalar(select(func.count(Match.id)).where(or_(*conditions))) or 0
+        self._update(job["job_id"], total_matches=total)
+
+        deleted = 0
+        chunks = 0
+        for condition in conditions:
+            while True:
+                # La clasificación y los contadores de una liga que se borra entera desaparecen con ella
+                count = _delete_matches_chunk(db, condition, job["chunk_size"], job["kind"] != "league")
+                db.commit()
+                if count == 0:
+                    break
+                deleted += count
+                chunks += 1
+                self._update(
+                    job["job_id"],
+                    deleted_matches=deleted,
+                    chunks=chunks,
+                    progress=min(deleted / total, 1.0) if total else 1.0
+                )
+
+    def _purge_league(self, db: Session, job: Dict[str, Any]):
+        league_id = job["target_id"]
+
+        # Ocultar la liga de los listados de ligas activas mientras se borra
+        db.execute(update(League).where(League.id == league_id).values(active=False))
+        db.commit()
+
+        self._purge_matches(db, job, Match.league_id == league_id)
+
+        # Calendario, equipos inscritos y estadísticas caen en cascada
+        db.execute(delete(League).where(League.id == league_id))
+        db.commit()
+
+    def _purge_team(self, db: Session, job: Dict[str, Any]):
+        team_id = job["target_id"]
+
+        self._purge_matches(db, job, Match.home_team_id == team_id, Match.away_team_id == team_id)
+
+        # Inscripciones explícitas para ajustar los contadores; podios y
+        # extremos de valor a NULL en cascada
+        left_leagues = db.scalars(
+            delete(LeagueTeam).where(LeagueTeam.team_id == team_id).returning(LeagueTeam.league_id)
+        ).all()
+        counters_crud.adjust_league_counters(db, teams=counters_crud.count_by_league(left_leagues, -1))
+        db.execute(delete(Team).where(Team.id == team_id))
+        db.commit()
+
+
+# Registro global de trabajos de borrado
+purge_jobs = PurgeJobRegistry()
@@ -1,13 +1,217 @@
+import os
 import random
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+import time
+import multiprocessing
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Any, Optional, Tuple, Sequence, Union, Mapping, Iterator
 from datetime import datetime
 
+import numpy as np
+
+from .tactics import TacticSampler
+from .strength import PoissonStrengthModel
+from .standings import Standings, compute_standings, rank_standings, positions_from_ranking, standings_from_results
+
+# Fortalezas de equipos: diccionario {equipo: fuerza} o array indexado por índice de equipo
+StrengthsLike = Union[Mapping[Any, float], Sequence[float], np.ndarray]
+
+# Por encima de este número de equipos el fixture se genera de forma perezosa sin caché
+ROUND_ROBIN_CACHE_MAX_TEAMS = 256
+
+# Rango de fortalezas del simulador (el mismo que usa assign_team_strengths)
+MIN_STRENGTH, MAX_STRENGTH = 0.7, 1.3
+
+
+def parse_team_value(value_str: Optional[str]) -> float:
+    """
+    Convierte una cadena de valor de mercado (ej: "30,3M") a un número
+
+    Returns:
+        Valor numérico, o 0 si la cadena no es válida
+    """
+    try:
+        clean_str = value_str.replace(" ", "").replace(",", ".")
+        multiplier = 1
+        if clean_str.endswith("M"):
+            multiplier = 1000000
+            clean_str = clean_str[:-1]
+        elif clean_str.endswith("K"):
+            multiplier = 1000
+            clean_str = clean_str[:-1]
+        return float(clean_str) * multiplier
+    except (ValueError, AttributeError):
+        return 0
+
+
+def value_strengths(values: Sequence[Optional[str]]) -> np.ndarray:
+    """
+    Fortalezas de los equipos a partir de su valor de mercado
+
+    Reparte linealmente los valores de la liga entre MIN_STRENGTH (el equipo
+    más barato) y MAX_STRENGTH (el más caro). Los equipos sin valor y las
+    ligas en las que todos valen lo mismo quedan en 1.0.
+
+    Args:
+        values: Valores de los equipos (ej: "30,3M"), en el orden de los índices
+
+    Returns:
+        Array de fortalezas indexado por índice de equipo
+    """
+    parsed = np.array([parse_team_value(value) for value in values], dtype=float)
+    strengths = np.ones(len(parsed))
+    known = parsed > 0
+    if known.any():
+        low, high = parsed[known].min(), parsed[known].max()
+        if high > low:
+            strengths[known] = MIN_STRENGTH + (MAX_STRENGTH - MIN_STRENGTH) * (parsed[known] - low) / (high - low)
+    return strengths
+
+
+def iter_round_robin(
+    n_teams: int,
+    jornadas: Optional[int] = None
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """
+    Genera de forma perezosa las jornadas de un doble round robin
+    
+    Aplica el algoritmo de rotación circular (un equipo fijo y el resto rota)
+    calculando la posición de cada equipo por aritmética de índices, sin
+    rotar listas. Las jornadas de vuelta repiten las de ida invirtiendo
+    local y visitante. Con un número impar de equipos se omite el descanso.
+    
+    Args:
+        n_teams: Número de equipos (se identifican por índice 0..n_teams-1)
+        jornadas: Última jornada a generar (opcional, por defecto todas)
+    
+    Yields:
+        Tuplas (jornada, índices locales, índices visitantes)
+    """
+    if n_teams < 2:
+        raise ValueError("Se necesitan al menos 2 equipos para generar un fixture")
+    
+    # Con número impar se añade un equipo ficticio (el último índice) que descansa
+    n = n_teams + (n_teams % 2)
+    rounds_per_leg = n - 1
+    total_rounds = 2 * rounds_per_leg
+    if jornadas is not None:
+        total_rounds = min(jornadas, total_rounds)
+    
+    slots = np.arange(n // 2)
+    opposite = n - 1 - slots
+    
+    for jornada in range(1, total_rounds + 1):
+        round_num = (jornada - 1) % rounds_per_leg
+        
+        # Equipo en cada posición tras `round_num` rotaciones: la posición 0 es
+        # fija y el resto se desplaza una posición por jornada
+        first = np.where(slots == 0, 0, 1 + (slots - 1 - round_num) % rounds_per_leg)
+        second = 1 + (opposite - 1 - round_num) % rounds_per_leg
+        
+        # En rounds alternos se intercambia local y visitante; en la vuelta, al revés
+        swap = (round_num % 2 == 1) != (jornada > rounds_per_leg)
+        home, away = (second, first) if swap else (first, second)
+        
+        if n != n_teams:
+            playing = (home != n_teams) & (away != n_teams)
+            home, away = home[playing], away[playing]
+        
+        yield jornada, home, away
+
+
+@lru_cache(maxsize=32)
+def round_robin_table(n_teams: int) -> np.ndarray:
+    """
+    Devuelve la tabla precalculada del doble round robin para `n_teams` equipos
+    
+    Los emparejamientos solo dependen del número de equipos, así que la tabla
+    se calcula una vez por tamaño y se guarda en una caché LRU acotada. Los
+    equipos reales se asignan después indexando con sus posiciones.
+    
+    Returns:
+        Array de solo lectura (partidos x 3) con columnas (jornada, índice local,
+        índice visitante), ordenado por jornada
+    """
+    rounds = [
+        np.column_stack((np.full(len(home), jornada), home, away))
+        for jornada, home, away in iter_round_robin(n_teams)
+    ]
+    table = np.concatenate(rounds).astype(np.int32)
+    table.setflags(write=False)
+    return table
+
+
+class MatchBatchResult:
+    """
+    Resultados de una simulación por lotes en formato columnar
+
+    Cada atributo es un array de NumPy con un elemento por partido. Los
+    diccionarios por partido solo se construyen cuando se piden con
+    `row` o `to_dicts`.
+    """
+
+    COLUMNS = (
+        "home_possession",
+        "away_possession",
+        "home_shots",
+        "away_shots",
+        "home_goals",
+        "away_goals",
+    )
+
+    def __init__(
+        self,
+        home_ids: np.ndarray,
+        away_ids: np.ndarray,
+        home_possession: np.ndarray,
+        away_possession: np.ndarray,
+        home_shots: np.ndarray,
+        away_shots: np.ndarray,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray
+    ):
+        self.home_ids = home_ids
+        self.away_ids = away_ids
+        self.home_possession = home_possession
+        self.away_possession = away_possession
+        self.home_shots = home_shots
+        self.away_shots = away_shots
+        self.home_goals = home_goals
+        self.away_goals = away_goals
+
+    def __len__(self) -> int:
+        return len(self.home_goals)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Devuelve los resultados de un partido como diccionario"""
+        result = {
+            "home_team": self.home_ids[index].item(),
+            "away_team": self.away_ids[index].item()
+        }
+        for column in self.COLUMNS:
+            result[column] = int(getattr(self, column)[index])
+        return result
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convierte todo el lote a una lista de diccionarios"""
+        return [self.row(i) for i in range(len(self))]
+
+
 class MatchSimulator:
     """
     Clase para simular partidos de fútbol con comportamientos y resultados realistas
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        rng: Optional[np.random.Generator] = None,
+        tactic_sampler: Optional[TacticSampler] = None
+    ):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        # Muestreador calibrado con datos reales (opcional); sin él se usan las probabilidades fijas
+        self.tactic_sampler = tactic_sampler
         self.formations = {
             'common': ['433A', '433B', '442A', '442B', '451', '4231', '541A', '541B', 
                       '631A', '631B', '532', '523A', '523B', '5311'],
@@ -72,6 +276,9 @@ class MatchSimulator:
         
         Incluye formaciones, estilos, tácticas pero no resultados finales
         """
+        if self.tactic_sampler is not None:
+            return self.generate_pre_match_batch([home_team], [away_team])[0]
+        
         home_formation = self.generate_formation()
         away_formation = self.generate_formation()
         
@@ -105,6 +312,46 @@ class MatchSimulator:
             "away_goals": None
         }
     
+    def generate_pre_match_batch(self, home_teams: Sequence[str], away_teams: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Genera los datos previos de varios partidos
+        
+        Con un muestreador de tácticas calibrado se sortean todas las tácticas
+        de una vez; si no, se usa `generate_pre_match_data` para cada partido.
+        """
+        if self.tactic_sampler is None:
+            return [self.generate_pre_match_data(home, away) for home, away in zip(home_teams, away_teams)]
+        
+        n = len(home_teams)
+        tactics = self.tactic_sampler.sample(2 * n, self.rng)
+        formation = tactics["formation"].tolist()
+        style = tactics["style"].tolist()
+        attack = tactics["attack"].tolist()
+        kicks = tactics["kicks"].tolist()
+        
+        return [
+            {
+                "jornada": 1,  # Valor por defecto, se actualiza al asignar
+                "home_team": home,
+                "away_team": away,
+                "home_formation": formation[i],
+                "home_style": style[i],
+                "home_attack": attack[i],
+                "home_kicks": kicks[i],
+                "away_formation": formation[n + i],
+                "away_style": style[n + i],
+                "away_attack": attack[n + i],
+                "away_kicks": kicks[n + i],
+                "home_possession": None,
+                "away_possession": None,
+                "home_shots": None,
+                "away_shots": None,
+                "home_goals": None,
+                "away_goals": None
+            }
+            for i, (home, away) in enumerate(zip(home_teams, away_teams))
+        ]
+    
     def simulate_match(self, home_team: str, away_team: str, team_strengths: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Simula un partido completo con resultados
@@ -160,6 +407,164 @@ class MatchSimulator:
         })
         
         return match_data
+    
+    def simulate_matches_batch(
+        self,
+        home_ids: Sequence[Any],
+        away_ids: Sequence[Any],
+        strengths: Optional[StrengthsLike] = None,
+        rng: Optional[np.random.Generator] = None
+    ) -> MatchBatchResult:
+        """
+        Simula N partidos a la vez con arrays de NumPy
+        
+        Aplica el mismo modelo que `simulate_match` (posesión -> tiros ->
+        conversión -> goles) pero con un único sorteo vectorizado por variable.
+        Para un partido suelto `simulate_match` es más rápido; este método
+        compensa a partir de unas decenas de partidos.
+        
+        Args:
+            home_ids: Identificadores de los equipos locales (nombres, IDs o índices)
+            away_ids: Identificadores de los equipos visitantes
+            strengths: Fortalezas de los equipos. Puede ser un diccionario
+                {identificador: fuerza} o un array indexado por los identificadores
+                (cuando estos son índices enteros). Por defecto todos valen 1.0
+            rng: Generador de NumPy a usar (por defecto el del simulador)
+        
+        Returns:
+            MatchBatchResult con los resultados en columnas
+        """
+        rng = rng if rng is not None else self.rng
+        
+        home_ids = np.asarray(home_ids)
+        away_ids = np.asarray(away_ids)
+        if home_ids.shape != away_ids.shape:
+            raise ValueError("home_ids y away_ids deben tener la misma longitud")
+        n = home_ids.shape[0]
+        
+        home_strength = self._resolve_strengths(home_ids, strengths)
+        away_strength = self._resolve_strengths(away_ids, strengths)
+        
+        # Simular posesión (+/- 5% por punto de diferencia de fuerza)
+        base_home_possession = rng.integers(40, 61, size=n)
+        possession_modifier = (home_strength - away_strength) * 5
+        home_possession = np.clip(np.trunc(base_home_possession + possession_modifier), 30, 70).astype(np.int64)
+        away_possession = 100 - home_possession
+        
+        # Simular tiros
+        home_shots_base = np.trunc((home_possession / 100) * rng.integers(8, 17, size=n))
+        away_shots_base = np.trunc((away_possession / 100) * rng.integers(8, 17, size=n))
+        
+        home_shots = np.maximum(1, np.trunc(home_shots_base * home_strength)).astype(np.int64)
+        away_shots = np.maximum(1, np.trunc(away_shots_base * away_strength)).astype(np.int64)
+        
+        # Simular goles
+        home_conversion_rate = rng.uniform(0.1, 0.3, size=n) * home_strength
+        away_conversion_rate = rng.uniform(0.1, 0.3, size=n) * away_strength
+        
+        home_goals = np.rint(home_shots * home_conversion_rate).astype(np.int64)
+        away_goals = np.rint(away_shots * away_conversion_rate).astype(np.int64)
+        
+        return MatchBatchResult(
+            home_ids=home_ids,
+            away_ids=away_ids,
+            home_possession=home_possession,
+            away_possession=away_possession,
+            home_shots=home_shots,
+            away_shots=away_shots,
+            home_goals=home_goals,
+            away_goals=away_goals
+        )
+    
+    def score_distribution(
+        self,
+        home_ids: Sequence[Any],
+        away_ids: Sequence[Any],
+        strengths: Optional[StrengthsLike] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calcula de forma exacta la distribución de marcadores de N partidos
+        
+        Recorre analíticamente el mismo modelo que `simulate_matches_batch`:
+        posesión base uniforme en [40, 60], tiros uniformes en [8, 16] por
+        equipo y conversión uniforme en [0.1, 0.3]. Condicionado a la posesión,
+        los goles de cada equipo son independientes, así que la matriz de
+        marcadores es la media de los productos exteriores de ambas distribuciones.
+        
+        Args:
+            home_ids: Identificadores de los equipos locales
+            away_ids: Identificadores de los equipos visitantes
+            strengths: Fortalezas de los equipos (mismo formato que en `simulate_matches_batch`)
+        
+        Returns:
+            Diccionario con `score_matrix` (N x G x G, P(local=i, visitante=j)),
+            `p_home_win`, `p_draw`, `p_away_win`, `expected_home_goals` y
+            `expected_away_goals`
+        """
+        home_ids = np.asarray(home_ids)
+        away_ids = np.asarray(away_ids)
+        if home_ids.shape != away_ids.shape:
+            raise ValueError("home_ids y away_ids deben tener la misma longitud")
+        
+        home_strength = self._resolve_strengths(home_ids, strengths)[:, None]
+        away_strength = self._resolve_strengths(away_ids, strengths)[:, None]
+        
+        # Posesión para cada posesión base posible (N x 21)
+        base_possession = np.arange(40, 61)[None, :]
+        home_possession = np.clip(np.trunc(base_possession + (home_strength - away_strength) * 5), 30, 70)
+        away_possession = 100 - home_possession
+        
+        # Tiros para cada combinación posesión base / tiros base (N x 21 x 9)
+        shots_base = np.arange(8, 17)[None, None, :]
+        home_shots = np.maximum(1, np.trunc(np.trunc((home_possession / 100)[:, :, None] * shots_base) * home_strength[:, :, None]))
+        away_shots = np.maximum(1, np.trunc(np.trunc((away_possession / 100)[:, :, None] * shots_base) * away_strength[:, :, None]))
+        
+        # Los goles son round(tiros * U(0.1, 0.3) * fuerza): uniforme continua redondeada
+        home_low = home_shots * 0.1 * home_strength[:, :, None]
+        home_high = home_shots * 0.3 * home_strength[:, :, None]
+        away_low = away_shots * 0.1 * away_strength[:, :, None]
+        away_high = away_shots * 0.3 * away_strength[:, :, None]
+        
+        max_goals = int(np.ceil(max(home_high.max(initial=0), away_high.max(initial=0)) + 0.5))
+        goals = np.arange(max_goals + 1)
+        
+        home_goals_dist = self._rounded_uniform_pmf(home_low, home_high, goals).mean(axis=2)
+        away_goals_dist = self._rounded_uniform_pmf(away_low, away_high, goals).mean(axis=2)
+        
+        # Matriz de marcadores: media sobre la posesión base (N x G x G)
+        score_matrix = np.einsum("nbi,nbj->nij", home_goals_dist, away_goals_dist) / home_goals_dist.shape[1]
+        
+        return {
+            "score_matrix": score_matrix,
+            "p_home_win": np.tril(score_matrix, k=-1).sum(axis=(1, 2)),
+            "p_draw": np.trace(score_matrix, axis1=1, axis2=2),
+            "p_away_win": np.triu(score_matrix, k=1).sum(axis=(1, 2)),
+            "expected_home_goals": score_matrix.sum(axis=2) @ goals,
+            "expected_away_goals": score_matrix.sum(axis=1) @ goals
+        }
+    
+    @staticmethod
+    def _rounded_uniform_pmf(low: np.ndarray, high: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """P(round(X) = v) para X ~ U(low, high), evaluada en cada valor de `values`"""
+        low = low[..., None]
+        high = high[..., None]
+        overlap = np.minimum(high, values + 0.5) - np.maximum(low, values - 0.5)
+        return np.clip(overlap, 0, None) / (high - low)
+    
+    @staticmethod
+    def _resolve_strengths(ids: np.ndarray, strengths: Optional[StrengthsLike]) -> np.ndarray:
+        """Convierte las fortalezas a un array alineado con `ids`"""
+        if strengths is None:
+            return np.ones(ids.shape[0], dtype=np.float64)
+        
+        if isinstance(strengths, Mapping):
+            return np.fromiter(
+                (strengths.get(team_id, 1.0) for team_id in ids.tolist()),
+                dtype=np.float64,
+                count=ids.shape[0]
+            )
+        
+        return np.asarray(strengths, dtype=np.float64)[ids]
 
 
 class TournamentSimulator:
@@ -167,8 +572,30 @@ class TournamentSimulator:
     Clase para simular torneos completos, generando calendarios y resultados
     """
     
-    def __init__(self):
-        self.match_simulator = MatchSimulator()
+    def __init__(
+        self,
+        rng: Optional[np.random.Generator] = None,
+        tactic_sampler: Optional[TacticSampler] = None
+    ):
+        self.match_simulator = MatchSimulator(rng=rng, tactic_sampler=tactic_sampler)
+    
+    def iter_fixture_rounds(
+        self,
+        teams: List[str],
+        jornadas: Optional[int] = None
+    ) -> Iterator[Tuple[int, List[Tuple[str, str]]]]:
+        """
+        Genera el fixture jornada a jornada, deteniéndose en la jornada solicitada
+        
+        Args:
+            teams: Lista de nombres de equipos
+            jornadas: Última jornada a generar (opcional, por defecto todas)
+        
+        Yields:
+            Tuplas (jornada, lista de partidos (local, visitante))
+        """
+        for jornada_num, home_idx, away_idx in iter_round_robin(len(teams), jornadas):
+            yield jornada_num, [(teams[h], teams[a]) for h, a in zip(home_idx.tolist(), away_idx.tolist())]
     
     def generate_fixture(
         self, 
@@ -207,56 +634,45 @@ class TournamentSimulator:
         if matches_per_jornada is None:
             matches_per_jornada = matches_per_round
         
-        # Crear un número par de equipos añadiendo uno ficticio si es necesario
-        has_dummy = False
-        teams_copy = teams.copy()
-        if len(teams_copy) % 2 == 1:
-            teams_copy.append("Dummy")  # Equipo ficticio para hacer par
-            has_dummy = True
-        
-        n = len(teams_copy)
-        fixtures = []
-        
-        # Implementación del algoritmo de rotación circular
-        # Un equipo fijo y los demás rotan
-        for round_num in range(n - 1):
-            round_fixtures = []
-            for i in range(n // 2):
-                team1 = teams_copy[i]
-                team2 = teams_copy[n - 1 - i]
-                
-                # Saltar partidos con el equipo ficticio
-                if has_dummy and (team1 == "Dummy" or team2 == "Dummy"):
-                    continue
-                
-                # En rounds alternos, intercambiar local y visitante
-                if round_num % 2 == 0:
-                    round_fixtures.append((team1, team2, round_num + 1))
-                else:
-                    round_fixtures.append((team2, team1, round_num + 1))
-            
-            fixtures.extend(round_fixtures)
-            
-            # Rotar equipos para la siguiente jornada: el primero se queda fijo, el resto rota
-            teams_copy = [teams_copy[0]] + [teams_copy[-1]] + teams_copy[1:-1]
-        
-        # Crear partidos de vuelta (invertir local/visitante)
-        first_leg_count = len(fixtures)
-        for i in range(first_leg_count):
-            home, away, round_num = fixtures[i]
-            # La vuelta va después de todas las jornadas de ida
-            fixtures.append((away, home, round_num + (n - 1)))
-        
-        # Limitar al número de jornadas solicitado
-        fixtures = [f for f in fixtures if f[2] <= jornadas]
+        if n_teams <= ROUND_ROBIN_CACHE_MAX_TEAMS:
+            # Usar la tabla cacheada para este tamaño, cortada en la jornada solicitada
+            table = round_robin_table(n_teams)
+            table = table[:np.searchsorted(table[:, 0], jornadas, side="right")]
+            names = np.asarray(teams, dtype=object)
+            fixtures = list(zip(
+                names[table[:, 1]].tolist(),
+                names[table[:, 2]].tolist(),
+                table[:, 0].tolist()
+            ))
+        else:
+            # Generar las jornadas de forma perezosa hasta la solicitada
+            fixtures = [
+                (home, away, jornada_num)
+                for jornada_num, round_fixtures in self.iter_fixture_rounds(teams, jornadas)
+                for home, away in round_fixtures
+            ]
+        
+        # Simular todos los resultados de una vez si se solicitan
+        results = None
+        if simulate_results and fixtures:
+            results = self.match_simulator.simulate_matches_batch(
+                [f[0] for f in fixtures],
+                [f[1] for f in fixtures],
+                team_strengths
+            )
+            simulated_at = datetime.now().isoformat()
         
         # Convertir fixtures a objetos de partido
+        pre_match = self.match_simulator.generate_pre_match_batch(
+            [f[0] for f in fixtures],
+            [f[1] for f in fixtures]
+        )
         all_matches = []
-        for home, away, jornada_num in fixtures:
-            if simulate_results:
-                match_data = self.match_simulator.simulate_match(home, away, team_strengths)
-            else:
-                match_data = self.match_simulator.generate_pre_match_data(home, away)
+        for i, (home, away, jornada_num) in enumerate(fixtures):
+            match_data = pre_match[i]
+            if results is not None:
+                match_data.update(results.row(i))
+                match_data["simulated_at"] = simulated_at
             
             match_data.update({
                 "jornada": jornada_num,
@@ -276,6 +692,190 @@ class TournamentSimulator:
         
         return all_matches
     
+    def project_season(
+        self,
+        n_teams: int,
+        home_idx: Sequence[int],
+        away_idx: Sequence[int],
+        base_points: Optional[Sequence[int]] = None,
+        base_goal_difference: Optional[Sequence[int]] = None,
+        base_goals_for: Optional[Sequence[int]] = None,
+        runs: int = 1000,
+        team_strengths: Optional[StrengthsLike] = None,
+        rng: Optional[np.random.Generator] = None,
+        workers: int = 1,
+        seed: Optional[int] = None,
+        strength_model: Optional[PoissonStrengthModel] = None
+    ) -> Dict[str, Any]:
+        """
+        Proyecta el final de una temporada mediante Monte Carlo
+        
+        Simula `runs` veces los partidos pendientes sobre arrays en memoria,
+        partiendo de la tabla actual, y cuenta en qué posición termina cada equipo.
+        
+        Con `workers > 1` las simulaciones se reparten en `workers` tareas del
+        pool de procesos compartido (ver get_process_pool). Cada tarea recibe
+        su propio flujo `SeedSequence(seed).spawn(workers)`, de modo que un
+        mismo par (seed, workers) reproduce exactamente los mismos resultados.
+        
+        Args:
+            n_teams: Número de equipos (los equipos se identifican por índice 0..n-1)
+            home_idx: Índices de los equipos locales de los partidos pendientes
+            away_idx: Índices de los equipos visitantes de los partidos pendientes
+            base_points: Puntos actuales de cada equipo (opcional)
+            base_goal_difference: Diferencia de goles actual de cada equipo (opcional)
+            base_goals_for: Goles a favor actuales de cada equipo (opcional)
+            runs: Número de temporadas a simular
+            team_strengths: Fortalezas indexadas por índice de equipo (opcional)
+            rng: Generador de NumPy a usar (opcional, se ignora si se indica `seed`)
+            workers: Número de procesos entre los que repartir las simulaciones
+            seed: Semilla raíz para generar flujos reproducibles por proceso (opcional)
+            strength_model: Modelo de fuerza ajustado (opcional). Si se indica,
+                los goles se muestrean directamente de sus tasas en lugar de
+                pasar por tiros y conversión, y se ignora `team_strengths`
+        
+        Returns:
+            Diccionario con `runs`, `position_counts` (matriz equipos x posiciones),
+            `points_sum` (puntos finales acumulados de cada equipo), `workers`,
+            `elapsed_seconds` y `runs_per_second`
+        """
+        if runs < 1:
+            raise ValueError("Se necesita al menos una simulación")
+        if workers < 1:
+            raise ValueError("Se necesita al menos un proceso")
+        
+        started = time.perf_counter()
+        
+        if workers > 1 or seed is not None:
+            workers = min(workers, runs)
+            streams = np.random.SeedSequence(seed).spawn(workers)
+            chunks = [runs // workers + (1 if i < runs % workers else 0) for i in range(workers)]
+            jobs = [
+                (n_teams, home_idx, away_idx, base_points, base_goal_difference,
+                 base_goals_for, chunk, team_strengths, strength_model, stream)
+                for chunk, stream in zip(chunks, streams)
+            ]
+            
+            if workers == 1:
+                partials = [_project_season_worker(jobs[0])]
+            else:
+                try:
+                    partials = list(get_process_pool().map(_project_season_worker, jobs))
+                except BrokenProcessPool:
+                    # Un proceso murió: el pool ya no sirve y se recrea en la siguiente llamada
+                    shutdown_process_pool()
+                    raise
+            
+            result = {
+                "runs": runs,
+                "position_counts": sum(p["position_counts"] for p in partials),
+                "points_sum": sum(p["points_sum"] for p in partials)
+            }
+        else:
+            result = self._project_season_runs(
+                n_teams, home_idx, away_idx, base_points, base_goal_difference,
+                base_goals_for, runs, team_strengths,
+                rng if rng is not None else self.match_simulator.rng,
+                strength_model
+            )
+        
+        elapsed = time.perf_counter() - started
+        result.update({
+            "workers": workers,
+            "elapsed_seconds": elapsed,
+            "runs_per_second": runs / elapsed if elapsed > 0 else float("inf")
+        })
+        return result
+    
+    def _project_season_runs(
+        self,
+        n_teams: int,
+        home_idx: Sequence[int],
+        away_idx: Sequence[int],
+        base_points: Optional[Sequence[int]],
+        base_goal_difference: Optional[Sequence[int]],
+        base_goals_for: Optional[Sequence[int]],
+        runs: int,
+        team_strengths: Optional[StrengthsLike],
+        rng: np.random.Generator,
+        strength_model: Optional[PoissonStrengthModel] = None
+    ) -> Dict[str, Any]:
+        """Ejecuta `runs` simulaciones de temporada en el proceso actual"""
+        home_idx = np.asarray(home_idx, dtype=np.int64)
+        away_idx = np.asarray(away_idx, dtype=np.int64)
+        zeros = np.zeros(n_teams, dtype=np.int64)
+        base_points = np.asarray(base_points if base_points is not None else zeros, dtype=np.int64)
+        base_goal_difference = np.asarray(base_goal_difference if base_goal_difference is not None else zeros, dtype=np.int64)
+        base_goals_for = np.asarray(base_goals_for if base_goals_for is not None else zeros, dtype=np.int64)
+        
+        position_counts = np.zeros((n_teams, n_teams), dtype=np.int64)
+        points_sum = np.zeros(n_teams, dtype=np.int64)
+        
+        # Procesar por bloques para acotar la memoria (~2M partidos por bloque)
+        n_matches = max(len(home_idx), 1)
+        chunk_runs = max(1, min(runs, 2_000_000 // n_matches))
+        
+        done = 0
+        while done < runs:
+            r = min(chunk_runs, runs - done)
+            table = self._simulate_season_tables(
+                n_teams, home_idx, away_idx, r, team_strengths, rng, strength_model
+            )
+            points = table.points + base_points
+            
+            # Ordenar cada temporada por puntos, diferencia de goles y goles a favor;
+            # los empates restantes se deshacen al azar
+            order = rank_standings(
+                points,
+                table.goal_difference + base_goal_difference,
+                table.goals_for + base_goals_for,
+                tiebreak=rng.random((r, n_teams))
+            )
+            positions = positions_from_ranking(order)
+            
+            team_index = np.broadcast_to(np.arange(n_teams), (r, n_teams))
+            position_counts += np.bincount(
+                (team_index * n_teams + positions).ravel(),
+                minlength=n_teams * n_teams
+            ).reshape(n_teams, n_teams)
+            points_sum += points.sum(axis=0)
+            done += r
+        
+        return {
+            "runs": runs,
+            "position_counts": position_counts,
+            "points_sum": points_sum
+        }
+    
+    def _simulate_season_tables(
+        self,
+        n_teams: int,
+        home_idx: np.ndarray,
+        away_idx: np.ndarray,
+        runs: int,
+        team_strengths: Optional[StrengthsLike],
+        rng: np.random.Generator,
+        strength_model: Optional[PoissonStrengthModel] = None
+    ) -> Standings:
+        """Simula `runs` veces los partidos y devuelve la tabla de cada temporada (runs x equipos)"""
+        home_ids = np.tile(home_idx, runs)
+        away_ids = np.tile(away_idx, runs)
+        
+        if strength_model is not None:
+            home_goals, away_goals = strength_model.sample_goals(home_ids, away_ids, rng)
+        else:
+            results = self.match_simulator.simulate_matches_batch(home_ids, away_ids, team_strengths, rng)
+            home_goals = results.home_goals
+            away_goals = results.away_goals
+        
+        return compute_standings(
+            n_teams,
+            home_idx,
+            away_idx,
+            home_goals.reshape(runs, len(home_idx)),
+            away_goals.reshape(runs, len(away_idx))
+        )
+    
     def auto_balance_teams(self, teams: List[str]) -> Dict[str, float]:
         """
         Asigna fortalezas balanceadas a los equipos para simulaciones más realistas
@@ -341,62 +941,68 @@ class TournamentSimulator:
         Returns:
             Diccionario con estadísticas de cada equipo
         """
-        standings = {}
-        
-        # Inicializar estadísticas para cada equipo
-        teams = set()
-        for match in matches:
-            teams.add(match["home_team"])
-            teams.add(match["away_team"])
-        
-        for team in teams:
-            standings[team] = {
-                "played": 0,
-                "won": 0,
-                "drawn": 0,
-                "lost": 0,
-                "goals_for": 0,
-                "goals_against": 0,
-                "goal_difference": 0,
-                "points": 0
-            }
-        
-        # Procesar resultados de partidos
-        for match in matches:
-            # Omitir partidos sin resultados
-            if match["home_goals"] is None or match["away_goals"] is None:
-                continue
-            
-            home_team = match["home_team"]
-            away_team = match["away_team"]
-            
-            # Actualizar partidos jugados
-            standings[home_team]["played"] += 1
-            standings[away_team]["played"] += 1
-            
-            # Actualizar goles
-            standings[home_team]["goals_for"] += match["home_goals"]
-            standings[home_team]["goals_against"] += match["away_goals"]
-            standings[away_team]["goals_for"] += match["away_goals"]
-            standings[away_team]["goals_against"] += match["home_goals"]
-            
-            # Actualizar resultados y puntos
-            if match["home_goals"] > match["away_goals"]:
-                standings[home_team]["won"] += 1
-                standings[away_team]["lost"] += 1
-                standings[home_team]["points"] += 3
-            elif match["home_goals"] < match["away_goals"]:
-                standings[home_team]["lost"] += 1
-                standings[away_team]["won"] += 1
-                standings[away_team]["points"] += 3
-            else:
-                standings[home_team]["drawn"] += 1
-                standings[away_team]["drawn"] += 1
-                standings[home_team]["points"] += 1
-                standings[away_team]["points"] += 1
-        
-        # Calcular diferencia de goles
-        for team in standings:
-            standings[team]["goal_difference"] = standings[team]["goals_for"] - standings[team]["goals_against"]
-        
-        return standings
\ No newline at end of file
+        teams = list(dict.fromkeys(
+            team for match in matches for team in (match["home_team"], match["away_team"])
+        ))
+        
+        # Omitir partidos sin resultados
+        results = [
+            (match["home_team"], match["away_team"], match["home_goals"], match["away_goals"])
+            for match in matches
+            if match["home_goals"] is not None and match["away_goals"] is not None
+        ]
+        
+        return standings_from_results(teams, results)
+
+
+def _project_season_worker(job: Tuple) -> Dict[str, Any]:
+    """Punto de entrada de cada proceso del pool de proyecciones"""
+    (n_teams, home_idx, away_idx, base_points, base_goal_difference,
+     base_goals_for, runs, team_strengths, strength_model, stream) = job
+    
+    simulator = TournamentSimulator(rng=np.random.default_rng(stream))
+    return simulator._project_season_runs(
+        n_teams, home_idx, away_idx, base_points, base_goal_difference,
+        base_goals_for, runs, team_strengths, simulator.match_simulator.rng,
+        strength_model
+    )
+
+
+def available_workers() -> int:
+    """Número de núcleos disponibles para el pool de simulación"""
+    return os.cpu_count() or 1
+
+
+# Pool de procesos compartido por las proyecciones (uno por proceso, creado al primer uso)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Devuelve el pool de procesos de simulación, creándolo la primera vez
+
+    Tiene `available_workers()` procesos que se reutilizan entre peticiones,
+    de modo que el arranque solo se paga una vez. Se crean con `spawn` en
+    lugar de `fork`, que no es seguro desde un proceso con hilos (el
+    threadpool de FastAPI).
+    """
+    global _process_pool
+
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=available_workers(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+
+def shutdown_process_pool():
+    """Cierra el pool de procesos de simulación (p. ej. al apagar la aplicación)"""
+    global _process_pool
+
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,172 @@
+from typing import Dict, List, Any, Optional, Sequence
+
+import numpy as np
+
+# Columnas de la tabla, en el orden en que se exportan
+STANDINGS_COLUMNS = (
+    "played", "won", "drawn", "lost",
+    "goals_for", "goals_against", "goal_difference", "points"
+)
+
+
+class Standings:
+    """
+    Tabla de clasificación en forma de arrays
+
+    Cada columna tiene forma (equipos,) para una sola tabla o (temporadas, equipos)
+    para un lote de temporadas simuladas. Los equipos se identifican por índice.
+    """
+
+    def __init__(
+        self,
+        played: np.ndarray,
+        won: np.ndarray,
+        drawn: np.ndarray,
+        lost: np.ndarray,
+        goals_for: np.ndarray,
+        goals_against: np.ndarray
+    ):
+        self.played = played
+        self.won = won
+        self.drawn = drawn
+        self.lost = lost
+        self.goals_for = goals_for
+        self.goals_against = goals_against
+        self.goal_difference = goals_for - goals_against
+        self.points = 3 * won + drawn
+
+    @property
+    def n_teams(self) -> int:
+        return self.points.shape[-1]
+
+    def ranking(self, tiebreak: Optional[np.ndarray] = None) -> np.ndarray:
+        """Orden de los equipos (índices) de cada tabla; ver `rank_standings`"""
+        return rank_standings(self.points, self.goal_difference, self.goals_for, tiebreak)
+
+    def rows(self) -> List[Dict[str, int]]:
+        """Devuelve una fila por equipo (solo para tablas 1D), en orden de índice"""
+        columns = np.stack([getattr(self, name) for name in STANDINGS_COLUMNS], axis=-1).tolist()
+        return [dict(zip(STANDINGS_COLUMNS, values)) for values in columns]
+
+
+def compute_standings(
+    n_teams: int,
+    home_idx: Sequence[int],
+    away_idx: Sequence[int],
+    home_goals: Sequence[int],
+    away_goals: Sequence[int]
+) -> Standings:
+    """
+    Calcula la tabla de clasificación a partir de resultados
+
+    Los goles pueden ser 1D (un calendario) o 2D (temporadas x partidos) para
+    calcular de una vez las tablas de un lote de temporadas. Los índices de
+    equipo pueden compartirse entre temporadas (1D) o variar por temporada (2D).
+    Toda la acumulación se hace con `np.bincount` sobre un índice plano
+    (temporada, equipo).
+
+    Args:
+        n_teams: Número de equipos (índices 0..n_teams-1)
+        home_idx, away_idx: Índices de los equipos de cada partido
+        home_goals, away_goals: Goles de cada partido (solo partidos jugados)
+
+    Returns:
+        Standings con columnas de forma (equipos,) o (temporadas, equipos)
+    """
+    home_goals = np.asarray(home_goals, dtype=np.int64)
+    away_goals = np.asarray(away_goals, dtype=np.int64)
+    batched = home_goals.ndim == 2
+    runs, n_matches = home_goals.shape if batched else (1, home_goals.shape[0])
+    shape = (runs, n_teams) if batched else (n_teams,)
+    size = runs * n_teams
+
+    home_idx = np.broadcast_to(np.asarray(home_idx, dtype=np.int64), (runs, n_matches))
+    away_idx = np.broadcast_to(np.asarray(away_idx, dtype=np.int64), (runs, n_matches))
+
+    # Índice plano (temporada, equipo)
+    run_offset = (np.arange(runs, dtype=np.int64) * n_teams)[:, None]
+    home_slot = (run_offset + home_idx).ravel()
+    away_slot = (run_offset + away_idx).ravel()
+    home_goals = home_goals.ravel()
+    away_goals = away_goals.ravel()
+
+    def accumulate(home_weights=None, away_weights=None) -> np.ndarray:
+        total = np.bincount(home_slot, weights=home_weights, minlength=size)
+        total += np.bincount(away_slot, weights=away_weights, minlength=size)
+        return total.astype(np.int64).reshape(shape)
+
+    home_won = home_goals > away_goals
+    away_won = away_goals > home_goals
+    draw = home_goals == away_goals
+
+    played = accumulate()
+    won = accumulate(home_won, away_won)
+    drawn = accumulate(draw, draw)
+
+    return Standings(
+        played=played,
+        won=won,
+        drawn=drawn,
+        lost=played - won - drawn,
+        goals_for=accumulate(home_goals, away_goals),
+        goals_against=accumulate(away_goals, home_goals)
+    )
+
+
+def rank_standings(
+    points: np.ndarray,
+    goal_difference: np.ndarray,
+    goals_for: np.ndarray,
+    tiebreak: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Ordena los equipos por puntos, diferencia de goles y goles a favor (descendente)
+
+    Funciona sobre el último eje, por lo que ordena de una vez un lote de
+    tablas. Los empates completos se resuelven con `tiebreak` (ascendente) si
+    se indica, o manteniendo el orden de índice.
+
+    Returns:
+        Índices de equipo ordenados de primero a último
+    """
+    keys = (-goals_for, -goal_difference, -points)
+    if tiebreak is not None:
+        keys = (tiebreak,) + keys
+    return np.lexsort(keys, axis=-1)
+
+
+def positions_from_ranking(order: np.ndarray) -> np.ndarray:
+    """Invierte un orden: posición (0 = primero) de cada equipo"""
+    positions = np.empty_like(order)
+    np.put_along_axis(positions, order, np.arange(order.shape[-1]), axis=-1)
+    return positions
+
+
+def standings_from_results(
+    team_keys: Sequence[Any],
+    results: Sequence[Sequence[Any]]
+) -> Dict[Any, Dict[str, int]]:
+    """
+    Calcula la tabla a partir de resultados identificados por clave de equipo
+
+    Args:
+        team_keys: Claves de los equipos (nombre o ID), en el orden deseado
+        results: Tuplas (local, visitante, goles local, goles visitante);
+            se omiten las de equipos desconocidos
+
+    Returns:
+        Diccionario {clave: estadísticas} ordenado por posición (los empates
+        completos mantienen el orden de `team_keys`)
+    """
+    team_index = {key: i for i, key in enumerate(team_keys)}
+    known = [
+        (team_index[home], team_index[away], home_goals, away_goals)
+        for home, away, home_goals, away_goals in results
+        if home in team_index and away in team_index
+    ]
+    columns = np.array(known, dtype=np.int64).reshape(-1, 4)
+
+    standings = compute_standings(len(team_index), columns[:, 0], columns[:, 1], columns[:, 2], columns[:, 3])
+    rows = standings.rows()
+    team_keys = list(team_index)
+    return {team_keys[i]: rows[i] for i in standings.ranking().tolist()}
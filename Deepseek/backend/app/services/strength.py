@@ -0,0 +1,360 @@
+import hashlib
+import threading
+from typing import Dict, Any, Optional, Tuple, Sequence
+
+import numpy as np
+
+# Media mínima de goles del prior: sin goles (una liga de 0-0) el ataque
+# ajustado sería 0 y la normalización de escala por log(0) daría NaN
+MIN_PRIOR_GOALS = 0.1
+
+
+class PoissonStrengthModel:
+    """
+    Modelo de fuerza de equipos Poisson / Dixon-Coles
+
+    Los goles de cada partido siguen Poisson con medias
+        local:     home_advantage * attack[local] * defence[visitante]
+        visitante: attack[visitante] * defence[local]
+    donde `defence` es la debilidad defensiva (más alta = encaja más). La
+    corrección de Dixon-Coles (`rho`) ajusta la probabilidad de los marcadores
+    bajos (0-0, 1-0, 0-1, 1-1).
+
+    Los parámetros se ajustan por máxima verosimilitud con actualizaciones
+    multiplicativas cerradas (cada paso maximiza la verosimilitud de un bloque
+    de parámetros dados los demás), vectorizadas con `np.bincount`.
+    """
+
+    def __init__(self, n_teams: int, prior_matches: float = 1.0):
+        """
+        Args:
+            n_teams: Número de equipos (se identifican por índice 0..n_teams-1)
+            prior_matches: Partidos ficticios a la media de la liga que se suman
+                a cada equipo para estabilizar el ajuste con pocos datos
+        """
+        self.n_teams = n_teams
+        self.prior_matches = prior_matches
+        self.attack = np.ones(n_teams)
+        self.defence = np.ones(n_teams)
+        self.home_advantage = 1.0
+        self.rho = 0.0
+        self.matches_fitted = 0
+
+    def fit(
+        self,
+        home_idx: Sequence[int],
+        away_idx: Sequence[int],
+        home_goals: Sequence[int],
+        away_goals: Sequence[int],
+        warm_start: bool = False,
+        max_iter: int = 500,
+        tol: float = 1e-8
+    ) -> "PoissonStrengthModel":
+        """
+        Ajusta los parámetros con los partidos jugados
+
+        Args:
+            home_idx, away_idx: Índices de los equipos de cada partido
+            home_goals, away_goals: Goles de cada partido
+            warm_start: Partir de los parámetros actuales (para reajustes
+                incrementales cuando llegan resultados nuevos)
+            max_iter: Iteraciones máximas
+            tol: Cambio relativo máximo de los parámetros para considerar convergencia
+
+        Returns:
+            El propio modelo
+        """
+        home_idx = np.asarray(home_idx, dtype=np.int64)
+        away_idx = np.asarray(away_idx, dtype=np.int64)
+        home_goals = np.asarray(home_goals, dtype=np.float64)
+        away_goals = np.asarray(away_goals, dtype=np.float64)
+        n = self.n_teams
+
+        if not warm_start:
+            self.attack = np.ones(n)
+            self.defence = np.ones(n)
+            self.home_advantage = 1.0
+
+        self.matches_fitted = len(home_idx)
+        if len(home_idx) == 0:
+            self.rho = 0.0
+            return self
+
+        # Prior: `prior_matches` partidos ficticios por equipo contra un rival
+        # medio, con la media de goles por equipo y partido de la liga
+        mean_goals = max((home_goals.sum() + away_goals.sum()) / (2 * len(home_idx)), MIN_PRIOR_GOALS)
+        prior = self.prior_matches
+
+        goals_for = np.bincount(home_idx, weights=home_goals, minlength=n) + np.bincount(away_idx, weights=away_goals, minlength=n)
+        goals_against = np.bincount(home_idx, weights=away_goals, minlength=n) + np.bincount(away_idx, weights=home_goals, minlength=n)
+        goals_for += prior * mean_goals
+        goals_against += prior * mean_goals
+        total_home_goals = home_goals.sum()
+
+        attack, defence, home_advantage = self.attack, self.defence, self.home_advantage
+
+        for _ in range(max_iter):
+            previous = np.concatenate((attack, defence))
+
+            # Ataque: goles marcados / goles esperados por unidad de ataque
+            # (los partidos del prior se juegan contra una defensa media)
+            exposure = (
+                np.bincount(home_idx, weights=home_advantage * defence[away_idx], minlength=n)
+                + np.bincount(away_idx, weights=defence[home_idx], minlength=n)
+                + prior * defence.mean()
+            )
+            attack = goals_for / exposure
+
+            # Defensa: goles encajados / goles esperados por unidad de debilidad defensiva
+            exposure = (
+                np.bincount(home_idx, weights=attack[away_idx], minlength=n)
+                + np.bincount(away_idx, weights=home_advantage * attack[home_idx], minlength=n)
+                + prior * attack.mean()
+            )
+            defence = goals_against / exposure
+
+            # Ventaja de local, con el mismo prior hacia 1 (sin él una liga sin
+            # goles locales la dejaría en 0)
+            expected_home = (attack[home_idx] * defence[away_idx]).sum()
+            home_advantage = (total_home_goals + prior * mean_goals) / (expected_home + prior * mean_goals)
+
+            # Fijar la escala (el modelo es invariante a attack*c, defence/c)
+            scale = np.exp(np.log(attack).mean())
+            attack /= scale
+            defence *= scale
+
+            current = np.concatenate((attack, defence))
+            if np.max(np.abs(current - previous) / previous) < tol:
+                break
+
+        self.attack, self.defence, self.home_advantage = attack, defence, home_advantage
+        self.rho = self._fit_rho(home_idx, away_idx, home_goals, away_goals)
+        return self
+
+    def _fit_rho(
+        self,
+        home_idx: np.ndarray,
+        away_idx: np.ndarray,
+        home_goals: np.ndarray,
+        away_goals: np.ndarray
+    ) -> float:
+        """Ajusta rho de Dixon-Coles por búsqueda en rejilla (la verosimilitud Poisson no depende de rho)"""
+        home_rate, away_rate = self.expected_goals(home_idx, away_idx)
+        candidates = np.linspace(-0.25, 0.25, 101)[:, None]
+
+        tau = self._tau(home_goals[None, :], away_goals[None, :], home_rate[None, :], away_rate[None, :], candidates)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_likelihood = np.where(tau > 0, np.log(tau), -np.inf).sum(axis=1)
+
+        return float(candidates[np.argmax(log_likelihood), 0])
+
+    @staticmethod
+    def _tau(home_goals, away_goals, home_rate, away_rate, rho):
+        """Factor de corrección de Dixon-Coles para marcadores bajos"""
+        return np.select(
+            [
+                (home_goals == 0) & (away_goals == 0),
+                (home_goals == 0) & (away_goals == 1),
+                (home_goals == 1) & (away_goals == 0),
+                (home_goals == 1) & (away_goals == 1)
+            ],
+            [
+                1 - home_rate * away_rate * rho,
+                1 + home_rate * rho,
+                1 + away_rate * rho,
+                1 - rho
+            ],
+            default=1.0
+        )
+
+    def expected_goals(self, home_idx: Sequence[int], away_idx: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Devuelve las medias de goles (local, visitante) de cada partido"""
+        home_idx = np.asarray(home_idx, dtype=np.int64)
+        away_idx = np.asarray(away_idx, dtype=np.int64)
+        home_rate = self.home_advantage * self.attack[home_idx] * self.defence[away_idx]
+        away_rate = self.attack[away_idx] * self.defence[home_idx]
+        return home_rate, away_rate
+
+    def score_matrix(self, home_idx: Sequence[int], away_idx: Sequence[int], max_goals: int = 10) -> np.ndarray:
+        """
+        Calcula la matriz de probabilidades de marcador (N x G x G) con la corrección de Dixon-Coles
+
+        La masa por encima de `max_goals` se descarta y la matriz se renormaliza.
+        """
+        home_rate, away_rate = self.expected_goals(home_idx, away_idx)
+        goals = np.arange(max_goals + 1)
+
+        home_pmf = self._poisson_pmf(home_rate[:, None], goals)
+        away_pmf = self._poisson_pmf(away_rate[:, None], goals)
+        matrix = home_pmf[:, :, None] * away_pmf[:, None, :]
+
+        tau = self._tau(
+            goals[None, :, None], goals[None, None, :],
+            home_rate[:, None, None], away_rate[:, None, None], self.rho
+        )
+        matrix = np.clip(matrix * tau, 0, None)
+        return matrix / matrix.sum(axis=(1, 2), keepdims=True)
+
+    def score_distribution(self, home_idx: Sequence[int], away_idx: Sequence[int], max_goals: int = 10) -> Dict[str, np.ndarray]:
+        """
+        Probabilidades de resultado de cada partido, con el mismo formato que
+        `MatchSimulator.score_distribution`
+        """
+        score_matrix = self.score_matrix(home_idx, away_idx, max_goals)
+        goals = np.arange(max_goals + 1)
+
+        return {
+            "score_matrix": score_matrix,
+            "p_home_win": np.tril(score_matrix, k=-1).sum(axis=(1, 2)),
+            "p_draw": np.trace(score_matrix, axis1=1, axis2=2),
+            "p_away_win": np.triu(score_matrix, k=1).sum(axis=(1, 2)),
+            "expected_home_goals": score_matrix.sum(axis=2) @ goals,
+            "expected_away_goals": score_matrix.sum(axis=1) @ goals
+        }
+
+    @staticmethod
+    def _poisson_pmf(rate: np.ndarray, goals: np.ndarray) -> np.ndarray:
+        log_factorial = np.cumsum(np.log(np.maximum(goals, 1)))
+        return np.exp(goals * np.log(np.maximum(rate, 1e-12)) - rate - log_factorial)
+
+    def sample_goals(
+        self,
+        home_idx: Sequence[int],
+        away_idx: Sequence[int],
+        rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sortea los goles de N partidos directamente desde las tasas ajustadas
+
+        Se proponen goles Poisson independientes y se aceptan por rechazo con
+        el factor de Dixon-Coles, de modo que la muestra sigue la distribución
+        corregida sin construir la matriz de marcadores.
+        """
+        home_rate, away_rate = self.expected_goals(home_idx, away_idx)
+        home_goals = rng.poisson(home_rate)
+        away_goals = rng.poisson(away_rate)
+
+        if self.rho == 0.0:
+            return home_goals, away_goals
+
+        rho = self.rho
+        tau_max = np.maximum.reduce([
+            np.ones_like(home_rate),
+            1 - home_rate * away_rate * rho,
+            1 + home_rate * rho,
+            1 + away_rate * rho,
+            np.full_like(home_rate, 1 - rho)
+        ])
+
+        pending = np.arange(len(home_rate))
+        while len(pending):
+            tau = self._tau(home_goals[pending], away_goals[pending], home_rate[pending], away_rate[pending], rho)
+            rejected = rng.random(len(pending)) * tau_max[pending] > tau
+            pending = pending[rejected]
+            if len(pending):
+                home_goals[pending] = rng.poisson(home_rate[pending])
+                away_goals[pending] = rng.poisson(away_rate[pending])
+
+        return home_goals, away_goals
+
+    def copy(self) -> "PoissonStrengthModel":
+        """Devuelve una copia independiente del modelo"""
+        return self.reindex(np.arange(self.n_teams))
+
+    def reindex(self, order: Sequence[int]) -> "PoissonStrengthModel":
+        """
+        Devuelve una copia cuyos equipos siguen el orden indicado
+
+        Args:
+            order: Para cada índice nuevo, el índice del equipo en este modelo
+        """
+        order = np.asarray(order, dtype=np.int64)
+        model = PoissonStrengthModel(len(order), self.prior_matches)
+        model.attack = self.attack[order]
+        model.defence = self.defence[order]
+        model.home_advantage = self.home_advantage
+        model.rho = self.rho
+        model.matches_fitted = self.matches_fitted
+        return model
+
+    def to_dict(self, team_ids: Optional[Sequence[Any]] = None) -> Dict[str, Any]:
+        """Exporta los parámetros ajustados"""
+        team_ids = list(team_ids) if team_ids is not None else list(range(self.n_teams))
+        return {
+            "home_advantage": float(self.home_advantage),
+            "rho": float(self.rho),
+            "matches_fitted": self.matches_fitted,
+            "teams": [
+                {"team_id": team_id, "attack": float(self.attack[i]), "defence": float(self.defence[i])}
+                for i, team_id in enumerate(team_ids)
+            ]
+        }
+
+
+class StrengthModelCache:
+    """
+    Caché en memoria de modelos ajustados por liga
+
+    Cada entrada guarda los equipos del modelo y una huella de los resultados
+    usados (índices y goles de cada partido), de modo que tanto un resultado
+    nuevo como uno corregido invalidan el modelo. Si cambian los resultados se
+    reajusta una copia partiendo de los parámetros anteriores, lo que converge
+    en pocas iteraciones, y se sustituye la entrada: los hilos que ya tienen
+    el modelo anterior nunca lo ven cambiar. Si cambia la lista de equipos se
+    ajusta desde cero.
+    """
+
+    def __init__(self):
+        self._models: Dict[int, Tuple[Tuple[Any, ...], str, PoissonStrengthModel]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def results_fingerprint(
+        home_idx: Sequence[int],
+        away_idx: Sequence[int],
+        home_goals: Sequence[int],
+        away_goals: Sequence[int]
+    ) -> str:
+        """Huella de los resultados (cambia con cualquier partido añadido, quitado o corregido)"""
+        digest = hashlib.blake2b(digest_size=16)
+        for values in (home_idx, away_idx, home_goals, away_goals):
+            digest.update(np.asarray(values, dtype=np.int64).tobytes())
+            digest.update(b"|")
+        return digest.hexdigest()
+
+    def get(
+        self,
+        league_id: int,
+        team_ids: Sequence[Any],
+        home_idx: Sequence[int],
+        away_idx: Sequence[int],
+        home_goals: Sequence[int],
+        away_goals: Sequence[int]
+    ) -> PoissonStrengthModel:
+        team_key = tuple(team_ids)
+        fingerprint = self.results_fingerprint(home_idx, away_idx, home_goals, away_goals)
+        with self._lock:
+            cached = self._models.get(league_id)
+
+        if cached and cached[0] == team_key:
+            if cached[1] == fingerprint:
+                return cached[2]
+            model = cached[2].copy().fit(home_idx, away_idx, home_goals, away_goals, warm_start=True)
+        else:
+            model = PoissonStrengthModel(len(team_ids)).fit(home_idx, away_idx, home_goals, away_goals)
+
+        with self._lock:
+            self._models[league_id] = (team_key, fingerprint, model)
+        return model
+
+    def invalidate(self, league_id: Optional[int] = None):
+        """Descarta el modelo de una liga (o todos)"""
+        with self._lock:
+            if league_id is None:
+                self._models.clear()
+            else:
+                self._models.pop(league_id, None)
+
+
+# Caché compartida por la API
+strength_model_cache = StrengthModelCache()
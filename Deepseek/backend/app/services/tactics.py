@@ -0,0 +1,359 @@
+import json
+import os
+import tempfile
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator
+
+import numpy as np
+
+# Una táctica es la combinación (formación, estilo, patadas, avanzadas)
+Tactic = Tuple[str, str, str, str]
+
+# Fuentes de calibración: los partidos de la base de datos y los JSON extraídos
+DB_SOURCE = "db"
+FILES_SOURCE = "files"
+
+# Versión del formato de la caché en disco (las versiones anteriores se descartan)
+CACHE_VERSION = 2
+
+# Rutas resueltas desde el propio módulo (backend/), no desde el directorio de trabajo
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_PATH = os.path.join(BACKEND_DIR, "cache", "tactic_calibration.json")
+DEFAULT_DATA_FILES = [
+    os.path.normpath(os.path.join(BACKEND_DIR, "..", "new_data.json")),
+    os.path.normpath(os.path.join(BACKEND_DIR, "..", "datos_extraidos.json"))
+]
+
+
+class AliasTable:
+    """
+    Tabla de alias (método de Vose) para muestrear una distribución discreta en O(1)
+
+    La construcción es O(K) sobre el número de categorías; cada muestra solo
+    necesita un entero y un uniforme, por lo que el muestreo por lotes es
+    totalmente vectorizado.
+    """
+
+    def __init__(self, weights: np.ndarray):
+        weights = np.asarray(weights, dtype=np.float64)
+        n = len(weights)
+        if n == 0 or weights.sum() <= 0:
+            raise ValueError("Se necesita al menos una categoría con peso positivo")
+
+        scaled = weights * n / weights.sum()
+        prob = np.zeros(n, dtype=np.float64)
+        alias = np.zeros(n, dtype=np.int64)
+
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+
+        # Los restos (por errores de redondeo) tienen probabilidad 1
+        for i in large + small:
+            prob[i] = 1.0
+            alias[i] = i
+
+        self.prob = prob
+        self.alias = alias
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """Devuelve `size` índices de categoría"""
+        columns = rng.integers(0, len(self.prob), size=size)
+        keep = rng.random(size) < self.prob[columns]
+        return np.where(keep, columns, self.alias[columns])
+
+
+class TacticSampler:
+    """
+    Muestreador de tácticas calibrado con la distribución conjunta real de
+    (formación, estilo, patadas, avanzadas) observada en partidos de OSM
+
+    Los conteos se guardan por fuente (archivos JSON extraídos o la tabla de
+    partidos) para poder refrescar cada una por separado, y la distribución se
+    compila a una tabla de alias que se reconstruye solo cuando cambian los
+    conteos. La tabla compilada se publica de una vez, de modo que los hilos
+    que muestrean nunca ven un estado a medias mientras otro refresca.
+    """
+
+    def __init__(self):
+        # {fuente: {"counts": Counter, ...metadatos de refresco}}
+        self.sources: Dict[str, Dict[str, Any]] = {}
+        # (tácticas, tabla de alias, columnas) o None si hay que recompilar
+        self._compiled: Optional[Tuple[List[Tactic], AliasTable, Dict[str, np.ndarray]]] = None
+
+    @staticmethod
+    def tactics_from_records(records: Iterable[Dict[str, Any]]) -> Iterator[Tactic]:
+        """Extrae las tácticas local y visitante de registros con el formato de los JSON extraídos"""
+        for record in records:
+            for side in ("local", "visitante"):
+                formation = record.get(f"alineacion_{side}")
+                if not formation:
+                    continue
+                yield (
+                    formation,
+                    record.get(f"estilo_{side}") or "",
+                    record.get(f"patadas_{side}") or "",
+                    record.get(f"avanzadas_{side}") or ""
+                )
+
+    @staticmethod
+    def read_json_records(path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lee partidos de un archivo JSON extraído
+
+        Acepta tanto listas de partidos (`new_data.json`) como diccionarios de
+        listas agrupadas por formación (`datos_extraidos.json`).
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if isinstance(data, dict):
+            for group in data.values():
+                yield from group
+        else:
+            yield from data
+
+    def add_json_files(self, paths: Iterable[str]) -> bool:
+        """
+        Usa (o vuelve a leer) los archivos JSON existentes como fuente de calibración
+
+        Los archivos pueden contener los mismos partidos en distinto formato
+        (`new_data.json` y `datos_extraidos.json`), así que los registros
+        repetidos entre archivos se cuentan una sola vez.
+
+        Returns:
+            True si se leyeron, False si ningún archivo había cambiado desde la última lectura
+        """
+        files = {}
+        for path in paths:
+            if os.path.exists(path):
+                stat = os.stat(path)
+                files[os.path.abspath(path)] = [stat.st_mtime, stat.st_size]
+
+        source = self.sources.get(FILES_SOURCE)
+        if (source.get("files") if source else {}) == files:
+            return False
+
+        seen = set()
+        records = []
+        for path in files:
+            for record in self.read_json_records(path):
+                key = json.dumps(record, sort_keys=True, ensure_ascii=False)
+                if key not in seen:
+                    seen.add(key)
+                    records.append(record)
+
+        self.sources[FILES_SOURCE] = {"counts": Counter(self.tactics_from_records(records)), "files": files}
+        self._invalidate()
+        return True
+
+    def apply_match_tactics(
+        self,
+        changes: Iterable[Tuple[int, Optional[List[Optional[Tactic]]]]],
+        updated_since: Optional[str] = None,
+        source_name: str = DB_SOURCE
+    ) -> int:
+        """
+        Aplica a una fuente el estado actual de unos partidos
+
+        Cada partido recuerda las tácticas que aportó, de modo que un partido
+        que vuelve a llegar (resultado corregido, tácticas editadas o que deja
+        de contar) resta su aportación anterior antes de sumar la nueva. Volver
+        a aplicar el mismo estado no cambia nada.
+
+        Args:
+            changes: Pares (ID del partido, [táctica local, táctica visitante]);
+                None si el partido no cuenta para la calibración (sin jugar,
+                de una liga táctica...). Una táctica es None si falta la formación
+            updated_since: Marca de agua del refresco (se guarda en la fuente)
+            source_name: Fuente a modificar
+
+        Returns:
+            Número de partidos cuya aportación cambió
+        """
+        source = self.sources.setdefault(source_name, {"counts": Counter(), "matches": {}})
+        counts, matches = source["counts"], source["matches"]
+
+        changed = 0
+        for match_id, tactics in changes:
+            tactics = list(tactics) if tactics is not None else None
+            previous = matches.get(match_id)
+            if previous == tactics:
+                continue
+
+            for tactic in previous or ():
+                if tactic is not None:
+                    counts[tactic] -= 1
+                    if counts[tactic] <= 0:
+                        del counts[tactic]
+            for tactic in tactics or ():
+                if tactic is not None:
+                    counts[tactic] += 1
+
+            if tactics is None:
+                del matches[match_id]
+            else:
+                matches[match_id] = tactics
+            changed += 1
+
+        if updated_since is not None:
+            source["updated_since"] = updated_since
+        if changed:
+            self._invalidate()
+        return changed
+
+    def tracked_matches(self, source_name: str = DB_SOURCE) -> int:
+        """Número de partidos que aportan a una fuente"""
+        return len(self.sources.get(source_name, {}).get("matches", {}))
+
+    def drop_source(self, source_name: str):
+        """Descarta una fuente (p. ej. para reconstruirla desde cero)"""
+        if self.sources.pop(source_name, None) is not None:
+            self._invalidate()
+
+    def _invalidate(self):
+        self._compiled = None
+
+    def _compile(self) -> Tuple[List[Tactic], AliasTable, Dict[str, np.ndarray]]:
+        """Combina los conteos de todas las fuentes y construye la tabla de alias"""
+        total = Counter()
+        for source in self.sources.values():
+            total.update(source["counts"])
+
+        if not total:
+            raise ValueError("El muestreador de tácticas no tiene datos de calibración")
+
+        tactic_list = list(total.keys())
+        table = AliasTable(np.fromiter(total.values(), dtype=np.float64, count=len(total)))
+
+        tactics = np.empty((len(tactic_list), 4), dtype=object)
+        tactics[:] = tactic_list
+        columns = {
+            "formation": tactics[:, 0],
+            "style": tactics[:, 1],
+            "kicks": tactics[:, 2],
+            "attack": tactics[:, 3]
+        }
+
+        self._compiled = (tactic_list, table, columns)
+        return self._compiled
+
+    def snapshot(self) -> "TacticSampler":
+        """
+        Copia para muestrear, ya compilada, con solo los conteos
+
+        Los conteos son pocos (una entrada por táctica distinta), así que la
+        copia es barata y se puede compartir entre hilos mientras el original
+        se sigue refrescando.
+        """
+        sampler = TacticSampler()
+        sampler.sources = {name: {"counts": Counter(source["counts"])} for name, source in self.sources.items()}
+        if sampler.has_data:
+            sampler._compile()
+        return sampler
+
+    @property
+    def has_data(self) -> bool:
+        """Si hay al menos una táctica con la que calibrar"""
+        return any(source["counts"] for source in self.sources.values())
+
+    def sample(self, size: int, rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+        """
+        Muestrea `size` tácticas de la distribución conjunta calibrada
+
+        Returns:
+            Diccionario de columnas (`formation`, `style`, `kicks`, `attack`)
+        """
+        _, table, columns = self._compiled or self._compile()
+
+        rng = rng if rng is not None else np.random.default_rng()
+        indices = table.sample(size, rng)
+        return {name: column[indices] for name, column in columns.items()}
+
+    @property
+    def categories(self) -> int:
+        """Número de tácticas distintas en la calibración"""
+        tactic_list, _, _ = self._compiled or self._compile()
+        return len(tactic_list)
+
+    def save(self, path: str):
+        """Guarda los conteos por fuente y sus marcas de refresco en un JSON"""
+        payload = {"version": CACHE_VERSION, "sources": {}}
+        for name, source in self.sources.items():
+            entry = {key: value for key, value in source.items() if key not in ("counts", "matches")}
+            entry["counts"] = [[*tactic, count] for tactic, count in source["counts"].items()]
+            if "matches" in source:
+                entry["matches"] = [
+                    [match_id, *[list(tactic) if tactic is not None else None for tactic in tactics]]
+                    for match_id, tactics in source["matches"].items()
+                ]
+            payload["sources"][name] = entry
+
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        # Archivo temporal único en el mismo directorio: escrituras concurrentes no se pisan
+        fd, tmp_path = tempfile.mkstemp(prefix=".tactic_calibration.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "TacticSampler":
+        """Carga un muestreador desde la caché en disco (vacío si el formato es antiguo)"""
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        sampler = cls()
+        if payload.get("version") != CACHE_VERSION:
+            return sampler
+
+        for name, entry in payload.get("sources", {}).items():
+            counts = Counter({tuple(row[:4]): row[4] for row in entry.pop("counts", [])})
+            source = {**entry, "counts": counts}
+            if "matches" in entry:
+                source["matches"] = {
+                    row[0]: [tuple(tactic) if tactic is not None else None for tactic in row[1:]]
+                    for row in entry["matches"]
+                }
+            sampler.sources[name] = source
+        return sampler
+
+    @classmethod
+    def load_or_build(
+        cls,
+        cache_path: str = DEFAULT_CACHE_PATH,
+        data_files: Optional[List[str]] = None
+    ) -> "TacticSampler":
+        """
+        Carga la calibración desde la caché y la refresca con los archivos JSON
+
+        Solo se vuelven a leer los archivos si alguno ha cambiado; la caché se
+        reescribe únicamente si hubo cambios. Los partidos de la base de datos
+        se incorporan con `crud.tactics.refresh_tactic_sampler`.
+        """
+        sampler = cls.load(cache_path) if os.path.exists(cache_path) else cls()
+        changed = sampler.add_json_files(data_files if data_files is not None else DEFAULT_DATA_FILES)
+
+        if changed and sampler.sources:
+            sampler.save(cache_path)
+
+        return sampler
@@ -1,14 +1,14 @@
 import json
 import os
 from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
-from ..models.leagues import LeagueCreate, LeagueTeamCreate
-from ..models.teams import TeamCreate
-from ..schemas.leagues import League
+from ..models.leagues import LeagueCreate
+from ..schemas.leagues import League, LeagueTeam
 from ..schemas.teams import Team
-from ..crud import leagues as leagues_crud
 from ..crud import teams as teams_crud
+from .simulation import parse_team_value
 
 class LeagueTemplateLoader:
     """Clase para cargar y gestionar plantillas de ligas desde archivos JSON"""
@@ -101,6 +101,10 @@ class LeagueTemplateLoader:
         """
         Crea una liga y sus equipos a partir de una plantilla
         
+        Todo ocurre en una sola transacción: un INSERT ... ON CONFLICT (name)
+        DO UPDATE SET value para los equipos, el INSERT de la liga y un INSERT
+        multi-fila de sus LeagueTeam.
+        
         Args:
             db: Sesión de base de datos
             template_name: Nombre de la plantilla
@@ -120,8 +124,9 @@ class LeagueTemplateLoader:
         if not league_data:
             raise ValueError(f"League {league_name} not found in template {template_name}")
         
-        # Calcular estadísticas de valor
+        # Un único recorrido: valores de equipos, estadísticas y nombres sin repetir
         teams_data = league_data.get("teams", [])
+        unique_teams = {}
         team_values = []
         lowest_value = float('inf')
         highest_value = 0
@@ -141,58 +146,58 @@ class LeagueTemplateLoader:
             if value_num > highest_value:
                 highest_value = value_num
                 highest_value_team = team
+            
+            # Un nombre repetido conserva su posición y se queda con el último valor
+            unique_teams[team["name"]] = {"name": team["name"], "value": team.get("value")}
         
         avg_value = sum(team_values) / len(team_values) if team_values else 0
-        value_difference = highest_value - lowest_value
-        
-        # Crear primero los equipos
-        created_teams = []
-        for team_data in teams_data:
-            team_create = TeamCreate(
-                name=team_data["name"],
-                value=team_data.get("value"),
-                # No asignar manager ni clan aquí, se hará después
+        value_difference = highest_value - lowest_value if team_values else 0
+        max_teams = league_data.get("team_count", len(teams_data))
+        
+        try:
+            # Crear o actualizar todos los equipos con un solo INSERT ... ON CONFLICT
+            created_teams = teams_crud.upsert_teams_values(db, list(unique_teams.values()))
+            team_ids = {team.name: team.id for team in created_teams}
+            
+            # Crear la liga
+            league_create = LeagueCreate(
+                name=league_name,
+                country=league_data.get("country"),
+                tipo_liga=tipo_liga,
+                league_type=league_data.get("type", "League"),
+                max_teams=max_teams,
+                jornadas=league_data.get("jornadas", 38),  # Valor por defecto
+                manager_id=manager_id,
+                manager_name=manager_name,
+                active=True,
+                highest_value_team_id=team_ids.get(highest_value_team["name"]) if highest_value_team else None,
+                lowest_value_team_id=team_ids.get(lowest_value_team["name"]) if lowest_value_team else None,
+                avg_team_value=avg_value,
+                value_difference=value_difference
             )
             
-            # Verificar si el equipo ya existe
-            existing_team = teams_crud.get_team_by_name(db, team_data["name"])
-            if existing_team:
-                # Actualizar valor si es necesario
-                if existing_team.value != team_data.get("value"):
-                    existing_team.value = team_data.get("value")
-                    db.commit()
-                created_teams.append(existing_team)
-            else:
-                # Crear nuevo equipo
-                new_team = teams_crud.create_team(db, team_create)
-                created_teams.append(new_team)
-        
-        # Crear la liga
-        league_create = LeagueCreate(
-            name=league_name,
-            country=league_data.get("country"),
-            tipo_liga=tipo_liga,
-            league_type=league_data.get("type", "League"),
-            max_teams=league_data.get("team_count", len(teams_data)),
-            jornadas=league_data.get("jornadas", 38),  # Valor por defecto
-            manager_id=manager_id,
-            manager_name=manager_name,
-            active=True,
-            highest_value_team_id=next((t.id for t in created_teams if t.name == highest_value_team["name"]), None) if highest_value_team else None,
-            lowest_value_team_id=next((t.id for t in created_teams if t.name == lowest_value_team["name"]), None) if lowest_value_team else None,
-            avg_team_value=avg_value,
-            value_difference=value_difference
-        )
-        
-        created_league = leagues_crud.create_league(db, league_create)
-        
-        # Asociar equipos a la liga
-        for team in created_teams:
-            league_team = LeagueTeamCreate(
-                league_id=created_league.id,
-                team_id=team.id
+            # Igual que add_team_to_league, no se superan las plazas de la liga
+            league_teams = created_teams[:max_teams]
+            
+            created_league = League(
+                **league_create.dict(),
+                calendar_generated=False,
+                teams_count=len(league_teams)
             )
-            leagues_crud.add_team_to_league(db, league_team)
+            db.add(created_league)
+            db.flush()
+            
+            # Asociar equipos a la liga con un INSERT multi-fila
+            if league_teams:
+                db.execute(
+                    insert(LeagueTeam),
+                    [{"league_id": created_league.id, "team_id": team.id} for team in league_teams]
+                )
+            
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
         
         return created_league, created_teams
     
@@ -207,20 +212,4 @@ class LeagueTemplateLoader:
         Returns:
             Valor numérico
         """
-        try:
-            # Eliminar espacios y convertir comas a puntos
-            clean_str = value_str.replace(" ", "").replace(",", ".")
-            
-            # Extraer el multiplicador (M, K, etc.)
-            multiplier = 1
-            if clean_str.endswith("M"):
-                multiplier = 1000000
-                clean_str = clean_str[:-1]
-            elif clean_str.endswith("K"):
-                multiplier = 1000
-                clean_str = clean_str[:-1]
-            
-            # Convertir a número y aplicar multiplicador
-            return float(clean_str) * multiplier
-        except (ValueError, AttributeError):
-            return 0
\ No newline at end of file
+        return parse_team_value(value_str)
\ No newline at end of file
@@ -0,0 +1,590 @@
+# backend/app/utils/ingest.py
+
+import codecs
+import csv
+import json
+import time
+from typing import Dict, List, Any, Optional, Iterator, Iterable, TextIO, AsyncIterator, Callable, Tuple
+
+from sqlalchemy.dialects import postgresql
+from starlette.concurrency import run_in_threadpool
+
+# Columnas de la tabla de staging, en el orden del COPY
+STAGING_COLUMNS = [
+    "seq", "jornada",
+    "home_team", "home_manager", "home_clan",
+    "away_team", "away_manager", "away_clan",
+    "home_formation", "home_style", "home_attack", "home_kicks",
+    "home_possession", "home_shots", "home_goals",
+    "away_formation", "away_style", "away_attack", "away_kicks",
+    "away_possession", "away_shots", "away_goals"
+]
+
+STAGING_TABLE_SQL = """
+    CREATE TEMP TABLE staging_matches (
+        seq bigint,
+        jornada integer,
+        home_team text,
+        home_manager text,
+        home_clan text,
+        away_team text,
+        away_manager text,
+        away_clan text,
+        home_formation text,
+        home_style text,
+        home_attack text,
+        home_kicks text,
+        home_possession integer,
+        home_shots integer,
+        home_goals integer,
+        away_formation text,
+        away_style text,
+        away_attack text,
+        away_kicks text,
+        away_possession integer,
+        away_shots integer,
+        away_goals integer
+    ) ON COMMIT DROP
+"""
+
+# Un equipo se crea con el primer manager (y clan) con el que aparece
+UPSERT_TEAMS_SQL = """
+    INSERT INTO teams (name, manager, clan)
+    SELECT DISTINCT ON (name) name, manager, clan
+    FROM (
+        SELECT seq, 0 AS side, home_team AS name, home_manager AS manager, home_clan AS clan FROM staging_matches
+        UNION ALL
+        SELECT seq, 1 AS side, away_team, away_manager, away_clan FROM staging_matches
+    ) appearances
+    ORDER BY name, seq, side
+    ON CONFLICT (name) DO NOTHING
+"""
+
+# Datos de un partido extraído que, junto con los equipos, lo identifican: los
+# archivos no traen fecha ni jornada, así que un mismo partido solo se reconoce
+# por su contenido (puede aparecer en varios archivos y en otra posición)
+MATCH_DATA_COLUMNS = [
+    "home_formation", "home_style", "home_attack", "home_kicks",
+    "home_possession", "home_shots", "home_goals",
+    "away_formation", "away_style", "away_attack", "away_kicks",
+    "away_possession", "away_shots", "away_goals"
+]
+
+# Se fusiona una sola vez cada partido de staging (su primera aparición) y se
+# omiten los que ya existen en la liga con los mismos equipos y datos. La
+# jornada se toma de la primera aparición, pero no interviene en la deduplicación
+MERGE_MATCHES_SQL = f"""
+    WITH unique_matches AS (
+        SELECT DISTINCT ON (home_team, away_team, {", ".join(MATCH_DATA_COLUMNS)}) *
+        FROM staging_matches
+        ORDER BY home_team, away_team, {", ".join(MATCH_DATA_COLUMNS)}, seq
+    )
+    INSERT INTO matches (
+        jornada, home_team_id, away_team_id, league_id,
+        {", ".join(MATCH_DATA_COLUMNS)},
+        created_at, updated_at
+    )
+    SELECT
+        s.jornada, home.id, away.id, %(league_id)s,
+        {", ".join(f"s.{column}" for column in MATCH_DATA_COLUMNS)},
+        now(), now()
+    FROM unique_matches s
+    JOIN teams home ON home.name = s.home_team
+    JOIN teams away ON away.name = s.away_team
+    WHERE NOT EXISTS (
+        SELECT 1 FROM matches m
+        WHERE m.league_id IS NOT DISTINCT FROM %(league_id)s
+          AND m.home_team_id = home.id
+          AND m.away_team_id = away.id
+          AND {" AND ".join(f"m.{column} IS NOT DISTINCT FROM s.{column}" for column in MATCH_DATA_COLUMNS)}
+    )
+    ORDER BY s.seq
+"""
+
+# Inscribe en la liga los equipos de los partidos cargados que aún no lo están
+# (la clasificación solo cuenta partidos entre equipos inscritos)
+ENROLL_TEAMS_SQL = """
+    INSERT INTO league_teams (league_id, team_id, registration_date)
+    SELECT %(league_id)s, t.id, now()
+    FROM (
+        SELECT home_team AS name FROM staging_matches
+        UNION
+        SELECT away_team FROM staging_matches
+    ) names
+    JOIN teams t ON t.name = names.name
+    WHERE NOT EXISTS (
+        SELECT 1 FROM league_teams lt WHERE lt.league_id = %(league_id)s AND lt.team_id = t.id
+    )
+"""
+
+
+def generate_clan(team_name: str, manager_name: str) -> str:
+    """Genera un clan único de 3 letras mayúsculas basado en equipo y manager"""
+    # Intentar obtener 3 letras del apellido del manager
+    manager_parts = manager_name.upper().split()
+    if len(manager_parts) > 1:
+        last_name = manager_parts[-1]
+        clean_last = ''.join([c for c in last_name if c.isalpha()])[:3]
+        if len(clean_last) == 3:
+            return clean_last
+
+    # Si no tiene apellido válido, usar código del equipo
+    team_keywords = {
+        "REAL": "REL",
+        "ATLÉTICO": "ATL",
+        "DEPORTIVO": "DEP",
+        "UNIÓN": "UNI",
+        "SPORTING": "SPO"
+    }
+
+    # Buscar palabras clave en el nombre del equipo
+    for keyword, code in team_keywords.items():
+        if keyword in team_name.upper():
+            return code
+
+    # Tomar primeras 3 letras limpias del primer palabra del equipo
+    first_word = team_name.upper().split()[0]
+    clean_word = ''.join([c for c in first_word if c.isalpha()])
+    return clean_word[:3] if len(clean_word) >= 3 else "CLN"
+
+
+def iter_json_records(f: TextIO, chunk_size: int = 1 << 20) -> Iterator[Dict[str, Any]]:
+    """
+    Lee partidos de un JSON extraído de forma incremental
+
+    Acepta listas de partidos (`new_data.json`) y diccionarios de listas
+    agrupadas por formación (`datos_extraidos.json`). Solo mantiene en
+    memoria el fragmento que se está decodificando.
+
+    Args:
+        f: Archivo de texto abierto
+        chunk_size: Caracteres a leer en cada lectura
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = f.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def next_char() -> str:
+        """Salta espacios y devuelve el siguiente carácter sin consumirlo ('' al final)"""
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not fill():
+                return ""
+
+    def expect(char: str):
+        nonlocal pos
+        found = next_char()
+        if found != char:
+            raise ValueError(f"JSON inválido: se esperaba '{char}' y se encontró '{found or 'fin de archivo'}'")
+        pos += 1
+
+    def decode() -> Any:
+        nonlocal pos
+        next_char()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # Valor incompleto: leer más y reintentar
+                if not fill():
+                    raise
+                continue
+            # Un valor al final del buffer puede estar cortado (p. ej. un número)
+            if end == len(buf) and fill():
+                continue
+            pos = end
+            return value
+
+    def iter_list() -> Iterator[Dict[str, Any]]:
+        nonlocal pos
+        expect("[")
+        if next_char() == "]":
+            pos += 1
+            return
+        while True:
+            yield decode()
+            separator = next_char()
+            pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"JSON inválido: separador inesperado '{separator or 'fin de archivo'}'")
+
+    first = next_char()
+    if first == "[":
+        yield from iter_list()
+    elif first == "{":
+        pos += 1
+        if next_char() == "}":
+            return
+        while True:
+            decode()  # Clave del grupo (formación)
+            expect(":")
+            yield from iter_list()
+            separator = next_char()
+            pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"JSON inválido: separador inesperado '{separator or 'fin de archivo'}'")
+    else:
+        raise ValueError("JSON inválido: se esperaba una lista o un diccionario de listas")
+
+
+def _safe_int(value, default=0):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _copy_field(value: Any) -> str:
+    """Formatea un valor para el formato de texto de COPY"""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def staging_row(record: Dict[str, Any], seq: int, jornada: int) -> List[Any]:
+    """Convierte un partido extraído en una fila de staging (mismos valores por defecto que teste.py)"""
+    home_team = record["equipo_local"]
+    away_team = record["equipo_visitante"]
+    home_manager = record.get("manager_local") or ""
+    away_manager = record.get("manager_visitante") or ""
+
+    return [
+        seq,
+        jornada,
+        home_team, home_manager, generate_clan(home_team, home_manager),
+        away_team, away_manager, generate_clan(away_team, away_manager),
+        record.get("alineacion_local", "4-4-2"),
+        record.get("estilo_local", "Balanced"),
+        record.get("avanzadas_local", "50-50-50"),
+        record.get("patadas_local", "Normal"),
+        _safe_int(record.get("posesion_local", 50)),
+        _safe_int(record.get("disparos_local", 0)),
+        _safe_int(record.get("goles_local", 0)),
+        record.get("alineacion_visitante", "4-4-2"),
+        record.get("estilo_visitante", "Balanced"),
+        record.get("avanzadas_visitante", "50-50-50"),
+        record.get("patadas_visitante", "Normal"),
+        _safe_int(record.get("posesion_visitante", 50)),
+        _safe_int(record.get("disparos_visitante", 0)),
+        _safe_int(record.get("goles_visitante", 0))
+    ]
+
+
+class CopyStream:
+    """
+    Adaptador de archivo para COPY FROM STDIN que genera las líneas bajo demanda
+
+    psycopg2 llama a `read(size)`, por lo que el JSON se decodifica a la vez
+    que se envía a PostgreSQL sin acumular todas las filas en memoria.
+    """
+
+    def __init__(self, rows: Iterable[List[Any]]):
+        self._rows = iter(rows)
+        self._buffer = ""
+        self.rows = 0
+
+    def read(self, size: int = -1) -> str:
+        parts = [self._buffer]
+        length = len(self._buffer)
+
+        while size < 0 or length < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            line = "\t".join(_copy_field(value) for value in row) + "\n"
+            parts.append(line)
+            length += len(line)
+            self.rows += 1
+
+        data = "".join(parts)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+    def readline(self, size: int = -1) -> str:
+        return self.read(size)
+
+
+def ingest_match_files(
+    connection,
+    paths: List[str],
+    league_id: Optional[int] = None,
+    matches_per_jornada: int = 10
+) -> Dict[str, Any]:
+    """
+    Carga partidos extraídos de uno o varios JSON en una sola transacción
+
+    Los registros se leen de forma incremental y se vuelcan con COPY a una
+    tabla temporal de staging. Después, un único INSERT ... ON CONFLICT crea
+    los equipos nuevos y un INSERT ... SELECT fusiona los partidos que aún no
+    existen (misma liga, equipos y datos del partido; los repetidos dentro de
+    la carga se fusionan una sola vez). Con `league_id`, los equipos se
+    inscriben en la liga y sus contadores y clasificación se actualizan en la
+    misma transacción.
+
+    Args:
+        connection: Conexión DBAPI de psycopg2 (p. ej. `engine.raw_connection()`)
+        paths: Archivos JSON a cargar
+        league_id: Liga a la que asignar los partidos (opcional)
+        matches_per_jornada: Partidos por jornada al numerar cada archivo
+
+    Returns:
+        Diccionario con el número de registros, equipos creados e inscritos y
+        partidos creados, los tiempos de cada fase y las filas por segundo
+    """
+    started = time.perf_counter()
+    cursor = connection.cursor()
+
+    try:
+        cursor.execute(STAGING_TABLE_SQL)
+
+        records = 0
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                # La jornada se calcula por posición dentro de cada archivo
+                rows = (
+                    staging_row(record, records + i, i // matches_per_jornada + 1)
+                    for i, record in enumerate(iter_json_records(f))
+                )
+                stream = CopyStream(rows)
+                cursor.copy_expert(
+                    f"COPY staging_matches ({', '.join(STAGING_COLUMNS)}) FROM STDIN",
+                    stream
+                )
+                records += stream.rows
+        copied = time.perf_counter()
+
+        # Las tablas temporales no se analizan automáticamente
+        cursor.execute("ANALYZE staging_matches")
+
+        cursor.execute(UPSERT_TEAMS_SQL)
+        teams_created = cursor.rowcount
+
+        teams_enrolled = 0
+        if league_id is not None:
+            # Fila de la liga bloqueada hasta el commit, como en add_team_to_league
+            cursor.execute("SELECT id FROM leagues WHERE id = %(league_id)s FOR UPDATE", {"league_id": league_id})
+
+        cursor.execute(MERGE_MATCHES_SQL, {"league_id": league_id})
+        matches_created = cursor.rowcount
+
+        if league_id is not None:
+            cursor.execute(ENROLL_TEAMS_SQL, {"league_id": league_id})
+            teams_enrolled = cursor.rowcount
+
+        # Contadores y clasificación persistida de la liga en la misma transacción
+        if league_id is not None and (matches_created or teams_enrolled):
+            # Import diferido: el lector de JSON/CSV de este módulo no necesita la base de datos
+            from ..crud.standings import rebuild_statements
+            
+            cursor.execute(
+                """
+                UPDATE leagues
+                SET matches_count = COALESCE(matches_count, 0) + %(matches)s,
+                    teams_count = COALESCE(teams_count, 0) + %(teams)s
+                WHERE id = %(league_id)s
+                """,
+                {"matches": matches_created, "teams": teams_enrolled, "league_id": league_id}
+            )
+            for statement in rebuild_statements(league_id):
+                cursor.execute(str(statement.compile(
+                    dialect=postgresql.dialect(),
+                    compile_kwargs={"literal_binds": True}
+                )))
+
+        connection.commit()
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    finished = time.perf_counter()
+    elapsed = finished - started
+
+    return {
+        "records": records,
+        "teams_created": teams_created,
+        "teams_enrolled": teams_enrolled,
+        "matches_created": matches_created,
+        "matches_skipped": records - matches_created,
+        "copy_seconds": round(copied - started, 3),
+        "merge_seconds": round(finished - copied, 3),
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(records / elapsed, 1) if elapsed > 0 else None
+    }
+
+
+# Campos de resultado que se aceptan en la carga de resultados reales
+RESULT_FIELDS = [
+    "home_goals", "away_goals",
+    "home_possession", "away_possession",
+    "home_shots", "away_shots",
+    "home_shots_on_target", "away_shots_on_target",
+    "home_fouls", "away_fouls"
+]
+
+# Un resultado identifica su partido por ID o por (jornada, local, visitante)
+RESULT_KEY_FIELDS = ["match_id", "jornada", "home_team_id", "away_team_id"]
+
+# Máximo de errores por línea que se devuelven en el resumen
+MAX_REPORTED_ERRORS = 100
+
+
+async def aiter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Convierte un flujo de bytes en (número de línea, línea) omitiendo las vacías"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    line_no = 0
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line.rstrip("\r")
+
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        yield line_no + 1, pending.rstrip("\r")
+
+
+def parse_result_record(raw: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Valida un resultado y convierte sus campos a enteros
+
+    Raises:
+        ValueError: Si falta la identificación del partido, no hay ningún
+            campo de resultado, solo viene uno de los dos goles o un valor
+            no es entero
+    """
+    record = {}
+    for field in RESULT_KEY_FIELDS + RESULT_FIELDS:
+        value = raw.get(field)
+        if value is None or value == "":
+            continue
+        try:
+            record[field] = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Valor no entero en '{field}': {value!r}")
+
+    if "match_id" not in record and not all(
+        field in record for field in ("jornada", "home_team_id", "away_team_id")
+    ):
+        raise ValueError("Falta match_id o (jornada, home_team_id, away_team_id)")
+    if not any(field in record for field in RESULT_FIELDS):
+        raise ValueError("El registro no contiene campos de resultado")
+    # Un solo gol dejaría el partido a medio puntuar
+    if ("home_goals" in record) != ("away_goals" in record):
+        raise ValueError("Se necesitan home_goals y away_goals juntos")
+
+    return record
+
+
+async def ingest_result_stream(
+    chunks: AsyncIterator[bytes],
+    fmt: str,
+    apply_batch: Callable[[List[Tuple[int, Dict[str, int]]]], Dict[str, Any]],
+    batch_size: int = 500
+) -> Dict[str, Any]:
+    """
+    Lee resultados NDJSON o CSV de forma incremental y los aplica por lotes
+
+    Cada lote se aplica con `apply_batch` en el threadpool (una transacción
+    por lote), de modo que el flujo se sigue leyendo sin bloquear el bucle
+    de eventos. En CSV la primera línea es la cabecera y los valores no
+    pueden contener saltos de línea.
+
+    Args:
+        chunks: Flujo de bytes de la petición
+        fmt: `ndjson` o `csv`
+        apply_batch: Función que recibe [(línea, resultado)] y devuelve
+            `updated`, `calendar_entries_played` y `errors`
+        batch_size: Resultados por lote
+
+    Returns:
+        Resumen con registros leídos, partidos actualizados, entradas del
+        calendario marcadas como jugadas, lotes y errores por línea
+    """
+    started = time.perf_counter()
+    summary = {
+        "records": 0,
+        "updated": 0,
+        "calendar_entries_played": 0,
+        "batches": 0,
+        "errors_count": 0,
+        "errors": []
+    }
+
+    def add_errors(errors: List[Dict[str, Any]]):
+        summary["errors_count"] += len(errors)
+        room = MAX_REPORTED_ERRORS - len(summary["errors"])
+        if room > 0:
+            summary["errors"].extend(errors[:room])
+
+    async def flush(batch: List[Tuple[int, Dict[str, int]]]):
+        result = await run_in_threadpool(apply_batch, batch)
+        summary["batches"] += 1
+        summary["updated"] += len(result["updated"])
+        summary["calendar_entries_played"] += result["calendar_entries_played"]
+        add_errors(result["errors"])
+
+    header = None
+    batch = []
+    async for line_no, line in aiter_lines(chunks):
+        if fmt == "csv" and header is None:
+            header = [name.strip() for name in next(csv.reader([line]))]
+            continue
+
+        summary["records"] += 1
+        try:
+            if fmt == "csv":
+                raw = dict(zip(header, next(csv.reader([line]))))
+            else:
+                raw = json.loads(line)
+                if not isinstance(raw, dict):
+                    raise ValueError("Cada línea debe ser un objeto JSON")
+            batch.append((line_no, parse_result_record(raw)))
+        except ValueError as e:
+            add_errors([{"line": line_no, "detail": str(e)}])
+
+        if len(batch) >= batch_size:
+            await flush(batch)
+            batch = []
+
+    if batch:
+        await flush(batch)
+
+    summary["errors"].sort(key=lambda error: error["line"])
+    summary["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+    return summary
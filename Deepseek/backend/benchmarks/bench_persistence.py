@@ -0,0 +1,143 @@
+"""
+Benchmark de persistencia de la simulación de ligas (leagues_crud.simulate_league)
+
+Necesita una base de datos PostgreSQL en DATABASE_URL (usa una base de datos
+de pruebas: el script crea las tablas que falten y, para cada tamaño, crea
+equipos y una liga táctica que elimina al terminar). Cuenta los commits y los
+viajes a la base de datos (ejecuciones de cursor) de cada simulación mediante
+eventos del motor de SQLAlchemy.
+
+Uso (desde backend/):
+    python benchmarks/bench_persistence.py
+    python benchmarks/bench_persistence.py --teams 10 20 40 --output persistence_report.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Any, List
+
+# Permitir ejecutar el script directamente desde backend/ o desde benchmarks/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from sqlalchemy import event
+
+from app.database import engine, SessionLocal, Base
+from app.schemas.teams import Team
+from app.schemas.leagues import League, LeagueTeam, TipoLiga
+from app.crud import leagues as leagues_crud
+from app.services.simulation import TournamentSimulator
+
+
+class QueryCounter:
+    """Cuenta commits y ejecuciones de cursor (por tipo de sentencia) en el motor"""
+
+    def __init__(self):
+        self.commits = 0
+        self.statements = Counter()
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine, "commit", self._on_commit)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements[statement.lstrip().split(None, 1)[0].upper()] += 1
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def reset(self):
+        self.commits = 0
+        self.statements.clear()
+
+    @property
+    def round_trips(self) -> int:
+        return sum(self.statements.values())
+
+
+def create_league(n_teams: int) -> Dict[str, Any]:
+    """Crea equipos y una liga táctica de prueba (fuera de la medición)"""
+    db = SessionLocal()
+    try:
+        tag = f"bench-{os.getpid()}-{time.time_ns()}"
+        teams = [Team(name=f"{tag} team {i}") for i in range(n_teams)]
+        db.add_all(teams)
+        league = League(
+            name=f"{tag} league",
+            tipo_liga=TipoLiga.LIGA_TACTICA,
+            max_teams=n_teams,
+            jornadas=2 * (n_teams - 1)
+        )
+        db.add(league)
+        db.flush()
+        db.add_all([LeagueTeam(league_id=league.id, team_id=team.id) for team in teams])
+        db.commit()
+        return {"league_id": league.id, "team_ids": [team.id for team in teams]}
+    finally:
+        db.close()
+
+
+def drop_league(fixture: Dict[str, Any]):
+    db = SessionLocal()
+    try:
+        leagues_crud.delete_league(db, fixture["league_id"])
+        db.query(Team).filter(Team.id.in_(fixture["team_ids"])).delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def run_case(n_teams: int, counter: QueryCounter) -> Dict[str, Any]:
+    fixture = create_league(n_teams)
+    db = SessionLocal()
+    try:
+        simulator = TournamentSimulator(rng=np.random.default_rng(0))
+        counter.reset()
+        started = time.perf_counter()
+        matches = leagues_crud.simulate_league(db, fixture["league_id"], simulator)
+        elapsed = time.perf_counter() - started
+
+        return {
+            "teams": n_teams,
+            "matches": len(matches or []),
+            "commits": counter.commits,
+            "round_trips": counter.round_trips,
+            "statements": dict(counter.statements),
+            "elapsed_seconds": elapsed
+        }
+    finally:
+        db.close()
+        drop_league(fixture)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de persistencia de la simulación de ligas")
+    parser.add_argument("--teams", type=int, nargs="*", default=[10, 20, 40], help="Tamaños de liga a medir")
+    parser.add_argument("--output", help="Ruta opcional del informe JSON")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    counter = QueryCounter()
+
+    results: List[Dict[str, Any]] = []
+    for n_teams in args.teams:
+        result = run_case(n_teams, counter)
+        results.append(result)
+        print(
+            f"{n_teams:5d} equipos  {result['matches']:6d} partidos  "
+            f"{result['commits']:4d} commits  {result['round_trips']:5d} viajes  "
+            f"{result['elapsed_seconds'] * 1000:9.1f} ms  {result['statements']}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"generated_at": datetime.now().isoformat(), "results": results}, f, indent=2)
+        print(f"Informe guardado en {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+Benchmarks del servicio de simulación (MatchSimulator y TournamentSimulator)
+
+No necesita base de datos. Mide cada caso varias veces, escribe un informe
+JSON y lo compara con una línea base guardada, fallando si algún caso es
+más lento que la línea base multiplicada por el umbral.
+
+Uso (desde backend/):
+    python benchmarks/bench_simulation.py
+    python benchmarks/bench_simulation.py --output bench_report.json --threshold 1.3
+    python benchmarks/bench_simulation.py --update-baseline
+
+La línea base depende de la máquina: regenérala con --update-baseline en la
+máquina de referencia antes de comparar.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Tuple
+
+# Permitir ejecutar el script directamente desde backend/ o desde benchmarks/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from app.services.simulation import MatchSimulator, TournamentSimulator
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, "baseline.json")
+
+TEAM_SIZES = [10, 20, 200, 2000]
+
+# Jornadas a generar por tamaño (None = doble round robin completo)
+FIXTURE_JORNADAS = {10: None, 20: None, 200: None, 2000: 4}
+
+SCALAR_CALLS = 10000
+
+
+def _team_names(n_teams: int) -> List[str]:
+    return [f"Team {i}" for i in range(n_teams)]
+
+
+def build_cases() -> List[Tuple[str, Callable[[], object], int]]:
+    """
+    Construye la lista de casos (nombre, función, operaciones por ejecución)
+
+    Los datos de entrada se preparan fuera de la función medida.
+    """
+    random.seed(0)
+    match_simulator = MatchSimulator(rng=np.random.default_rng(0))
+    tournament = TournamentSimulator(rng=np.random.default_rng(0))
+
+    cases = [
+        (
+            "generate_formation",
+            lambda: [match_simulator.generate_formation() for _ in range(SCALAR_CALLS)],
+            SCALAR_CALLS
+        ),
+        (
+            "generate_pre_match_data",
+            lambda: [match_simulator.generate_pre_match_data("Home", "Away") for _ in range(SCALAR_CALLS)],
+            SCALAR_CALLS
+        ),
+        (
+            "simulate_match",
+            lambda: [match_simulator.simulate_match("Home", "Away") for _ in range(SCALAR_CALLS)],
+            SCALAR_CALLS
+        ),
+    ]
+
+    for n_teams in TEAM_SIZES:
+        teams = _team_names(n_teams)
+        jornadas = FIXTURE_JORNADAS[n_teams]
+        label = f"{n_teams} teams" if jornadas is None else f"{n_teams} teams, {jornadas} jornadas"
+
+        matches = tournament.generate_fixture(teams, jornadas=jornadas, simulate_results=True)
+
+        cases.append((
+            f"generate_fixture[{label}]",
+            lambda teams=teams, jornadas=jornadas: tournament.generate_fixture(teams, jornadas=jornadas),
+            len(matches)
+        ))
+        cases.append((
+            f"generate_fixture_simulated[{label}]",
+            lambda teams=teams, jornadas=jornadas: tournament.generate_fixture(teams, jornadas=jornadas, simulate_results=True),
+            len(matches)
+        ))
+        cases.append((
+            f"calculate_standings[{label}]",
+            lambda matches=matches: tournament._calculate_standings(matches),
+            len(matches)
+        ))
+
+    return cases
+
+
+def run_case(func: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Ejecuta una vez de calentamiento y `repeat` veces medidas"""
+    func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "repeat": repeat
+    }
+
+
+def run_benchmarks(repeat: int, only: List[str] = None) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, func, ops in build_cases():
+        if only and not any(pattern in name for pattern in only):
+            continue
+
+        timing = run_case(func, repeat)
+        timing["ops"] = ops
+        timing["ops_per_second"] = ops / timing["min"] if timing["min"] > 0 else float("inf")
+        results[name] = timing
+        print(f"{name:60s} min {timing['min'] * 1000:10.3f} ms  median {timing['median'] * 1000:10.3f} ms")
+
+    return results
+
+
+def compare_with_baseline(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float
+) -> List[str]:
+    """Devuelve la lista de casos cuyo tiempo mínimo supera baseline * threshold"""
+    regressions = []
+    for name, timing in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+
+        ratio = timing["min"] / reference["min"] if reference["min"] > 0 else float("inf")
+        timing["baseline_min"] = reference["min"]
+        timing["ratio"] = ratio
+        if ratio > threshold:
+            regressions.append(f"{name}: {ratio:.2f}x ({reference['min'] * 1000:.3f} ms -> {timing['min'] * 1000:.3f} ms)")
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks del servicio de simulación")
+    parser.add_argument("--output", default="bench_report.json", help="Ruta del informe JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Ruta de la línea base JSON")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Ratio máximo permitido respecto a la línea base")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones medidas por caso")
+    parser.add_argument("--only", nargs="*", help="Ejecutar solo los casos que contengan estos textos")
+    parser.add_argument("--update-baseline", action="store_true", help="Guardar los resultados como nueva línea base")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeat, args.only)
+
+    regressions = []
+    if not args.update_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "threshold": args.threshold,
+        "results": results,
+        "regressions": regressions
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Informe guardado en {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({k: v for k, v in report.items() if k != "regressions"}, f, indent=2)
+        print(f"Línea base actualizada en {args.baseline}")
+        return 0
+
+    if regressions:
+        print("Regresiones detectadas:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
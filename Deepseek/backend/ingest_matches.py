@@ -0,0 +1,56 @@
+"""
+Carga masiva de partidos extraídos de OSM (JSON) en la base de datos
+
+Lee los archivos de forma incremental y los vuelca con COPY a una tabla de
+staging antes de fusionarlos con `teams` y `matches` en una sola transacción.
+Acepta listas de partidos (`new_data.json`) y diccionarios agrupados por
+formación (`datos_extraidos.json`).
+
+Uso (desde backend/):
+    python ingest_matches.py ../new_data.json
+    python ingest_matches.py ../datos_extraidos.json --league-id 3 --matches-per-jornada 10
+"""
+import argparse
+import json
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.database import engine, Base
+from app.utils.ingest import ingest_match_files
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Carga masiva de partidos desde JSON extraídos")
+    parser.add_argument("paths", nargs="*", default=["../new_data.json"], help="Archivos JSON a cargar")
+    parser.add_argument("--league-id", type=int, help="Liga a la que asignar los partidos")
+    parser.add_argument("--matches-per-jornada", type=int, default=10, help="Partidos por jornada al numerar cada archivo")
+    parser.add_argument("--create-tables", action="store_true", help="Crear las tablas que falten antes de cargar")
+    args = parser.parse_args()
+
+    if args.create_tables:
+        Base.metadata.create_all(bind=engine)
+
+    connection = engine.raw_connection()
+    try:
+        report = ingest_match_files(
+            connection,
+            args.paths,
+            league_id=args.league_id,
+            matches_per_jornada=args.matches_per_jornada
+        )
+    finally:
+        connection.close()
+
+    print(json.dumps(report, indent=2))
+    print(
+        f"✅ {report['records']} registros leídos, {report['teams_created']} equipos y "
+        f"{report['matches_created']} partidos creados ({report['rows_per_second']} filas/s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
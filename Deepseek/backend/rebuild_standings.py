@@ -0,0 +1,45 @@
+"""
+Reconstruye la clasificación persistida (league_standings) desde los partidos
+
+Reparación del modelo de lectura que se mantiene de forma incremental. Sin
+argumentos reconstruye todas las ligas.
+
+Uso (desde backend/):
+    python rebuild_standings.py
+    python rebuild_standings.py --league-id 3 --league-id 7
+"""
+import argparse
+import sys
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.database import SessionLocal
+from app.crud.standings import rebuild_league_standings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reconstruye la clasificación persistida desde los partidos")
+    parser.add_argument(
+        "--league-id", type=int, action="append",
+        help="Liga a reconstruir (se puede repetir; por defecto todas)"
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        for league_id in args.league_id or [None]:
+            started = time.perf_counter()
+            rows = rebuild_league_standings(db, league_id)
+            target = f"liga {league_id}" if league_id is not None else "todas las ligas"
+            print(f"{target}: {rows} filas en {time.perf_counter() - started:.2f} s")
+    finally:
+        db.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
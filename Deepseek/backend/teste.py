@@ -7,38 +7,10 @@ from sqlalchemy.orm import Session
 from .app.models import TeamCreate, MatchCreate
 from .app.database import SessionLocal, engine, Base
 from .app.crud import create_team, create_match
+from .app.utils.ingest import generate_clan
 
 load_dotenv()
 
-def generate_clan(team_name: str, manager_name: str) -> str:
-    """Genera un clan único de 3 letras mayúsculas basado en equipo y manager"""
-    # Intentar obtener 3 letras del apellido del manager
-    manager_parts = manager_name.upper().split()
-    if len(manager_parts) > 1:
-        last_name = manager_parts[-1]
-        clean_last = ''.join([c for c in last_name if c.isalpha()])[:3]
-        if len(clean_last) == 3:
-            return clean_last
-    
-    # Si no tiene apellido válido, usar código del equipo
-    team_keywords = {
-        "REAL": "REL",
-        "ATLÉTICO": "ATL",
-        "DEPORTIVO": "DEP",
-        "UNIÓN": "UNI",
-        "SPORTING": "SPO"
-    }
-    
-    # Buscar palabras clave en el nombre del equipo
-    for keyword, code in team_keywords.items():
-        if keyword in team_name.upper():
-            return code
-    
-    # Tomar primeras 3 letras limpias del primer palabra del equipo
-    first_word = team_name.upper().split()[0]
-    clean_word = ''.join([c for c in first_word if c.isalpha()])
-    return clean_word[:3] if len(clean_word) >= 3 else "CLN"
-
 def calculate_jornadas(matches: List[Dict], matches_per_jornada: int = 10) -> List[Dict]:
     """Organiza los partidos en jornadas de forma equilibrada"""
     for i, match in enumerate(matches):
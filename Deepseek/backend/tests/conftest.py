@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+# Permitir importar el paquete app al ejecutar pytest desde backend/ o desde tests/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="module")
+def db_connection():
+    """
+    Conexión a la base de datos de DATABASE_URL dentro de una transacción que se deshace
+
+    Los tests que la usan se omiten si no hay base de datos. Necesita el
+    esquema al día (alembic upgrade head).
+    """
+    if not os.getenv("DATABASE_URL"):
+        pytest.skip("Necesita una base de datos PostgreSQL en DATABASE_URL")
+
+    from app.database import engine
+
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            yield connection
+        finally:
+            transaction.rollback()
@@ -0,0 +1,57 @@
+import io
+import json
+
+import pytest
+
+from app.utils.ingest import iter_json_records, parse_result_record
+
+RECORDS = [
+    {"equipo_local": "Real \"Madrid\"", "goles_local": 2, "goles_visitante": 1, "equipo_visitante": "Atlético"},
+    {"equipo_local": "Bar\\ça", "goles_local": 0, "goles_visitante": 0, "equipo_visitante": "Sevilla ñ {[,]}"},
+    {"equipo_local": "Betis", "goles_local": 10, "goles_visitante": 3, "equipo_visitante": "Girona", "extra": [1, {"a": None}]},
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+def test_list_format_across_chunk_boundaries(chunk_size):
+    text = json.dumps(RECORDS, ensure_ascii=False, indent=2)
+
+    assert list(iter_json_records(io.StringIO(text), chunk_size=chunk_size)) == RECORDS
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_grouped_format_across_chunk_boundaries(chunk_size):
+    grouped = {"433A": RECORDS[:2], "442B": [], "541A": RECORDS[2:]}
+    text = json.dumps(grouped, ensure_ascii=False)
+
+    assert list(iter_json_records(io.StringIO(text), chunk_size=chunk_size)) == RECORDS
+
+
+def test_empty_list():
+    assert list(iter_json_records(io.StringIO("  [ ]  "), chunk_size=1)) == []
+
+
+def test_truncated_file_raises():
+    text = json.dumps(RECORDS)[:-5]
+
+    with pytest.raises(ValueError):
+        list(iter_json_records(io.StringIO(text), chunk_size=4))
+
+
+def test_parse_result_record():
+    record = parse_result_record({"match_id": "7", "home_goals": "2", "away_goals": 0, "home_shots": ""})
+
+    assert record == {"match_id": 7, "home_goals": 2, "away_goals": 0}
+    assert parse_result_record({"jornada": 1, "home_team_id": 2, "away_team_id": 3, "home_fouls": 4})["home_fouls"] == 4
+
+
+@pytest.mark.parametrize("raw", [
+    {"home_goals": 1, "away_goals": 1},
+    {"match_id": 1},
+    {"match_id": 1, "home_goals": 2},
+    {"match_id": 1, "away_goals": 2, "home_shots": 5},
+    {"match_id": 1, "home_goals": "dos", "away_goals": 1},
+])
+def test_parse_result_record_rejects_invalid(raw):
+    with pytest.raises(ValueError):
+        parse_result_record(raw)
@@ -0,0 +1,80 @@
+"""
+Número de consultas de leagues_crud.get_league_with_details
+
+Crea ligas con distinto número de equipos (con podio y extremos de valor
+asignados) dentro de la transacción de `db_connection` y cuenta las
+ejecuciones de cursor al armar el detalle: no deben depender del número de
+equipos.
+"""
+import os
+import time
+from typing import List
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+# Sin base de datos ni siquiera se pueden importar los módulos crud
+if not os.getenv("DATABASE_URL"):
+    pytest.skip("Necesita una base de datos PostgreSQL en DATABASE_URL", allow_module_level=True)
+
+from app.schemas.teams import Team
+from app.schemas.leagues import League, LeagueTeam, TipoLiga
+from app.crud import leagues as leagues_crud
+
+# Viajes a la base de datos permitidos para el detalle de una liga
+MAX_QUERIES = 2
+
+
+def create_league(db: Session, tag: str, n_teams: int) -> int:
+    """Crea una liga con `n_teams` equipos inscritos, podio y extremos de valor"""
+    team_ids = db.scalars(
+        insert(Team).returning(Team.id),
+        [{"name": f"{tag} {n_teams}-{i}", "value": f"{10 + i},0M"} for i in range(n_teams)]
+    ).all() if n_teams else []
+
+    league = League(
+        name=f"{tag} {n_teams}",
+        tipo_liga=TipoLiga.LIGA_TACTICA,
+        max_teams=max(n_teams, 1),
+        jornadas=2 * max(n_teams - 1, 1),
+        teams_count=n_teams
+    )
+    if len(team_ids) >= 3:
+        league.winner_id, league.runner_up_id, league.third_place_id = team_ids[:3]
+        league.highest_value_team_id, league.lowest_value_team_id = team_ids[-1], team_ids[0]
+    db.add(league)
+    db.flush()
+
+    if team_ids:
+        db.execute(insert(LeagueTeam), [{"league_id": league.id, "team_id": team_id} for team_id in team_ids])
+    db.flush()
+    return league.id
+
+
+@pytest.fixture(scope="module")
+def db(db_connection):
+    session = Session(bind=db_connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+
+
+@pytest.mark.parametrize("n_teams", [0, 3, 20, 100])
+def test_league_details_query_count_is_constant(db, db_connection, n_teams):
+    league_id = create_league(db, f"details-check-{os.getpid()}-{time.time_ns()}", n_teams)
+    # Sesión vacía: nada de lo sembrado sirve de caché
+    db.expunge_all()
+
+    statements: List[str] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_connection, "before_cursor_execute", on_execute)
+    try:
+        details = leagues_crud.get_league_with_details(db, league_id)
+    finally:
+        event.remove(db_connection, "before_cursor_execute", on_execute)
+
+    assert len(details["teams"]) == n_teams
+    assert len(statements) <= MAX_QUERIES, statements
@@ -0,0 +1,43 @@
+import numpy as np
+
+from app.services.simulation import TournamentSimulator, get_process_pool, shutdown_process_pool
+
+
+def test_project_season_counts_every_run_once():
+    projection = TournamentSimulator().project_season(
+        4, [0, 1, 2, 3], [1, 0, 3, 2], base_points=[9, 0, 3, 3], runs=500, seed=3
+    )
+
+    counts = projection["position_counts"]
+    assert projection["runs"] == 500
+    assert counts.shape == (4, 4)
+    # Cada temporada simulada reparte una posición a cada equipo
+    np.testing.assert_array_equal(counts.sum(axis=0), 500)
+    np.testing.assert_array_equal(counts.sum(axis=1), 500)
+    # Con dos partidos pendientes el líder (9 puntos) no puede caer del segundo puesto
+    assert counts[0, 2:].sum() == 0
+    assert (projection["points_sum"] >= 500 * np.array([9, 0, 3, 3])).all()
+
+
+def test_project_season_without_pending_matches_keeps_the_table():
+    projection = TournamentSimulator().project_season(
+        3, [], [], base_points=[1, 7, 4], base_goal_difference=[0, 2, 1], runs=10, seed=0
+    )
+
+    np.testing.assert_array_equal(projection["position_counts"], [[0, 0, 10], [10, 0, 0], [0, 10, 0]])
+
+
+def test_project_season_is_reproducible_across_workers_and_reuses_the_pool():
+    simulator = TournamentSimulator()
+    kwargs = dict(n_teams=4, home_idx=[0, 1, 2, 3, 0, 2], away_idx=[1, 0, 3, 2, 2, 0], runs=400, seed=11)
+
+    try:
+        first = simulator.project_season(workers=2, **kwargs)
+        pool = get_process_pool()
+        second = simulator.project_season(workers=2, **kwargs)
+
+        np.testing.assert_array_equal(first["position_counts"], second["position_counts"])
+        assert get_process_pool() is pool
+        assert first["position_counts"].sum() == 400 * 4
+    finally:
+        shutdown_process_pool()
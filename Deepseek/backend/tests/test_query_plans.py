@@ -0,0 +1,133 @@
+"""
+Planes de consulta de las consultas más frecuentes
+
+Siembra ligas, equipos, partidos y calendario con generate_series dentro de
+la transacción de `db_connection`, ejecuta ANALYZE y comprueba con EXPLAIN
+que ninguna consulta caliente (construida igual que en app/crud) recorre
+entera una tabla grande.
+"""
+import os
+import time
+from typing import Dict, Any, List, Tuple
+
+import pytest
+from sqlalchemy import select, or_, text
+from sqlalchemy.dialects import postgresql
+
+# Sin base de datos ni siquiera se pueden importar los módulos crud
+if not os.getenv("DATABASE_URL"):
+    pytest.skip("Necesita una base de datos PostgreSQL en DATABASE_URL", allow_module_level=True)
+
+from app.schemas.leagues import LeagueTeam
+from app.schemas.matches import Match
+from app.schemas.calendar import Calendar
+from app.crud.standings import played_matches_aggregate
+
+LEAGUES = 300
+TEAMS_PER_LEAGUE = 20
+
+# Tablas en las que un Seq Scan es una regresión
+LARGE_TABLES = {"matches", "calendar", "league_teams"}
+
+SEED_SQL = [
+    """
+    INSERT INTO teams (name)
+    SELECT :tag || ' team ' || g FROM generate_series(0, :leagues * :teams - 1) g
+    """,
+    """
+    INSERT INTO leagues (name, tipo_liga, max_teams, jornadas, active)
+    SELECT :tag || ' league ' || g, 'LIGA_TACTICA', :teams, 2 * (:teams - 1), true
+    FROM generate_series(0, :leagues - 1) g
+    """,
+    """
+    INSERT INTO league_teams (league_id, team_id)
+    SELECT :league_base + l, :team_base + l * :teams + k
+    FROM generate_series(0, :leagues - 1) l, generate_series(0, :teams - 1) k
+    """,
+    # Doble vuelta: la primera mitad de las jornadas ya está jugada
+    """
+    INSERT INTO matches (league_id, home_team_id, away_team_id, jornada, home_goals, away_goals)
+    SELECT
+        :league_base + l,
+        :team_base + l * :teams + a,
+        :team_base + l * :teams + b,
+        (a + b) % (2 * (:teams - 1)) + 1,
+        CASE WHEN (a + b) % (2 * (:teams - 1)) < :teams - 1 THEN (a * 7 + b) % 4 END,
+        CASE WHEN (a + b) % (2 * (:teams - 1)) < :teams - 1 THEN (a + b * 3) % 3 END
+    FROM generate_series(0, :leagues - 1) l,
+         generate_series(0, :teams - 1) a,
+         generate_series(0, :teams - 1) b
+    WHERE a <> b
+    """,
+    """
+    INSERT INTO calendar (league_id, jornada, match_id, is_played)
+    SELECT league_id, jornada, id, home_goals IS NOT NULL
+    FROM matches WHERE league_id >= :league_base
+    """,
+]
+
+
+def hot_queries(league_id: int, team_id: int, match_id: int) -> List[Tuple[str, Any]]:
+    """Consultas calientes, construidas igual que en los módulos crud"""
+    return [
+        ("matches_crud.get_league_matches (liga + jornada)",
+         select(Match).where(Match.league_id == league_id, Match.jornada == 3)),
+        ("teams_crud.get_team_matches (local OR visitante)",
+         select(Match).where(or_(Match.home_team_id == team_id, Match.away_team_id == team_id))),
+        ("leagues_crud.add_team_to_league (pertenencia)",
+         select(LeagueTeam).where(LeagueTeam.league_id == league_id, LeagueTeam.team_id == team_id).limit(1)),
+        ("calendar_crud.get_league_calendar (orden por jornada)",
+         select(Calendar).where(Calendar.league_id == league_id).order_by(Calendar.jornada)),
+        ("calendar_crud.get_calendar_entry_by_match",
+         select(Calendar).where(Calendar.match_id == match_id)),
+        ("standings_crud.played_matches_aggregate (partidos jugados de la liga)",
+         played_matches_aggregate(Match.league_id == league_id)),
+    ]
+
+
+HOT_QUERY_NAMES = [name for name, _ in hot_queries(0, 0, 0)]
+
+
+def plan_nodes(plan: Dict[str, Any]):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def explain(connection, statement) -> Dict[str, Any]:
+    sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    return connection.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()[0]["Plan"]
+
+
+@pytest.fixture(scope="module")
+def seeded_queries(db_connection):
+    """Siembra los datos y devuelve las consultas calientes sobre una liga del medio"""
+    params = {"tag": f"plan-check-{os.getpid()}-{time.time_ns()}", "leagues": LEAGUES, "teams": TEAMS_PER_LEAGUE}
+    for i, sql in enumerate(SEED_SQL):
+        db_connection.execute(text(sql), params)
+        if i == 0:
+            params["team_base"] = db_connection.execute(
+                text("SELECT min(id) FROM teams WHERE name LIKE :tag || ' team %'"), params
+            ).scalar()
+        elif i == 1:
+            params["league_base"] = db_connection.execute(
+                text("SELECT min(id) FROM leagues WHERE name LIKE :tag || ' league %'"), params
+            ).scalar()
+    for table in ("teams", "leagues", "league_teams", "matches", "calendar"):
+        db_connection.execute(text(f"ANALYZE {table}"))
+
+    league_id = params["league_base"] + LEAGUES // 2
+    team_id = params["team_base"] + (LEAGUES // 2) * TEAMS_PER_LEAGUE + 1
+    match_id = db_connection.execute(select(Match.id).where(Match.league_id == league_id).limit(1)).scalar()
+    return dict(hot_queries(league_id, team_id, match_id))
+
+
+@pytest.mark.parametrize("name", HOT_QUERY_NAMES)
+def test_hot_query_avoids_seq_scan_on_large_tables(db_connection, seeded_queries, name):
+    plan = explain(db_connection, seeded_queries[name])
+
+    seq_scans = sorted({
+        node["Relation Name"] for node in plan_nodes(plan)
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in LARGE_TABLES
+    })
+    assert not seq_scans, f"Seq Scan en {', '.join(seq_scans)}"
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from app.services.simulation import MatchSimulator, parse_team_value, value_strengths
+
+
+def test_simulate_matches_batch_invariants():
+    simulator = MatchSimulator(rng=np.random.default_rng(0))
+    n = 5000
+    home = np.arange(n) % 10
+    away = (np.arange(n) + 1) % 10
+
+    result = simulator.simulate_matches_batch(home, away, strengths=np.linspace(0.8, 1.3, 10))
+
+    assert len(result) == n
+    np.testing.assert_array_equal(result.home_possession + result.away_possession, 100)
+    assert result.home_possession.min() >= 30 and result.home_possession.max() <= 70
+    assert result.home_shots.min() >= 1 and result.away_shots.min() >= 1
+    assert (result.home_goals >= 0).all() and (result.away_goals >= 0).all()
+    assert (result.home_goals <= result.home_shots).all()
+
+    row = result.row(3)
+    assert row["home_team"] == 3 and row["away_team"] == 4
+    assert set(row) == {"home_team", "away_team", *result.COLUMNS}
+
+
+def test_simulate_matches_batch_is_reproducible_and_accepts_strength_mappings():
+    home, away = ["A", "B", "C"] * 100, ["B", "C", "A"] * 100
+    strengths = {"A": 1.4, "B": 1.0, "C": 0.7}
+
+    first = MatchSimulator().simulate_matches_batch(home, away, strengths, rng=np.random.default_rng(42))
+    second = MatchSimulator().simulate_matches_batch(home, away, strengths, rng=np.random.default_rng(42))
+
+    for column in first.COLUMNS:
+        np.testing.assert_array_equal(getattr(first, column), getattr(second, column))
+
+
+def test_simulate_matches_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        MatchSimulator().simulate_matches_batch([0, 1], [1])
+
+
+def test_score_distribution_is_normalised():
+    distribution = MatchSimulator().score_distribution([0, 1, 2], [1, 2, 0], strengths=[1.5, 1.0, 0.6])
+
+    np.testing.assert_allclose(distribution["score_matrix"].sum(axis=(1, 2)), 1.0)
+    np.testing.assert_allclose(
+        distribution["p_home_win"] + distribution["p_draw"] + distribution["p_away_win"], 1.0
+    )
+    # El equipo más fuerte gana más a menudo
+    assert distribution["p_home_win"][0] > distribution["p_away_win"][0]
+    assert distribution["p_home_win"][1] > distribution["p_home_win"][2]
+
+
+def test_score_distribution_matches_batch_simulation():
+    strengths = [1.3, 0.9]
+    n = 200_000
+    simulator = MatchSimulator(rng=np.random.default_rng(7))
+
+    distribution = simulator.score_distribution([0], [1], strengths=strengths)
+    sample = simulator.simulate_matches_batch(np.zeros(n, dtype=np.int64), np.ones(n, dtype=np.int64), strengths)
+
+    assert np.mean(sample.home_goals > sample.away_goals) == pytest.approx(distribution["p_home_win"][0], abs=0.01)
+    assert np.mean(sample.home_goals == sample.away_goals) == pytest.approx(distribution["p_draw"][0], abs=0.01)
+    assert sample.home_goals.mean() == pytest.approx(distribution["expected_home_goals"][0], abs=0.02)
+    assert sample.away_goals.mean() == pytest.approx(distribution["expected_away_goals"][0], abs=0.02)
+
+
+def test_value_strengths_follow_market_value():
+    strengths = value_strengths(["10,0M", "30,0M", None, "20,0M", "500K"])
+
+    np.testing.assert_allclose(strengths, [1.3 - 0.6 * 20 / 29.5, 1.3, 1.0, 1.3 - 0.6 * 10 / 29.5, 0.7])
+    np.testing.assert_array_equal(value_strengths(["5M", "5M"]), [1.0, 1.0])
+    assert parse_team_value("30,3M") == pytest.approx(30_300_000)
+    assert parse_team_value("n/a") == 0
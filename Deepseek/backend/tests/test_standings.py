@@ -0,0 +1,53 @@
+import numpy as np
+
+from app.services.standings import compute_standings, rank_standings, standings_from_results
+
+
+def test_compute_standings_single_table():
+    # 0-1: 2-1, 1-2: 0-0, 2-0: 3-1
+    standings = compute_standings(3, [0, 1, 2], [1, 2, 0], [2, 0, 3], [1, 0, 1])
+
+    np.testing.assert_array_equal(standings.played, [2, 2, 2])
+    np.testing.assert_array_equal(standings.won, [1, 0, 1])
+    np.testing.assert_array_equal(standings.drawn, [0, 1, 1])
+    np.testing.assert_array_equal(standings.lost, [1, 1, 0])
+    np.testing.assert_array_equal(standings.goals_for, [3, 1, 3])
+    np.testing.assert_array_equal(standings.goals_against, [4, 2, 1])
+    np.testing.assert_array_equal(standings.points, [3, 1, 4])
+    np.testing.assert_array_equal(standings.ranking(), [2, 0, 1])
+
+
+def test_compute_standings_batch_matches_each_season():
+    rng = np.random.default_rng(3)
+    home_idx, away_idx = [0, 1, 2, 3, 0, 2], [1, 0, 3, 2, 2, 1]
+    home_goals = rng.integers(0, 5, (4, 6))
+    away_goals = rng.integers(0, 5, (4, 6))
+
+    batch = compute_standings(4, home_idx, away_idx, home_goals, away_goals)
+
+    assert batch.points.shape == (4, 4)
+    for run in range(4):
+        single = compute_standings(4, home_idx, away_idx, home_goals[run], away_goals[run])
+        np.testing.assert_array_equal(batch.points[run], single.points)
+        np.testing.assert_array_equal(batch.goal_difference[run], single.goal_difference)
+        np.testing.assert_array_equal(batch.ranking()[run], single.ranking())
+
+
+def test_rank_standings_tiebreakers():
+    points = np.array([6, 6, 6, 6, 3])
+    goal_difference = np.array([1, 3, 3, 3, 5])
+    goals_for = np.array([9, 4, 6, 6, 9])
+
+    # Puntos, diferencia y goles a favor; el empate completo (2 y 3) mantiene el orden de índice
+    np.testing.assert_array_equal(rank_standings(points, goal_difference, goals_for), [2, 3, 1, 0, 4])
+    # Con desempate explícito (ascendente) el 3 pasa por delante del 2
+    tiebreak = np.array([0, 0, 1, 0, 0])
+    np.testing.assert_array_equal(rank_standings(points, goal_difference, goals_for, tiebreak), [3, 2, 1, 0, 4])
+
+
+def test_standings_from_results_skips_unknown_teams():
+    standings = standings_from_results(["a", "b"], [("a", "b", 1, 0), ("a", "x", 5, 0)])
+
+    assert list(standings) == ["a", "b"]
+    assert standings["a"]["goals_for"] == 1
+    assert standings["a"]["points"] == 3
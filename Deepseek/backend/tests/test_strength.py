@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from app.services.strength import PoissonStrengthModel, StrengthModelCache
+
+
+def round_robin(n_teams):
+    """Doble round robin como listas de índices local/visitante"""
+    pairs = [(home, away) for home in range(n_teams) for away in range(n_teams) if home != away]
+    return [home for home, _ in pairs], [away for _, away in pairs]
+
+
+def assert_finite(model):
+    assert np.isfinite(model.attack).all()
+    assert np.isfinite(model.defence).all()
+    assert np.isfinite(model.home_advantage)
+    assert np.isfinite(model.rho)
+
+
+def test_fit_all_goalless_league_is_finite():
+    home_idx, away_idx = round_robin(4)
+    zeros = [0] * len(home_idx)
+
+    model = PoissonStrengthModel(4).fit(home_idx, away_idx, zeros, zeros)
+
+    assert_finite(model)
+    distribution = model.score_distribution(home_idx, away_idx)
+    for values in distribution.values():
+        assert np.isfinite(values).all()
+    np.testing.assert_allclose(distribution["score_matrix"].sum(axis=(1, 2)), 1.0)
+    # Sin goles el marcador más probable es 0-0
+    assert (distribution["p_draw"] > 0.5).all()
+
+    home_goals, away_goals = model.sample_goals(home_idx, away_idx, np.random.default_rng(0))
+    assert home_goals.shape == away_goals.shape == (len(home_idx),)
+
+
+def test_fit_team_that_never_scored():
+    home_idx, away_idx = round_robin(4)
+    rng = np.random.default_rng(1)
+    home_goals = rng.integers(1, 4, len(home_idx))
+    away_goals = rng.integers(1, 4, len(home_idx))
+    home_goals[np.asarray(home_idx) == 0] = 0
+    away_goals[np.asarray(away_idx) == 0] = 0
+
+    model = PoissonStrengthModel(4).fit(home_idx, away_idx, home_goals, away_goals)
+
+    assert_finite(model)
+    assert model.attack[0] > 0
+    assert model.attack[0] == model.attack.min()
+    assert np.isfinite(model.score_distribution([0], [1])["p_home_win"]).all()
+
+
+def test_fit_recovers_strength_ordering():
+    n_teams = 6
+    home_idx, away_idx = round_robin(n_teams)
+    home_idx, away_idx = home_idx * 20, away_idx * 20
+    attack = np.linspace(0.6, 1.8, n_teams)
+    rng = np.random.default_rng(2)
+    home_goals = rng.poisson(1.2 * attack[home_idx])
+    away_goals = rng.poisson(attack[away_idx])
+
+    model = PoissonStrengthModel(n_teams).fit(home_idx, away_idx, home_goals, away_goals)
+
+    assert list(np.argsort(model.attack)) == list(range(n_teams))
+    assert model.home_advantage == pytest.approx(1.2, rel=0.15)
+
+
+def test_cache_refits_corrected_result_into_a_new_model():
+    cache = StrengthModelCache()
+    home_idx, away_idx = round_robin(3)
+    home_goals = [2, 1, 0, 3, 1, 1]
+    away_goals = [0, 1, 2, 1, 0, 2]
+
+    first = cache.get(7, [10, 11, 12], home_idx, away_idx, home_goals, away_goals)
+    attack = first.attack.copy()
+    assert cache.get(7, [10, 11, 12], home_idx, away_idx, home_goals, away_goals) is first
+
+    # Mismo número de partidos, un marcador corregido
+    corrected = list(home_goals)
+    corrected[0] = 5
+    second = cache.get(7, [10, 11, 12], home_idx, away_idx, corrected, away_goals)
+
+    assert second is not first
+    np.testing.assert_array_equal(first.attack, attack)
+    assert second.attack[0] > first.attack[0]